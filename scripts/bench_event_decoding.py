@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Microbenchmark for decoding att_events rows.
+
+Compares the validated Pydantic construction the store used to do against the
+current `model_construct` path and undecoded `EventRecord` rows, both for
+decoding alone and for decoding plus re-serializing to JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from att.api.schemas.events import EventResponse
+from att.db.store import EventRecord, SQLiteStore
+from att.db.timestamps import from_epoch_micros
+from att.models.events import ATTEvent, EventType
+
+EVENT_TYPES = tuple(EventType)
+
+
+def _validated_event(row: sqlite3.Row) -> ATTEvent:
+    return ATTEvent(
+        id=str(row["id"]),
+        project_id=str(row["project_id"]),
+        event_type=EventType(str(row["event_type"])),
+        payload=json.loads(str(row["payload"])),
+        timestamp=from_epoch_micros(int(row["timestamp"])),
+    )
+
+
+def _record(row: sqlite3.Row) -> EventRecord:
+    return EventRecord(
+        id=row["id"],
+        project_id=row["project_id"],
+        event_type=row["event_type"],
+        payload=row["payload"],
+        timestamp=row["timestamp"],
+    )
+
+
+def _response_json(event: ATTEvent) -> str:
+    return EventResponse(
+        id=event.id,
+        project_id=event.project_id,
+        event_type=event.event_type.value,
+        payload=event.payload,
+        timestamp=event.timestamp,
+    ).model_dump_json()
+
+
+CASES: dict[str, Callable[[sqlite3.Row], Any]] = {
+    "decode: validated model": _validated_event,
+    "decode: model_construct": SQLiteStore._event_from_row,
+    "decode: EventRecord": _record,
+    "decode+json: validated model": lambda row: _response_json(_validated_event(row)),
+    "decode+json: model_construct": lambda row: _response_json(SQLiteStore._event_from_row(row)),
+    "decode+json: EventRecord": lambda row: _record(row).to_json(),
+}
+
+
+async def _seed(db_path: Path, count: int) -> None:
+    store = SQLiteStore(db_path)
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    batch: list[ATTEvent] = []
+    for index in range(count):
+        batch.append(
+            ATTEvent(
+                project_id=f"p{index % 10}",
+                event_type=EVENT_TYPES[index % len(EVENT_TYPES)],
+                payload={"index": index, "suite": "unit", "ok": index % 3 == 0},
+                timestamp=start + timedelta(seconds=index),
+            )
+        )
+        if len(batch) == 5000:
+            await store.append_events(batch)
+            batch = []
+    await store.append_events(batch)
+    await store.close()
+
+
+def _load_rows(db_path: Path) -> list[sqlite3.Row]:
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        return conn.execute("SELECT * FROM att_events ORDER BY timestamp, id").fetchall()
+    finally:
+        conn.close()
+
+
+def run(count: int, repeat: int) -> dict[str, float]:
+    """Return the best rows-per-second figure for each case."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        asyncio.run(_seed(db_path, count))
+        rows = _load_rows(db_path)
+
+    results: dict[str, float] = {}
+    for name, decode in CASES.items():
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for row in rows:
+                decode(row)
+            best = min(best, time.perf_counter() - started)
+        results[name] = len(rows) / best if best > 0 else float("inf")
+    return results
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark att_events row decoding")
+    parser.add_argument("--events", type=int, default=100_000, help="Rows to decode")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; best is kept")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    results = run(max(1, args.events), max(1, args.repeat))
+    width = max(len(name) for name in results)
+    for name, rows_per_second in results.items():
+        sys.stdout.write(f"{name:<{width}}  {rows_per_second:>12,.0f} rows/s\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import uvicorn
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI
 
+from att.api.container import AppContainer
 from att.api.routes.code import router as code_router
 from att.api.routes.debug import router as debug_router
 from att.api.routes.deploy import router as deploy_router
+from att.api.routes.events import global_router as events_global_router
+from att.api.routes.events import live_router as events_live_router
 from att.api.routes.events import router as events_router
 from att.api.routes.git import router as git_router
 from att.api.routes.mcp import router as mcp_router
@@ -17,10 +24,30 @@ from att.api.routes.runtime import router as runtime_router
 from att.api.routes.self_bootstrap import router as self_bootstrap_router
 from att.api.routes.tests import router as tests_router
 from att.api.routes.workflows import router as workflows_router
+from att.core.event_retention import RetentionPolicy
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build and start the app container on startup; close it on shutdown.
 
+    A container built here takes its event retention policy from the environment.
+    """
+    container: AppContainer | None = getattr(app.state, "container", None)
+    if container is None:
+        container = AppContainer(retention_policy=RetentionPolicy.from_env(os.environ))
+        app.state.container = container
+    await container.start()
+    try:
+        yield
+    finally:
+        await container.close()
 
-def create_app() -> FastAPI:
-    app = FastAPI(title="ATT API", version="0.1.0")
+
+def create_app(container: AppContainer | None = None) -> FastAPI:
+    app = FastAPI(title="ATT API", version="0.1.0", lifespan=lifespan)
+    if container is not None:
+        app.state.container = container
     app.include_router(projects_router)
     app.include_router(code_router)
     app.include_router(git_router)
@@ -28,6 +55,8 @@ def create_app() -> FastAPI:
     app.include_router(self_bootstrap_router)
     app.include_router(tests_router)
     app.include_router(events_router)
+    app.include_router(events_global_router)
+    app.include_router(events_live_router)
     app.include_router(workflows_router)
     app.include_router(debug_router)
     app.include_router(deploy_router)
@@ -46,16 +75,6 @@ def create_app() -> FastAPI:
             "endpoint": "/mcp",
         }
 
-    @app.websocket("/api/v1/projects/{project_id}/ws")
-    async def project_events(project_id: str, websocket: WebSocket) -> None:
-        await websocket.accept()
-        try:
-            while True:
-                message = await websocket.receive_text()
-                await websocket.send_text(f"{project_id}:{message}")
-        except WebSocketDisconnect:
-            return
-
     return app
 
 
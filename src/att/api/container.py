@@ -0,0 +1,256 @@
+"""Application-scoped service container for the ATT API."""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Literal
+
+from att.core.code_manager import CodeManager
+from att.core.code_search import CodeSearchIndex
+from att.core.debug_manager import DebugManager
+from att.core.deploy_manager import DeployManager
+from att.core.event_bus import EventBus
+from att.core.event_retention import EventRetentionManager, RetentionPolicy
+from att.core.git_manager import GitManager
+from att.core.process import run_process
+from att.core.project_manager import ProjectManager
+from att.core.runtime_manager import RuntimeManager
+from att.core.self_bootstrap_integrations import parse_gh_actions_status
+from att.core.self_bootstrap_manager import (
+    ReleaseMetadata,
+    ReleaseSourceContext,
+    RestartWatchdogSignal,
+    SelfBootstrapManager,
+)
+from att.core.test_run_manager import TestRunManager
+from att.core.test_runner import TestRunner
+from att.core.tool_orchestrator import ToolOrchestrator
+from att.db.store import EventBufferPolicy, SQLiteStore
+from att.mcp.client import MCPClientManager, create_nat_mcp_transport_adapter
+
+APP_DB_PATH = Path(".att/att.db")
+SEARCH_INDEX_DIR = "search_index"
+_RELEASE_LOG_FIELD_PATTERN = re.compile(
+    r"\b(?P<key>release_id|previous_release_id)\s*[=:]\s*(?P<value>[A-Za-z0-9][A-Za-z0-9._:/-]*)"
+)
+
+
+class AppContainer:
+    """Services shared by every request, built once per application.
+
+    The FastAPI lifespan calls `start` and `close`; the container owns the
+    SQLite pool, the retention job, queued test runs and MCP adapter sessions.
+    """
+
+    def __init__(
+        self,
+        *,
+        db_path: Path = APP_DB_PATH,
+        retention_policy: RetentionPolicy | None = None,
+        event_buffer: EventBufferPolicy | None = None,
+    ) -> None:
+        self.event_bus = EventBus()
+        # Events are committed before `append_event` returns unless an
+        # `event_buffer` is given; buffered events are lost on a crash.
+        self.store = SQLiteStore(
+            db_path=db_path,
+            event_buffer=event_buffer,
+            event_listeners=(self.event_bus.publish,),
+        )
+        # Raw events are kept forever unless a retention policy is configured.
+        self.event_retention_manager = EventRetentionManager(
+            self.store,
+            retention_policy or RetentionPolicy(),
+        )
+        self.project_manager = ProjectManager(store=self.store)
+        self.runtime_manager = RuntimeManager()
+        # Search indexes live beside the app database, never inside a project.
+        self.code_manager = CodeManager(
+            search_index=CodeSearchIndex(index_dir=db_path.parent / SEARCH_INDEX_DIR),
+        )
+        self.git_manager = GitManager()
+        self.test_runner = TestRunner()
+        self.test_run_manager = TestRunManager(self.store, self.test_runner)
+        self.debug_manager = DebugManager()
+        self.deploy_manager = DeployManager(self.runtime_manager)
+        self.mcp_client_manager = MCPClientManager(
+            transport_adapter=create_nat_mcp_transport_adapter(),
+        )
+        self.tool_orchestrator = ToolOrchestrator(
+            code_manager=self.code_manager,
+            git_manager=self.git_manager,
+            test_runner=self.test_runner,
+            store=self.store,
+        )
+        self.self_bootstrap_manager = build_self_bootstrap_manager(
+            store=self.store,
+            projects=self.project_manager,
+            git=self.git_manager,
+            deploy=self.deploy_manager,
+            runtime=self.runtime_manager,
+            orchestrator=self.tool_orchestrator,
+        )
+        self.debug_logs: dict[str, list[str]] = {}
+        self._started = False
+
+    @property
+    def started(self) -> bool:
+        return self._started
+
+    async def start(self) -> None:
+        await self.store.open()
+        await self.test_run_manager.start()
+        self.event_retention_manager.start()
+        self._started = True
+
+    async def close(self) -> None:
+        self._started = False
+        await self.event_retention_manager.stop()
+        await self.test_run_manager.close()
+        await self.mcp_client_manager.close()
+        self.code_manager.close()
+        await self.store.close()
+
+
+def build_self_bootstrap_manager(
+    *,
+    store: SQLiteStore,
+    projects: ProjectManager,
+    git: GitManager,
+    deploy: DeployManager,
+    runtime: RuntimeManager,
+    orchestrator: ToolOrchestrator,
+) -> SelfBootstrapManager:
+    """Wire the self-bootstrap manager to the app's git, CI, deploy and runtime hooks."""
+
+    async def ci_checker(
+        project_id: str,
+        branch_name: str,
+    ) -> Literal["pending", "success", "failure"]:
+        project = await projects.get(project_id)
+        if project is None:
+            return "failure"
+        try:
+            actions = await git.actions(project.path)
+        except RuntimeError:
+            return "pending"
+        return parse_gh_actions_status(actions.output, branch_name)
+
+    async def pr_creator(project_id: str, branch_name: str) -> str:
+        project = await projects.get(project_id)
+        if project is None:
+            msg = f"Project not found: {project_id}"
+            raise RuntimeError(msg)
+        result = await git.pr_create(
+            project.path,
+            title=f"ATT self-bootstrap: {branch_name}",
+            body="Automated self-bootstrap update generated by ATT.",
+            base="dev",
+            head=branch_name,
+        )
+        return result.output
+
+    async def pr_merger(project_id: str, pull_request: str) -> bool:
+        project = await projects.get(project_id)
+        if project is None:
+            return False
+        try:
+            await git.pr_merge(project.path, pull_request=pull_request, strategy="squash")
+        except RuntimeError:
+            return False
+        return True
+
+    async def deployer(project_id: str, target: str) -> bool:
+        del target
+        project = await projects.get(project_id)
+        if project is None or project.nat_config_path is None:
+            return False
+        config_path = (
+            project.nat_config_path
+            if project.nat_config_path.is_absolute()
+            else project.path / project.nat_config_path
+        )
+        status = deploy.run(project.path, config_path)
+        return status.running
+
+    async def restart_watchdog(project_id: str, target: str) -> RestartWatchdogSignal:
+        del project_id
+        probe_target = target if target.startswith(("http://", "https://")) else None
+        probe = runtime.probe_health(url=probe_target)
+        return RestartWatchdogSignal(
+            stable=probe.healthy,
+            reason=probe.reason,
+            probe=probe.probe,
+        )
+
+    async def rollback_executor(project_id: str, target: str, release_id: str | None) -> bool:
+        del project_id, target, release_id
+        runtime.stop()
+        return True
+
+    async def runtime_release_metadata_adapter(
+        context: ReleaseSourceContext,
+    ) -> ReleaseMetadata | None:
+        log_lines = runtime.logs(limit=200)
+        current_release: str | None = None
+        previous_release: str | None = None
+        for line in reversed(log_lines):
+            for match in _RELEASE_LOG_FIELD_PATTERN.finditer(line):
+                key = match.group("key")
+                value = match.group("value")
+                if key == "release_id" and current_release is None:
+                    current_release = value
+                if key == "previous_release_id" and previous_release is None:
+                    previous_release = value
+            if current_release is not None and previous_release is not None:
+                break
+        if current_release is None:
+            return None
+        return ReleaseMetadata(
+            current_release_id=current_release,
+            previous_release_id=previous_release,
+            source="runtime_logs",
+        )
+
+    async def git_release_metadata_adapter(
+        context: ReleaseSourceContext,
+    ) -> ReleaseMetadata | None:
+        project_path = context.project_path
+
+        async def _git_rev_parse(revision: str) -> str | None:
+            completed = await run_process(
+                ["git", "rev-parse", revision],
+                cwd=project_path,
+                timeout_seconds=30.0,
+            )
+            if completed.returncode != 0:
+                return None
+            value = completed.stdout.strip()
+            return value or None
+
+        current_release = await _git_rev_parse("HEAD")
+        if current_release is None:
+            return None
+        previous_release = await _git_rev_parse("HEAD^")
+        return ReleaseMetadata(
+            current_release_id=current_release,
+            previous_release_id=previous_release,
+            source="git",
+        )
+
+    return SelfBootstrapManager(
+        git_manager=git,
+        orchestrator=orchestrator,
+        store=store,
+        ci_checker=ci_checker,
+        pr_creator=pr_creator,
+        pr_merger=pr_merger,
+        deployer=deployer,
+        restart_watchdog=restart_watchdog,
+        rollback_executor=rollback_executor,
+        release_source_adapters=(
+            runtime_release_metadata_adapter,
+            git_release_metadata_adapter,
+        ),
+    )
@@ -2,40 +2,138 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 from att.api.deps import get_code_manager, get_project_manager
 from att.api.routes.common import require_project
-from att.api.schemas.code import SearchRequest, WriteFileRequest
+from att.api.schemas.code import (
+    FileListResponse,
+    SearchRequest,
+    SearchResponse,
+    SearchResult,
+    WriteFileRequest,
+)
 from att.core.code_manager import CodeManager
+from att.core.file_index import FileFilter
 from att.core.project_manager import ProjectManager
 
 router = APIRouter(prefix="/api/v1/projects/{project_id}/files", tags=["code"])
 
+MAX_FILE_PAGE_SIZE = 10_000
+STREAM_BATCH_SIZE = 1000
+
 
-@router.get("")
+@router.get("", response_model=FileListResponse)
 async def list_files(
     project_id: str,
+    cursor: int = Query(default=0, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=MAX_FILE_PAGE_SIZE),
+    max_bytes: int | None = Query(default=None, ge=0),
+    skip_binary: bool = False,
+    manager: ProjectManager = Depends(get_project_manager),
+    code: CodeManager = Depends(get_code_manager),
+) -> FileListResponse:
+    """List project files, all at once or a page at a time."""
+    project = await require_project(project_id, manager)
+    page = await asyncio.to_thread(
+        code.list_page,
+        project.path,
+        cursor=cursor,
+        limit=limit,
+        file_filter=_file_filter(max_bytes, skip_binary),
+    )
+    return FileListResponse(
+        files=page.files,
+        cursor=page.cursor,
+        next_cursor=page.next_cursor,
+        total=page.total,
+    )
+
+
+@router.get("/stream")
+async def stream_files(
+    project_id: str,
+    max_bytes: int | None = Query(default=None, ge=0),
+    skip_binary: bool = False,
     manager: ProjectManager = Depends(get_project_manager),
     code: CodeManager = Depends(get_code_manager),
-) -> dict[str, list[str]]:
+) -> StreamingResponse:
+    """Stream project files as newline-delimited JSON, one `{"path": ...}` per line."""
     project = await require_project(project_id, manager)
-    files = [str(path.relative_to(project.path)) for path in code.list_files(project.path)]
-    return {"files": files}
+    return StreamingResponse(
+        file_list_lines(code, project.path, _file_filter(max_bytes, skip_binary)),
+        media_type="application/x-ndjson",
+    )
+
+
+async def file_list_lines(
+    code: CodeManager,
+    project_path: Path,
+    file_filter: FileFilter | None,
+) -> AsyncIterator[str]:
+    """Yield NDJSON lines page by page; filtering runs off the event loop."""
+    cursor: int | None = 0
+    while cursor is not None:
+        page = await asyncio.to_thread(
+            code.list_page,
+            project_path,
+            cursor=cursor,
+            limit=STREAM_BATCH_SIZE,
+            file_filter=file_filter,
+        )
+        if page.files:
+            yield "".join(f"{json.dumps({'path': path})}\n" for path in page.files)
+        cursor = page.next_cursor
+
+
+def _file_filter(max_bytes: int | None, skip_binary: bool) -> FileFilter | None:
+    if max_bytes is None and not skip_binary:
+        return None
+    return FileFilter(max_bytes=max_bytes, skip_binary=skip_binary)
 
 
-@router.post("/search")
+@router.post("/search", response_model=SearchResponse)
 async def search_files(
     project_id: str,
     request: SearchRequest,
     manager: ProjectManager = Depends(get_project_manager),
     code: CodeManager = Depends(get_code_manager),
-) -> dict[str, list[str]]:
+) -> SearchResponse:
+    """Search file contents; `results` is capped at `max_results` lines."""
     project = await require_project(project_id, manager)
-    matches = [
-        str(path.relative_to(project.path)) for path in code.search(project.path, request.pattern)
-    ]
-    return {"matches": matches}
+    try:
+        matches = await asyncio.to_thread(
+            code.search_lines,
+            project.path,
+            request.pattern,
+            regex=request.regex,
+            ignore_case=request.ignore_case,
+            # One extra line tells whether the results were cut off.
+            max_matches=request.max_results + 1,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    truncated = len(matches) > request.max_results
+    matches = matches[: request.max_results]
+    return SearchResponse(
+        matches=list(dict.fromkeys(match.path for match in matches)),
+        results=[
+            SearchResult(
+                path=match.path,
+                line=match.line,
+                column=match.column,
+                snippet=match.snippet,
+            )
+            for match in matches
+        ],
+        truncated=truncated,
+    )
 
 
 @router.get("/diff")
@@ -72,5 +170,5 @@ async def write_file(
     code: CodeManager = Depends(get_code_manager),
 ) -> dict[str, str]:
     project = await require_project(project_id, manager)
-    code.write_file(project.path, file_path, request.content)
+    await asyncio.to_thread(code.write_file, project.path, file_path, request.content)
     return {"status": "updated"}
@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
-from fastapi import HTTPException, status
+import asyncio
+import contextlib
+from collections.abc import Coroutine
+from typing import Any
+
+from fastapi import HTTPException, Request, status
 
 from att.core.project_manager import ProjectManager
+from att.core.test_runner import TestResultPayload
 from att.models.project import Project
+from att.models.test_run import TestRun
+
+DISCONNECT_POLL_SECONDS = 0.5
+HTTP_499_CLIENT_CLOSED_REQUEST = 499
 
 
 async def require_project(project_id: str, manager: ProjectManager) -> Project:
@@ -14,3 +24,37 @@ async def require_project(project_id: str, manager: ProjectManager) -> Project:
     if project is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
     return project
+
+
+async def run_until_disconnect(
+    request: Request,
+    run: Coroutine[Any, Any, TestRun],
+) -> TestRun:
+    """Await a test run, cancelling it (and its subprocesses) if the client goes away."""
+    task = asyncio.ensure_future(run)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_SECONDS)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                break
+    finally:
+        if not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+    raise HTTPException(
+        status_code=HTTP_499_CLIENT_CLOSED_REQUEST,
+        detail="Client disconnected",
+    )
+
+
+def run_result_payload(run: TestRun) -> TestResultPayload:
+    """Return a finished run's result, or its status when it produced none."""
+    if run.result is not None:
+        return {**run.result, "run_id": run.id, "status": run.status.value}
+    payload: TestResultPayload = {"run_id": run.id, "status": run.status.value}
+    if run.error is not None:
+        payload["error"] = run.error
+    return payload
@@ -2,18 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
 
-from att.api.deps import get_project_manager, get_store
+from att.api.deps import get_event_bus, get_project_manager, get_store
 from att.api.routes.common import require_project
-from att.api.schemas.events import EventResponse, EventsResponse
+from att.api.schemas.events import (
+    EventAggregateItem,
+    EventAggregateResponse,
+    EventResponse,
+    EventsResponse,
+)
+from att.core.event_bus import EventBus, EventSubscription
 from att.core.project_manager import ProjectManager
-from att.db.store import SQLiteStore
-from att.models.events import EventType
+from att.db.store import EventBucket, EventGroupField, SQLiteStore, decode_event_cursor
+from att.models.events import ATTEvent, EventType
 
 router = APIRouter(prefix="/api/v1/projects/{project_id}/events", tags=["events"])
+global_router = APIRouter(prefix="/api/v1/events", tags=["events"])
+live_router = APIRouter(prefix="/api/v1/projects/{project_id}", tags=["events"])
+
+MAX_EVENTS_PAGE_SIZE = 1000
+SSE_KEEPALIVE_SECONDS = 15.0
 
 
 @router.get("", response_model=EventsResponse)
@@ -22,35 +47,274 @@ async def list_project_events(
     event_type: str | None = None,
     since: datetime | None = Query(default=None),
     until: datetime | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=MAX_EVENTS_PAGE_SIZE),
     manager: ProjectManager = Depends(get_project_manager),
     store: SQLiteStore = Depends(get_store),
 ) -> EventsResponse:
     await require_project(project_id, manager)
+    parsed_event_type = _parse_event_type(event_type)
 
-    parsed_event_type: EventType | None = None
-    if event_type is not None:
+    next_cursor: str | None = None
+    try:
+        if limit is None:
+            events = await store.list_events(
+                project_id=project_id,
+                event_type=parsed_event_type,
+                since=since,
+                until=until,
+                cursor=cursor,
+            )
+        else:
+            page = await store.list_events_page(
+                project_id=project_id,
+                event_type=parsed_event_type,
+                since=since,
+                until=until,
+                cursor=cursor,
+                limit=limit,
+            )
+            events = page.items
+            next_cursor = page.next_cursor
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    return EventsResponse(
+        items=[_event_response(event) for event in events],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/stream")
+async def stream_project_events(
+    project_id: str,
+    event_type: str | None = None,
+    since: datetime | None = Query(default=None),
+    until: datetime | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    manager: ProjectManager = Depends(get_project_manager),
+    store: SQLiteStore = Depends(get_store),
+) -> StreamingResponse:
+    """Stream matching events as NDJSON, one event per line."""
+    await require_project(project_id, manager)
+    parsed_event_type = _parse_event_type(event_type)
+    if cursor is not None:
         try:
-            parsed_event_type = EventType(event_type)
+            decode_event_cursor(cursor)
         except ValueError as exc:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid event_type",
+                detail=str(exc),
             ) from exc
 
-    events = await store.list_events(
+    async def lines() -> AsyncIterator[str]:
+        async for record in store.iter_event_records(
+            project_id=project_id,
+            event_type=parsed_event_type,
+            since=since,
+            until=until,
+            cursor=cursor,
+        ):
+            yield record.to_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get("/live")
+async def live_project_events(
+    project_id: str,
+    event_type: list[str] | None = Query(default=None),
+    manager: ProjectManager = Depends(get_project_manager),
+    bus: EventBus = Depends(get_event_bus),
+) -> StreamingResponse:
+    """Push newly persisted events as server-sent events."""
+    await require_project(project_id, manager)
+    subscription = bus.subscribe(project_id, _parse_event_types(event_type or ()))
+    return StreamingResponse(
+        sse_messages(bus, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@live_router.websocket("/ws")
+async def project_event_socket(
+    project_id: str,
+    websocket: WebSocket,
+    event_type: list[str] | None = Query(default=None),
+    manager: ProjectManager = Depends(get_project_manager),
+    bus: EventBus = Depends(get_event_bus),
+) -> None:
+    """Push newly persisted events for a project over a WebSocket."""
+    try:
+        event_types = [EventType(value) for value in event_type or ()]
+    except ValueError:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Invalid event_type")
+        return
+    if await manager.get(project_id) is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Project not found")
+        return
+
+    await websocket.accept()
+    subscription = bus.subscribe(project_id, event_types)
+    # Client messages are ignored; reading them is how a disconnect is noticed.
+    disconnected = asyncio.create_task(_wait_for_disconnect(websocket))
+    try:
+        while True:
+            next_event = asyncio.create_task(subscription.get())
+            done, _ = await asyncio.wait(
+                {next_event, disconnected},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if disconnected in done:
+                next_event.cancel()
+                return
+            dropped = subscription.take_dropped()
+            if dropped:
+                await websocket.send_json({"type": "lag", "dropped": dropped})
+            event = _event_response(next_event.result())
+            await websocket.send_json({"type": "event", "event": event.model_dump(mode="json")})
+    except WebSocketDisconnect:
+        return
+    finally:
+        disconnected.cancel()
+        bus.unsubscribe(subscription)
+
+
+async def sse_messages(
+    bus: EventBus,
+    subscription: EventSubscription,
+    *,
+    keepalive_seconds: float = SSE_KEEPALIVE_SECONDS,
+) -> AsyncIterator[str]:
+    """Yield SSE frames for `subscription` until the client goes away."""
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), timeout=keepalive_seconds)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            dropped = subscription.take_dropped()
+            if dropped:
+                yield f"event: lag\ndata: {json.dumps({'dropped': dropped})}\n\n"
+            data = _event_response(event).model_dump_json()
+            yield f"id: {event.id}\nevent: {event.event_type.value}\ndata: {data}\n\n"
+    finally:
+        bus.unsubscribe(subscription)
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    with contextlib.suppress(WebSocketDisconnect):
+        while True:
+            await websocket.receive_text()
+
+
+@router.get("/aggregate", response_model=EventAggregateResponse)
+async def aggregate_project_events(
+    project_id: str,
+    group_by: list[Literal["event_type", "bucket"]] = Query(default=["event_type"]),
+    bucket: Literal["hour", "day", "month"] = "day",
+    event_type: str | None = None,
+    since: datetime | None = Query(default=None),
+    until: datetime | None = Query(default=None),
+    manager: ProjectManager = Depends(get_project_manager),
+    store: SQLiteStore = Depends(get_store),
+) -> EventAggregateResponse:
+    await require_project(project_id, manager)
+    return await _aggregate(
+        store,
+        group_by=group_by,
+        bucket=bucket,
         project_id=project_id,
-        event_type=parsed_event_type,
+        event_type=_parse_event_type(event_type),
         since=since,
         until=until,
     )
-    return EventsResponse(
+
+
+@global_router.get("/aggregate", response_model=EventAggregateResponse)
+async def aggregate_events(
+    group_by: list[Literal["project", "event_type", "bucket"]] = Query(default=["event_type"]),
+    bucket: Literal["hour", "day", "month"] = "day",
+    project_id: str | None = None,
+    event_type: str | None = None,
+    since: datetime | None = Query(default=None),
+    until: datetime | None = Query(default=None),
+    store: SQLiteStore = Depends(get_store),
+) -> EventAggregateResponse:
+    return await _aggregate(
+        store,
+        group_by=group_by,
+        bucket=bucket,
+        project_id=project_id,
+        event_type=_parse_event_type(event_type),
+        since=since,
+        until=until,
+    )
+
+
+async def _aggregate(
+    store: SQLiteStore,
+    *,
+    group_by: Sequence[EventGroupField],
+    bucket: EventBucket,
+    project_id: str | None,
+    event_type: EventType | None,
+    since: datetime | None,
+    until: datetime | None,
+) -> EventAggregateResponse:
+    aggregates = await store.aggregate_events(
+        group_by=group_by,
+        bucket=bucket,
+        project_id=project_id,
+        event_type=event_type,
+        since=since,
+        until=until,
+    )
+    return EventAggregateResponse(
+        group_by=list(group_by),
+        bucket=bucket,
+        total=sum(aggregate.count for aggregate in aggregates),
         items=[
-            EventResponse(
-                id=event.id,
-                event_type=event.event_type.value,
-                payload=event.payload,
-                timestamp=event.timestamp,
+            EventAggregateItem(
+                project_id=aggregate.project_id,
+                event_type=aggregate.event_type.value if aggregate.event_type else None,
+                bucket=aggregate.bucket,
+                count=aggregate.count,
             )
-            for event in events
-        ]
+            for aggregate in aggregates
+        ],
+    )
+
+
+def _parse_event_type(event_type: str | None) -> EventType | None:
+    if event_type is None:
+        return None
+    try:
+        return EventType(event_type)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid event_type",
+        ) from exc
+
+
+def _parse_event_types(values: Sequence[str]) -> list[EventType]:
+    try:
+        return [EventType(value) for value in values]
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid event_type",
+        ) from exc
+
+
+def _event_response(event: ATTEvent) -> EventResponse:
+    return EventResponse(
+        id=event.id,
+        project_id=event.project_id,
+        event_type=event.event_type.value,
+        payload=event.payload,
+        timestamp=event.timestamp,
     )
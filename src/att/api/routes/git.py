@@ -26,7 +26,8 @@ async def git_status(
     git: GitManager = Depends(get_git_manager),
 ) -> dict[str, str]:
     project = await require_project(project_id, manager)
-    return {"status": git.status(project.path).output}
+    result = await git.status(project.path)
+    return {"status": result.output}
 
 
 @router.post("/commit")
@@ -37,7 +38,7 @@ async def git_commit(
     git: GitManager = Depends(get_git_manager),
 ) -> dict[str, str]:
     project = await require_project(project_id, manager)
-    result = git.commit(project.path, request.message)
+    result = await git.commit(project.path, request.message)
     return {"result": result.output}
 
 
@@ -49,7 +50,7 @@ async def git_push(
     git: GitManager = Depends(get_git_manager),
 ) -> dict[str, str]:
     project = await require_project(project_id, manager)
-    result = git.push(project.path, request.remote, request.branch)
+    result = await git.push(project.path, request.remote, request.branch)
     return {"result": result.output}
 
 
@@ -61,7 +62,7 @@ async def git_branch(
     git: GitManager = Depends(get_git_manager),
 ) -> dict[str, str]:
     project = await require_project(project_id, manager)
-    result = git.branch(project.path, request.name, checkout=request.checkout)
+    result = await git.branch(project.path, request.name, checkout=request.checkout)
     return {"result": result.output}
 
 
@@ -72,7 +73,7 @@ async def git_log(
     git: GitManager = Depends(get_git_manager),
 ) -> dict[str, str]:
     project = await require_project(project_id, manager)
-    result = git.log(project.path)
+    result = await git.log(project.path)
     return {"log": result.output}
 
 
@@ -84,7 +85,7 @@ async def git_actions(
 ) -> dict[str, str]:
     project = await require_project(project_id, manager)
     try:
-        result = git.actions(project.path)
+        result = await git.actions(project.path)
     except RuntimeError as exc:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -102,7 +103,7 @@ async def git_pr_create(
 ) -> dict[str, str]:
     project = await require_project(project_id, manager)
     try:
-        result = git.pr_create(
+        result = await git.pr_create(
             project.path,
             title=request.title,
             body=request.body,
@@ -126,7 +127,7 @@ async def git_pr_merge(
 ) -> dict[str, str]:
     project = await require_project(project_id, manager)
     try:
-        result = git.pr_merge(
+        result = await git.pr_merge(
             project.path,
             pull_request=request.pull_request,
             strategy=request.strategy,
@@ -148,7 +149,7 @@ async def git_pr_reviews(
 ) -> dict[str, str]:
     project = await require_project(project_id, manager)
     try:
-        result = git.pr_reviews(project.path, pull_request=pull_request)
+        result = await git.pr_reviews(project.path, pull_request=pull_request)
     except RuntimeError as exc:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
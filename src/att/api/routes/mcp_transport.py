@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 
 from att.api.deps import (
     get_code_manager,
@@ -14,16 +15,18 @@ from att.api.deps import (
     get_git_manager,
     get_project_manager,
     get_runtime_manager,
-    get_test_result_store,
-    get_test_runner,
+    get_test_run_manager,
 )
+from att.api.routes.common import run_result_payload, run_until_disconnect
 from att.core.code_manager import CodeManager
+from att.core.code_search import DEFAULT_MAX_MATCHES
 from att.core.debug_manager import DebugManager
 from att.core.deploy_manager import DeployManager
+from att.core.file_index import FileFilter, FilePage
 from att.core.git_manager import GitManager
 from att.core.project_manager import CreateProjectInput, ProjectManager
 from att.core.runtime_manager import RuntimeManager
-from att.core.test_runner import TestResultPayload, TestRunner
+from att.core.test_run_manager import TestRunManager
 from att.mcp.server import find_tool, registered_resources, registered_tools
 from att.mcp.tools.code_tools import CodeToolCall, parse_code_tool_call
 from att.mcp.tools.debug_tools import DebugToolCall, parse_debug_tool_call
@@ -55,14 +58,14 @@ def _error(request_id: str | int | None, code: int, message: str) -> dict[str, A
 @router.post("/mcp")
 async def mcp_transport(
     payload: dict[str, Any],
+    http_request: Request,
     project_manager: ProjectManager = Depends(get_project_manager),
     code_manager: CodeManager = Depends(get_code_manager),
     git_manager: GitManager = Depends(get_git_manager),
     runtime_manager: RuntimeManager = Depends(get_runtime_manager),
-    test_runner: TestRunner = Depends(get_test_runner),
+    test_runs: TestRunManager = Depends(get_test_run_manager),
     debug_manager: DebugManager = Depends(get_debug_manager),
     deploy_manager: DeployManager = Depends(get_deploy_manager),
-    test_results: dict[str, TestResultPayload] = Depends(get_test_result_store),
     debug_logs: dict[str, list[str]] = Depends(get_debug_log_store),
 ) -> dict[str, Any]:
     request_id = payload.get("id")
@@ -123,11 +126,11 @@ async def mcp_transport(
                 code_manager=code_manager,
                 git_manager=git_manager,
                 runtime_manager=runtime_manager,
-                test_runner=test_runner,
+                test_runs=test_runs,
                 debug_manager=debug_manager,
                 deploy_manager=deploy_manager,
-                test_results=test_results,
                 debug_logs=debug_logs,
+                http_request=http_request,
             )
         except Exception as exc:  # pragma: no cover - defensive guard
             return _error(request_id, -32000, str(exc))
@@ -146,7 +149,7 @@ async def mcp_transport(
                 code_manager=code_manager,
                 git_manager=git_manager,
                 runtime_manager=runtime_manager,
-                test_results=test_results,
+                test_runs=test_runs,
             )
         except Exception as exc:  # pragma: no cover - defensive guard
             return _error(request_id, -32000, str(exc))
@@ -165,11 +168,11 @@ async def _handle_tool_call(
     code_manager: CodeManager,
     git_manager: GitManager,
     runtime_manager: RuntimeManager,
-    test_runner: TestRunner,
+    test_runs: TestRunManager,
     debug_manager: DebugManager,
     deploy_manager: DeployManager,
-    test_results: dict[str, TestResultPayload],
     debug_logs: dict[str, list[str]],
+    http_request: Request,
 ) -> dict[str, Any]:
     try:
         project_call = parse_project_tool_call(tool_name, arguments)
@@ -211,8 +214,8 @@ async def _handle_tool_call(
         return await _handle_test_tool_call(
             test_call,
             project_manager,
-            test_runner,
-            test_results,
+            test_runs,
+            http_request,
         )
 
     try:
@@ -313,12 +316,19 @@ async def _handle_code_tool_call(
         return {"error": "project not found"}
 
     if call.operation == "list":
-        return {
-            "files": [
-                str(path.relative_to(project.path))
-                for path in code_manager.list_files(project.path)
-            ]
-        }
+        file_filter = (
+            FileFilter(max_bytes=call.max_bytes, skip_binary=call.skip_binary)
+            if call.max_bytes is not None or call.skip_binary
+            else None
+        )
+        page = await asyncio.to_thread(
+            code_manager.list_page,
+            project.path,
+            cursor=call.cursor,
+            limit=call.limit,
+            file_filter=file_filter,
+        )
+        return _file_page_payload(page)
 
     if call.operation == "read":
         if call.path is None:
@@ -328,22 +338,52 @@ async def _handle_code_tool_call(
     if call.operation == "write":
         if call.path is None or call.content is None:
             return {"error": "path and content are required"}
-        code_manager.write_file(project.path, call.path, call.content)
+        await asyncio.to_thread(code_manager.write_file, project.path, call.path, call.content)
         return {"status": "updated"}
 
     if call.operation == "search":
         if call.pattern is None:
             return {"error": "pattern is required"}
+        limit = call.limit or DEFAULT_MAX_MATCHES
+        try:
+            matches = await asyncio.to_thread(
+                code_manager.search_lines,
+                project.path,
+                call.pattern,
+                regex=call.regex,
+                ignore_case=call.ignore_case,
+                max_matches=limit + 1,
+            )
+        except ValueError as exc:
+            return {"error": str(exc)}
+        truncated = len(matches) > limit
+        matches = matches[:limit]
         return {
-            "matches": [
-                str(path.relative_to(project.path))
-                for path in code_manager.search(project.path, call.pattern)
-            ]
+            "matches": list(dict.fromkeys(match.path for match in matches)),
+            "results": [
+                {
+                    "path": match.path,
+                    "line": match.line,
+                    "column": match.column,
+                    "snippet": match.snippet,
+                }
+                for match in matches
+            ],
+            "truncated": truncated,
         }
 
     return {"error": f"Code tool operation not implemented: {call.operation}"}
 
 
+def _file_page_payload(page: FilePage) -> dict[str, Any]:
+    return {
+        "files": page.files,
+        "cursor": page.cursor,
+        "next_cursor": page.next_cursor,
+        "total": page.total,
+    }
+
+
 async def _handle_git_tool_call(
     call: GitToolCall,
     project_manager: ProjectManager,
@@ -354,61 +394,62 @@ async def _handle_git_tool_call(
         return {"error": "project not found"}
 
     if call.operation == "status":
-        return {"status": git_manager.status(project.path).output}
+        result = await git_manager.status(project.path)
+        return {"status": result.output}
 
     if call.operation == "commit":
         if call.message is None:
             return {"error": "message is required"}
-        return {"result": git_manager.commit(project.path, call.message).output}
+        result = await git_manager.commit(project.path, call.message)
+        return {"result": result.output}
 
     if call.operation == "push":
-        return {"result": git_manager.push(project.path, call.remote, call.branch).output}
+        result = await git_manager.push(project.path, call.remote, call.branch)
+        return {"result": result.output}
 
     if call.operation == "branch":
         if call.name is None:
             return {"error": "name is required"}
-        return {
-            "result": git_manager.branch(project.path, call.name, checkout=call.checkout).output
-        }
+        result = await git_manager.branch(project.path, call.name, checkout=call.checkout)
+        return {"result": result.output}
 
     if call.operation == "pr_create":
         if call.title is None:
             return {"error": "title is required"}
-        return {
-            "result": git_manager.pr_create(
-                project.path,
-                title=call.title,
-                body=call.body,
-                base=call.base,
-                head=call.head,
-            ).output
-        }
+        result = await git_manager.pr_create(
+            project.path,
+            title=call.title,
+            body=call.body,
+            base=call.base,
+            head=call.head,
+        )
+        return {"result": result.output}
 
     if call.operation == "pr_merge":
         if call.pull_request is None:
             return {"error": "pull_request is required"}
-        return {
-            "result": git_manager.pr_merge(
-                project.path,
-                pull_request=call.pull_request,
-                strategy=call.strategy,
-            ).output
-        }
+        result = await git_manager.pr_merge(
+            project.path,
+            pull_request=call.pull_request,
+            strategy=call.strategy,
+        )
+        return {"result": result.output}
 
     if call.operation == "pr_review":
         if call.pull_request is None:
             return {"error": "pull_request is required"}
-        return {
-            "reviews": git_manager.pr_reviews(project.path, pull_request=call.pull_request).output
-        }
+        result = await git_manager.pr_reviews(project.path, pull_request=call.pull_request)
+        return {"reviews": result.output}
 
     if call.operation == "log":
         limit = call.limit if call.limit is not None else 20
-        return {"log": git_manager.log(project.path, limit=limit).output}
+        result = await git_manager.log(project.path, limit=limit)
+        return {"log": result.output}
 
     if call.operation == "actions":
         limit = call.limit if call.limit is not None else 10
-        return {"actions": git_manager.actions(project.path, limit=limit).output}
+        result = await git_manager.actions(project.path, limit=limit)
+        return {"actions": result.output}
 
     return {"error": f"Git tool operation not implemented: {call.operation}"}
 
@@ -463,26 +504,46 @@ async def _handle_runtime_tool_call(
 async def _handle_test_tool_call(
     call: MCPTestToolCall,
     project_manager: ProjectManager,
-    test_runner: TestRunner,
-    test_results: dict[str, TestResultPayload],
+    test_runs: TestRunManager,
+    http_request: Request,
 ) -> dict[str, Any]:
     project = await project_manager.get(call.project_id)
     if project is None:
         return {"error": "project not found"}
 
     if call.operation == "run":
-        test_result = test_runner.run(
-            project.path,
+        run = await run_until_disconnect(
+            http_request,
+            test_runs.run(
+                project,
+                suite=call.suite,
+                markers=call.markers,
+                timeout_seconds=call.timeout_seconds,
+                shards=call.shards,
+            ),
+        )
+        return run_result_payload(run)
+
+    if call.operation == "submit":
+        run = await test_runs.submit(
+            project,
             suite=call.suite,
             markers=call.markers,
             timeout_seconds=call.timeout_seconds,
+            shards=call.shards,
         )
-        payload = test_result.as_payload()
-        test_results[call.project_id] = payload
-        return payload
+        return run.model_dump(mode="json")
+
+    if call.operation == "status":
+        run_id = call.run_id or ""
+        status_run = await test_runs.get(run_id)
+        if status_run is None or status_run.project_id != call.project_id:
+            return {"error": f"test run not found: {run_id}"}
+        return status_run.model_dump(mode="json")
 
     if call.operation == "results":
-        return test_results.get(call.project_id, {"status": "no_results"})
+        latest = await test_runs.latest_finished(call.project_id)
+        return run_result_payload(latest) if latest is not None else {"status": "no_results"}
 
     return {"error": f"Test tool operation not implemented: {call.operation}"}
 
@@ -541,7 +602,7 @@ async def _handle_resource_read(
     code_manager: CodeManager,
     git_manager: GitManager,
     runtime_manager: RuntimeManager,
-    test_results: dict[str, TestResultPayload],
+    test_runs: TestRunManager,
 ) -> dict[str, Any]:
     resource_ref = parse_resource_ref(uri)
     if resource_ref is None:
@@ -569,12 +630,13 @@ async def _handle_resource_read(
         project = await project_manager.get(project_id)
         if project is None:
             return {"error": "project not found"}
-        return {
-            "files": [
-                str(path.relative_to(project.path))
-                for path in code_manager.list_files(project.path)
-            ]
-        }
+        page = await asyncio.to_thread(
+            code_manager.list_page,
+            project.path,
+            cursor=resource_ref.cursor or 0,
+            limit=resource_ref.limit,
+        )
+        return _file_page_payload(page)
 
     if resource_ref.operation == "config":
         project = await project_manager.get(project_id)
@@ -589,7 +651,22 @@ async def _handle_resource_read(
         return {"path": str(resolved), "content": resolved.read_text(encoding="utf-8")}
 
     if resource_ref.operation == "tests":
-        return test_results.get(project_id, {"status": "no_results"})
+        latest = await test_runs.latest_finished(project_id)
+        return run_result_payload(latest) if latest is not None else {"status": "no_results"}
+
+    if resource_ref.operation == "test_output":
+        run_id = resource_ref.run_id or ""
+        run = await test_runs.get(run_id)
+        if run is None or run.project_id != project_id:
+            return {"error": f"test run not found: {run_id}"}
+        output_read = await test_runs.read_output(
+            run_id,
+            cursor=resource_ref.cursor,
+            limit=resource_ref.limit,
+        )
+        if output_read is None:
+            return {"error": f"test run not found: {run_id}"}
+        return output_read.as_payload()
 
     if resource_ref.operation == "logs":
         log_read = runtime_manager.read_logs(
@@ -609,6 +686,7 @@ async def _handle_resource_read(
         project = await project_manager.get(project_id)
         if project is None:
             return {"error": "project not found"}
-        return {"actions": git_manager.actions(project.path).output}
+        actions = await git_manager.actions(project.path)
+        return {"actions": actions.output}
 
     return {"error": f"Resource operation not implemented: {resource_ref.operation}"}
@@ -2,42 +2,225 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+import json
+from collections.abc import AsyncIterator
+from typing import Any
 
-from att.api.deps import get_project_manager, get_test_result_store, get_test_runner
-from att.api.routes.common import require_project
-from att.api.schemas.test import RunTestRequest
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from att.api.deps import get_project_manager, get_test_run_manager
+from att.api.routes.common import require_project, run_result_payload, run_until_disconnect
+from att.api.routes.events import SSE_KEEPALIVE_SECONDS
+from att.api.schemas.test import (
+    RunTestRequest,
+    TestCasesResponse,
+    TestHistoryResponse,
+    TestRunsResponse,
+)
 from att.core.project_manager import ProjectManager
-from att.core.test_runner import TestResultPayload, TestRunner
+from att.core.test_run_manager import TestRunManager
+from att.core.test_runner import TestResultPayload
+from att.models.test_run import TestRun
 
 router = APIRouter(prefix="/api/v1/projects/{project_id}/test", tags=["test"])
 
+MAX_RUN_WAIT_SECONDS = 60.0
+
 
 @router.post("/run")
 async def run_tests(
     project_id: str,
     request: RunTestRequest,
+    http_request: Request,
     manager: ProjectManager = Depends(get_project_manager),
-    test_runner: TestRunner = Depends(get_test_runner),
-    test_store: dict[str, TestResultPayload] = Depends(get_test_result_store),
+    test_runs: TestRunManager = Depends(get_test_run_manager),
 ) -> TestResultPayload:
+    """Run tests through the queue and wait for the result."""
     project = await require_project(project_id, manager)
-    result = test_runner.run(
-        project.path,
-        suite=request.suite,
-        markers=request.markers,
-        timeout_seconds=request.timeout_seconds,
+    run = await run_until_disconnect(
+        http_request,
+        test_runs.run(
+            project,
+            suite=request.suite,
+            markers=request.markers,
+            timeout_seconds=request.timeout_seconds,
+            shards=request.shards,
+        ),
     )
-    payload = result.as_payload()
-    test_store[project_id] = payload
-    return payload
+    return run_result_payload(run)
 
 
 @router.get("/results")
 async def test_results(
     project_id: str,
     manager: ProjectManager = Depends(get_project_manager),
-    test_store: dict[str, TestResultPayload] = Depends(get_test_result_store),
+    test_runs: TestRunManager = Depends(get_test_run_manager),
 ) -> TestResultPayload:
     await require_project(project_id, manager)
-    return test_store.get(project_id, {"status": "no_results"})
+    run = await test_runs.latest_finished(project_id)
+    if run is None:
+        return {"status": "no_results"}
+    return run_result_payload(run)
+
+
+@router.post("/runs", status_code=status.HTTP_202_ACCEPTED)
+async def submit_test_run(
+    project_id: str,
+    request: RunTestRequest,
+    manager: ProjectManager = Depends(get_project_manager),
+    test_runs: TestRunManager = Depends(get_test_run_manager),
+) -> TestRun:
+    project = await require_project(project_id, manager)
+    return await test_runs.submit(
+        project,
+        suite=request.suite,
+        markers=request.markers,
+        timeout_seconds=request.timeout_seconds,
+        shards=request.shards,
+    )
+
+
+@router.get("/runs", response_model=TestRunsResponse)
+async def list_test_runs(
+    project_id: str,
+    limit: int = Query(default=50, ge=1, le=500),
+    manager: ProjectManager = Depends(get_project_manager),
+    test_runs: TestRunManager = Depends(get_test_run_manager),
+) -> TestRunsResponse:
+    await require_project(project_id, manager)
+    return TestRunsResponse(items=await test_runs.list(project_id, limit=limit))
+
+
+@router.get("/runs/{run_id}")
+async def get_test_run(
+    project_id: str,
+    run_id: str,
+    wait_seconds: float = Query(default=0.0, ge=0.0, le=MAX_RUN_WAIT_SECONDS),
+    manager: ProjectManager = Depends(get_project_manager),
+    test_runs: TestRunManager = Depends(get_test_run_manager),
+) -> TestRun:
+    """Return a run, optionally long-polling up to `wait_seconds` for it to finish."""
+    await require_project(project_id, manager)
+    if wait_seconds > 0:
+        run = await test_runs.wait(run_id, wait_seconds)
+    else:
+        run = await test_runs.get(run_id)
+    return _require_run(run, project_id)
+
+
+@router.post("/runs/{run_id}/cancel")
+async def cancel_test_run(
+    project_id: str,
+    run_id: str,
+    manager: ProjectManager = Depends(get_project_manager),
+    test_runs: TestRunManager = Depends(get_test_run_manager),
+) -> TestRun:
+    await require_project(project_id, manager)
+    _require_run(await test_runs.get(run_id), project_id)
+    return _require_run(await test_runs.cancel(run_id), project_id)
+
+
+@router.get("/history", response_model=TestHistoryResponse)
+async def test_history(
+    project_id: str,
+    runs: int = Query(default=50, ge=1, le=500),
+    limit: int = Query(default=20, ge=1, le=200),
+    manager: ProjectManager = Depends(get_project_manager),
+    test_runs: TestRunManager = Depends(get_test_run_manager),
+) -> TestHistoryResponse:
+    """Rank tests by duration, flakiness and duration regression over recent runs."""
+    await require_project(project_id, manager)
+    report = await test_runs.history(project_id, runs=runs, limit=limit)
+    return TestHistoryResponse(
+        runs=report.runs,
+        slowest=report.slowest,
+        flaky=report.flaky,
+        regressions=report.regressions,
+    )
+
+
+@router.get("/runs/{run_id}/cases", response_model=TestCasesResponse)
+async def list_test_run_cases(
+    project_id: str,
+    run_id: str,
+    manager: ProjectManager = Depends(get_project_manager),
+    test_runs: TestRunManager = Depends(get_test_run_manager),
+) -> TestCasesResponse:
+    await require_project(project_id, manager)
+    _require_run(await test_runs.get(run_id), project_id)
+    return TestCasesResponse(items=await test_runs.test_cases(run_id))
+
+
+@router.get("/runs/{run_id}/output")
+async def read_test_run_output(
+    project_id: str,
+    run_id: str,
+    cursor: int | None = Query(default=None, ge=0),
+    limit: int | None = Query(default=None, ge=1),
+    manager: ProjectManager = Depends(get_project_manager),
+    test_runs: TestRunManager = Depends(get_test_run_manager),
+) -> dict[str, Any]:
+    """Read console output by cursor; works while the run is still in progress."""
+    await require_project(project_id, manager)
+    _require_run(await test_runs.get(run_id), project_id)
+    output_read = await test_runs.read_output(run_id, cursor=cursor, limit=limit)
+    if output_read is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Test run not found")
+    return output_read.as_payload()
+
+
+@router.get("/runs/{run_id}/output/stream")
+async def stream_test_run_output(
+    project_id: str,
+    run_id: str,
+    cursor: int | None = Query(default=None, ge=0),
+    last_event_id: str | None = Header(default=None),
+    manager: ProjectManager = Depends(get_project_manager),
+    test_runs: TestRunManager = Depends(get_test_run_manager),
+) -> StreamingResponse:
+    """Push console output as server-sent events until the run finishes.
+
+    Each `output` frame's id is the next cursor, so a reconnecting client
+    resumes via `Last-Event-ID`.
+    """
+    await require_project(project_id, manager)
+    _require_run(await test_runs.get(run_id), project_id)
+    if cursor is None and last_event_id is not None and last_event_id.isdigit():
+        cursor = int(last_event_id)
+    return StreamingResponse(
+        run_output_messages(test_runs, run_id, cursor=cursor or 0),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+async def run_output_messages(
+    test_runs: TestRunManager,
+    run_id: str,
+    *,
+    cursor: int = 0,
+    keepalive_seconds: float = SSE_KEEPALIVE_SECONDS,
+) -> AsyncIterator[str]:
+    """Yield SSE `output` frames from `cursor`, then one `end` frame with the finished run."""
+    while True:
+        output_read = await test_runs.read_output(run_id, cursor=cursor)
+        if output_read is None:
+            return
+        if output_read.logs or output_read.truncated:
+            data = json.dumps(output_read.as_payload())
+            yield f"id: {output_read.cursor}\nevent: output\ndata: {data}\n\n"
+        cursor = output_read.cursor
+        if output_read.finished and not output_read.has_more:
+            run = await test_runs.wait(run_id)
+            if run is not None:
+                yield f"event: end\ndata: {run.model_dump_json()}\n\n"
+            return
+        if not await test_runs.wait_for_output(run_id, cursor, keepalive_seconds):
+            yield ": keepalive\n\n"
+
+
+def _require_run(run: TestRun | None, project_id: str) -> TestRun:
+    if run is None or run.project_id != project_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Test run not found")
+    return run
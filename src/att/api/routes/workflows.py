@@ -28,13 +28,17 @@ async def run_change_workflow(
         new_content=request.content,
         suite=request.suite,
         commit_message=request.commit_message,
+        test_selection=request.test_selection,
+        fail_fast=request.fail_fast,
     )
     return RunChangeWorkflowResponse(
         diff=workflow_result.diff,
         test_command=workflow_result.test_result.command,
         test_returncode=workflow_result.test_result.returncode,
         test_output=workflow_result.test_result.output,
+        test_stopped_early=workflow_result.test_result.stopped_early,
         committed=workflow_result.committed,
         commit_output=workflow_result.commit_output,
         event_ids=[event.id for event in workflow_result.events],
+        selected_tests=workflow_result.selected_tests,
     )
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from att.core.code_search import DEFAULT_MAX_MATCHES
+
+MAX_SEARCH_RESULTS = 10_000
 
 
 class WriteFileRequest(BaseModel):
@@ -12,6 +16,42 @@ class WriteFileRequest(BaseModel):
 
 
 class SearchRequest(BaseModel):
-    """Search request payload."""
+    """Search request payload; `pattern` is a substring unless `regex` is set."""
 
     pattern: str
+    regex: bool = False
+    ignore_case: bool = False
+    max_results: int = Field(default=DEFAULT_MAX_MATCHES, ge=1, le=MAX_SEARCH_RESULTS)
+
+
+class SearchResult(BaseModel):
+    """One matching line; `line` and `column` are 1-based."""
+
+    path: str
+    line: int
+    column: int
+    snippet: str
+
+
+class SearchResponse(BaseModel):
+    """Files holding the returned lines in path order, plus the lines themselves.
+
+    `truncated` is set when more lines matched than were returned; later files
+    may then be missing from `matches` too.
+    """
+
+    matches: list[str]
+    results: list[SearchResult]
+    truncated: bool = False
+
+
+class FileListResponse(BaseModel):
+    """One page of a project file listing.
+
+    Cursors index the ignore-filtered listing; `next_cursor` is null on the last page.
+    """
+
+    files: list[str]
+    cursor: int = 0
+    next_cursor: int | None = None
+    total: int
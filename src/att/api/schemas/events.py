@@ -9,15 +9,38 @@ from pydantic import BaseModel
 
 
 class EventResponse(BaseModel):
-    """Event record payload."""
+    """Event record payload, shared by the JSON, NDJSON, SSE and WebSocket endpoints."""
 
     id: str
+    project_id: str
     event_type: str
     payload: dict[str, Any]
     timestamp: datetime
 
 
 class EventsResponse(BaseModel):
-    """Collection of events."""
+    """Collection of events.
+
+    `next_cursor` is set when a `limit` was requested and more events remain.
+    """
 
     items: list[EventResponse]
+    next_cursor: str | None = None
+
+
+class EventAggregateItem(BaseModel):
+    """Event count for one group; ungrouped dimensions are omitted as null."""
+
+    project_id: str | None = None
+    event_type: str | None = None
+    bucket: str | None = None
+    count: int
+
+
+class EventAggregateResponse(BaseModel):
+    """Grouped event counts computed server-side."""
+
+    group_by: list[str]
+    bucket: str
+    total: int
+    items: list[EventAggregateItem]
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from typing import ClassVar
+
+from pydantic import BaseModel, Field
+
+from att.models.test_run import MAX_TEST_SHARDS, TestCaseResult, TestRun, TestStats
 
 
 class RunTestRequest(BaseModel):
@@ -11,3 +15,31 @@ class RunTestRequest(BaseModel):
     suite: str = "unit"
     markers: str | None = None
     timeout_seconds: int | None = None
+    shards: int = Field(default=1, ge=1, le=MAX_TEST_SHARDS)
+
+
+class TestRunsResponse(BaseModel):
+    """Collection response for a project's test run history."""
+
+    __test__: ClassVar[bool] = False  # not a pytest test class
+
+    items: list[TestRun]
+
+
+class TestCasesResponse(BaseModel):
+    """Per-test outcomes of one test run."""
+
+    __test__: ClassVar[bool] = False  # not a pytest test class
+
+    items: list[TestCaseResult]
+
+
+class TestHistoryResponse(BaseModel):
+    """Slowest, flaky and newly slower tests over a project's recent runs."""
+
+    __test__: ClassVar[bool] = False  # not a pytest test class
+
+    runs: int
+    slowest: list[TestStats]
+    flaky: list[TestStats]
+    regressions: list[TestStats]
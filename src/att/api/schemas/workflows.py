@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field
 
 
 class RunChangeWorkflowRequest(BaseModel):
@@ -12,6 +14,8 @@ class RunChangeWorkflowRequest(BaseModel):
     content: str
     suite: str = "unit"
     commit_message: str | None = None
+    test_selection: Literal["suite", "affected"] = "suite"
+    fail_fast: bool = False
 
 
 class RunChangeWorkflowResponse(BaseModel):
@@ -21,6 +25,8 @@ class RunChangeWorkflowResponse(BaseModel):
     test_command: str
     test_returncode: int
     test_output: str
+    test_stopped_early: bool = False
     committed: bool
     commit_output: str | None
     event_ids: list[str]
+    selected_tests: list[str] = Field(default_factory=list)
@@ -3,33 +3,108 @@
 from __future__ import annotations
 
 import difflib
+from collections.abc import Iterator
 from pathlib import Path
 
+from att.core.code_search import DEFAULT_MAX_MATCHES, CodeSearchIndex, SearchMatch
+from att.core.file_index import FileFilter, FileIndex, FilePage
+
 
 class CodeManager:
-    """Constrained file operations within project boundaries."""
+    """Constrained file operations within project boundaries.
+
+    `file_filter` is the default size/binary filter for paged and streamed
+    listings and for search; explicit filters passed to those calls win.
+    Search runs against a per-project trigram index; it is only persisted
+    when `search_index` is given an `index_dir`.
+    """
+
+    def __init__(
+        self,
+        file_index: FileIndex | None = None,
+        *,
+        file_filter: FileFilter | None = None,
+        search_index: CodeSearchIndex | None = None,
+    ) -> None:
+        self._index = file_index or FileIndex()
+        self._file_filter = file_filter or FileFilter()
+        self._search_index = search_index or CodeSearchIndex()
 
     def list_files(self, project_path: Path) -> list[Path]:
-        return sorted(path for path in project_path.rglob("*") if path.is_file())
+        """Return project files, skipping `.git`, build/tool outputs and ignored paths."""
+        return self._index.list_files(project_path)
+
+    def list_page(
+        self,
+        project_path: Path,
+        *,
+        cursor: int = 0,
+        limit: int | None = None,
+        file_filter: FileFilter | None = None,
+    ) -> FilePage:
+        return self._index.page(
+            project_path,
+            cursor=cursor,
+            limit=limit,
+            file_filter=file_filter or self._file_filter,
+        )
+
+    def iter_files(
+        self,
+        project_path: Path,
+        *,
+        file_filter: FileFilter | None = None,
+    ) -> Iterator[Path]:
+        return self._index.iter_files(project_path, file_filter=file_filter or self._file_filter)
 
     def read_file(self, project_path: Path, rel_path: str) -> str:
         path = self._resolve(project_path, rel_path)
         return path.read_text(encoding="utf-8")
 
     def write_file(self, project_path: Path, rel_path: str, content: str) -> None:
+        """Write a file and reindex it for search.
+
+        Blocks while a search index refresh holds its lock; async callers run it
+        in a worker thread.
+        """
         path = self._resolve(project_path, rel_path)
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(content, encoding="utf-8")
+        self._index.invalidate(project_path, str(Path(rel_path).parent))
+        self._search_index.update(
+            project_path,
+            path.relative_to(project_path.resolve()).as_posix(),
+        )
 
     def search(self, project_path: Path, pattern: str) -> list[Path]:
-        matches: list[Path] = []
-        for file_path in self.list_files(project_path):
-            try:
-                if pattern in file_path.read_text(encoding="utf-8"):
-                    matches.append(file_path)
-            except UnicodeDecodeError:
-                continue
-        return matches
+        """Return the files with a line containing `pattern`."""
+        matches = self.search_lines(project_path, pattern, max_matches=None)
+        return [project_path / path for path in dict.fromkeys(match.path for match in matches)]
+
+    def search_lines(
+        self,
+        project_path: Path,
+        query: str,
+        *,
+        regex: bool = False,
+        ignore_case: bool = False,
+        max_matches: int | None = DEFAULT_MAX_MATCHES,
+    ) -> list[SearchMatch]:
+        """Return matching lines with line numbers and snippets.
+
+        Raises `ValueError` for an invalid regex.
+        """
+        return self._search_index.search(
+            project_path,
+            lambda: self.list_page(project_path).files,
+            query,
+            regex=regex,
+            ignore_case=ignore_case,
+            max_matches=max_matches,
+        )
+
+    def close(self) -> None:
+        self._search_index.close()
 
     def diff(self, original: str, updated: str, *, from_name: str, to_name: str) -> str:
         return "\n".join(
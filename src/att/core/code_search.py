@@ -0,0 +1,525 @@
+"""Persistent trigram index for full-text code search."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+MAX_INDEXED_BYTES = 1_000_000
+DEFAULT_MAX_MATCHES = 1000
+MAX_SNIPPET_CHARS = 240
+REFRESH_INTERVAL_SECONDS = 2.0
+_SCHEMA_VERSION = 1
+_BINARY_SNIFF_BYTES = 8192
+# Files modified this close to their indexing time are re-read on the next
+# refresh, since a same-size write in the same timestamp tick looks unchanged.
+_RACY_WINDOW_NS = 2_000_000_000
+# Postings of reindexed or removed files are dropped once they outnumber live ones.
+_COMPACT_MIN_DEAD_SLOTS = 1024
+# `re.IGNORECASE` matches these to ASCII letters, which `str.lower` alone does not.
+_FOLD_TABLE = str.maketrans({"İ": "i", "ı": "i", "ſ": "s"})
+_WORD_RUN = re.compile(r"[a-z0-9_]{3,}")
+# Regex syntax skipped when looking for required literals.
+_BRACE_QUANTIFIER = re.compile(r"\{\d*(?:,\d*)?\}")
+_REQUIRED_GROUP_PREFIX = re.compile(r"\?(?:P<\w+>|[aiLmsux-]*:|>)")
+_ESCAPE_DIGITS = {"x": 2, "u": 4, "U": 8}
+
+type FileState = Literal["indexed", "large", "binary"]
+
+_SCHEMA = """
+CREATE TABLE files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    indexed_ns INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    trigrams BLOB NOT NULL
+) WITHOUT ROWID
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class SearchMatch:
+    """One matching line; `line` and `column` are 1-based."""
+
+    path: str
+    line: int
+    column: int
+    snippet: str
+
+
+@dataclass(slots=True)
+class _FileEntry:
+    slot: int
+    mtime_ns: int
+    size: int
+    indexed_ns: int
+    state: FileState
+
+
+@dataclass(slots=True)
+class _ProjectSearchIndex:
+    conn: sqlite3.Connection
+    entries: dict[str, _FileEntry] = field(default_factory=dict)
+    # Trigram -> slots of the files containing it. A reindexed file gets a new
+    # slot, so postings are only appended; stale slots are absent from `paths`.
+    postings: dict[int, array[int]] = field(default_factory=dict)
+    paths: dict[int, str] = field(default_factory=dict)
+    next_slot: int = 0
+    synced_at: float = -math.inf
+
+    def add(self, rel_path: str, entry: _FileEntry, trigrams: Iterable[int]) -> None:
+        postings = self.postings
+        slot = entry.slot
+        for trigram in trigrams:
+            slots = postings.get(trigram)
+            if slots is None:
+                postings[trigram] = array("I", (slot,))
+            else:
+                slots.append(slot)
+        self.entries[rel_path] = entry
+        self.paths[slot] = rel_path
+
+    def allocate_slot(self) -> int:
+        slot = self.next_slot
+        self.next_slot += 1
+        return slot
+
+
+class CodeSearchIndex:
+    """Per-project trigram index, persisted under `index_dir` when one is given.
+
+    Every indexed file contributes the case-folded trigrams of the ASCII
+    words in its text. A query is narrowed to the files holding all trigrams of its
+    required literals (the whole string for substring queries; literals every
+    match must contain for regexes) and only those files are read and matched.
+    Queries without a usable trigram scan every text file.
+
+    Each file's trigram set is stored with its mtime and size in a SQLite
+    file named after the project's resolved path, outside the project so it is
+    never listed or committed. The inverted index is rebuilt from those rows
+    when a project is first searched, so a restart re-reads only files that
+    changed. Without `index_dir` the rows are kept in memory. The index
+    is checked against the tree at most once per `refresh_interval_seconds`;
+    `update` reindexes a single written file right away.
+    """
+
+    def __init__(
+        self,
+        *,
+        index_dir: Path | None = None,
+        max_indexed_bytes: int = MAX_INDEXED_BYTES,
+        refresh_interval_seconds: float = REFRESH_INTERVAL_SECONDS,
+    ) -> None:
+        self._index_dir = index_dir
+        self._max_indexed_bytes = max_indexed_bytes
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._projects: dict[Path, _ProjectSearchIndex] = {}
+        self._lock = threading.Lock()
+
+    def search(
+        self,
+        project_path: Path,
+        list_files: Callable[[], Sequence[str]],
+        query: str,
+        *,
+        regex: bool = False,
+        ignore_case: bool = False,
+        max_matches: int | None = DEFAULT_MAX_MATCHES,
+    ) -> list[SearchMatch]:
+        """Return matching lines in path order.
+
+        Each file is matched as a whole, so a query may span lines (a substring
+        with a newline, or a regex such as `a\\s+b`); the result is the line the
+        match starts on, once per line. In regexes `^` and `$` match at line
+        boundaries. `list_files` returns the project's searchable relative
+        POSIX paths; it is only called when the index is due for a refresh.
+        Raises `ValueError` for an invalid regex.
+        """
+        pattern, trigrams = _compile_query(query, regex=regex, ignore_case=ignore_case)
+        with self._lock:
+            project = self._open(project_path)
+            now = time.monotonic()
+            if now - project.synced_at >= self._refresh_interval_seconds:
+                self._sync(project_path, project, list_files())
+                project.synced_at = now
+            candidates = _candidates(project, trigrams)
+        return _scan(project_path, candidates, pattern, max_matches)
+
+    def update(self, project_path: Path, rel_path: str) -> None:
+        """Reindex one file after a write; new files wait for the next refresh.
+
+        A new path is not added directly because it may be ignored; the
+        project is marked for refresh instead, which applies the listing rules.
+        """
+        with self._lock:
+            project = self._projects.get(project_path)
+            if project is None:
+                return
+            if rel_path not in project.entries:
+                project.synced_at = -math.inf
+                return
+            try:
+                stat = os.stat(project_path / rel_path)
+            except OSError:
+                project.synced_at = -math.inf
+                return
+            with project.conn:
+                self._index_file(project_path, project, rel_path, stat)
+
+    def forget(self, project_path: Path) -> None:
+        """Close the project's index; it is reopened from disk on the next search."""
+        with self._lock:
+            project = self._projects.pop(project_path, None)
+        if project is not None:
+            project.conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            projects = list(self._projects.values())
+            self._projects.clear()
+        for project in projects:
+            project.conn.close()
+
+    def _open(self, project_path: Path) -> _ProjectSearchIndex:
+        project = self._projects.get(project_path)
+        if project is None:
+            project = _ProjectSearchIndex(conn=_connect(self._index_path(project_path)))
+            _load(project)
+            self._projects[project_path] = project
+        return project
+
+    def _index_path(self, project_path: Path) -> Path | None:
+        if self._index_dir is None:
+            return None
+        key = hashlib.sha256(os.fsencode(project_path.resolve())).hexdigest()[:16]
+        return self._index_dir / f"{key}.sqlite3"
+
+    def _sync(
+        self,
+        project_path: Path,
+        project: _ProjectSearchIndex,
+        rel_paths: Sequence[str],
+    ) -> None:
+        root = os.fspath(project_path)
+        listed = set(rel_paths)
+        with project.conn:
+            for rel_path in project.entries.keys() - listed:
+                _remove_file(project, rel_path)
+            for rel_path in rel_paths:
+                try:
+                    stat = os.stat(os.path.join(root, rel_path))
+                except OSError:
+                    if rel_path in project.entries:
+                        _remove_file(project, rel_path)
+                    continue
+                entry = project.entries.get(rel_path)
+                if (
+                    entry is not None
+                    and entry.mtime_ns == stat.st_mtime_ns
+                    and entry.size == stat.st_size
+                    and entry.indexed_ns - stat.st_mtime_ns >= _RACY_WINDOW_NS
+                ):
+                    continue
+                self._index_file(project_path, project, rel_path, stat)
+        dead_slots = project.next_slot - len(project.paths)
+        if dead_slots > max(len(project.paths), _COMPACT_MIN_DEAD_SLOTS):
+            _load(project)
+
+    def _index_file(
+        self,
+        project_path: Path,
+        project: _ProjectSearchIndex,
+        rel_path: str,
+        stat: os.stat_result,
+    ) -> None:
+        state: FileState = "indexed"
+        trigrams = array("I")
+        indexed_ns = time.time_ns()
+        if stat.st_size > self._max_indexed_bytes:
+            state = "binary" if _looks_binary(project_path / rel_path) else "large"
+        else:
+            try:
+                text = (project_path / rel_path).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                state = "binary"
+            else:
+                trigrams = array("I", sorted(_trigrams(_fold(text))))
+        project.conn.execute(
+            "INSERT OR REPLACE INTO files (path, mtime_ns, size, indexed_ns, state, trigrams) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                rel_path,
+                stat.st_mtime_ns,
+                stat.st_size,
+                indexed_ns,
+                state,
+                zlib.compress(trigrams.tobytes()),
+            ),
+        )
+        previous = project.entries.get(rel_path)
+        if previous is not None:
+            del project.paths[previous.slot]
+        entry = _FileEntry(
+            project.allocate_slot(),
+            stat.st_mtime_ns,
+            stat.st_size,
+            indexed_ns,
+            state,
+        )
+        project.add(rel_path, entry, trigrams)
+
+
+def _connect(path: Path | None) -> sqlite3.Connection:
+    # The index is a cache: an unwritable location falls back to an in-memory one.
+    conn: sqlite3.Connection | None = None
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+        except (OSError, sqlite3.Error):
+            conn = None
+    if conn is None:
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    (version,) = conn.execute("PRAGMA user_version").fetchone()
+    if version != _SCHEMA_VERSION:
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS files")
+            conn.execute(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    return conn
+
+
+def _load(project: _ProjectSearchIndex) -> None:
+    """(Re)build the in-memory index from the stored rows, dropping stale postings."""
+    project.entries.clear()
+    project.postings.clear()
+    project.paths.clear()
+    project.next_slot = 0
+    rows = project.conn.execute(
+        "SELECT path, mtime_ns, size, indexed_ns, state, trigrams FROM files"
+    )
+    for path, mtime_ns, size, indexed_ns, state, blob in rows:
+        trigrams = array("I")
+        trigrams.frombytes(zlib.decompress(blob))
+        entry = _FileEntry(project.allocate_slot(), mtime_ns, size, indexed_ns, state)
+        project.add(path, entry, trigrams)
+
+
+def _looks_binary(path: Path) -> bool:
+    try:
+        with path.open("rb") as handle:
+            return b"\0" in handle.read(_BINARY_SNIFF_BYTES)
+    except OSError:
+        return True
+
+
+def _remove_file(project: _ProjectSearchIndex, rel_path: str) -> None:
+    entry = project.entries.pop(rel_path)
+    del project.paths[entry.slot]
+    project.conn.execute("DELETE FROM files WHERE path = ?", (rel_path,))
+
+
+def _candidates(project: _ProjectSearchIndex, trigrams: set[int]) -> list[str]:
+    paths = project.paths
+    if not trigrams:
+        return sorted(path for path, entry in project.entries.items() if entry.state != "binary")
+    # Oversized files are not indexed, so they stay candidates for every query.
+    large = [path for path, entry in project.entries.items() if entry.state == "large"]
+    postings = [project.postings.get(trigram) for trigram in trigrams]
+    if any(slots is None for slots in postings):
+        return sorted(large)
+    ordered = sorted((slots for slots in postings if slots is not None), key=len)
+    slots = set(ordered[0])
+    for other in ordered[1:]:
+        slots.intersection_update(other)
+        if not slots:
+            break
+    return sorted([paths[slot] for slot in slots if slot in paths] + large)
+
+
+def _scan(
+    project_path: Path,
+    rel_paths: Sequence[str],
+    pattern: re.Pattern[str],
+    max_matches: int | None,
+) -> list[SearchMatch]:
+    matches: list[SearchMatch] = []
+    for rel_path in rel_paths:
+        try:
+            text = (project_path / rel_path).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        number = 1
+        position = 0  # start of line `number`
+        # Each search starts at a line start, so it finds the first match on
+        # the next matching line even where an earlier match ran into it.
+        while (found := pattern.search(text, position)) is not None:
+            start = found.start()
+            number += text.count("\n", position, start)
+            position = text.rfind("\n", 0, start) + 1
+            end = text.find("\n", start)
+            if end == -1:
+                end = len(text)
+            line = text[position:end].removesuffix("\r")
+            matches.append(
+                SearchMatch(
+                    path=rel_path,
+                    line=number,
+                    column=start - position + 1,
+                    snippet=_snippet(line, start - position),
+                )
+            )
+            if max_matches is not None and len(matches) >= max_matches:
+                return matches
+            if end == len(text):
+                break
+            number += 1
+            position = end + 1
+    return matches
+
+
+def _snippet(line: str, start: int) -> str:
+    if len(line) <= MAX_SNIPPET_CHARS:
+        return line
+    begin = max(0, min(start - MAX_SNIPPET_CHARS // 4, len(line) - MAX_SNIPPET_CHARS))
+    return line[begin : begin + MAX_SNIPPET_CHARS]
+
+
+def _compile_query(
+    query: str,
+    *,
+    regex: bool,
+    ignore_case: bool,
+) -> tuple[re.Pattern[str], set[int]]:
+    flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+    if not regex:
+        return re.compile(re.escape(query), flags), _trigrams(_fold(query))
+    try:
+        pattern = re.compile(query, flags)
+    except re.error as exc:
+        msg = f"Invalid regex: {exc}"
+        raise ValueError(msg) from exc
+    trigrams: set[int] = set()
+    for literal in _required_literals(pattern):
+        trigrams |= _trigrams(_fold(literal))
+    return pattern, trigrams
+
+
+def _required_literals(pattern: re.Pattern[str]) -> list[str]:
+    """Return literal runs that every match of `pattern` must contain.
+
+    The pattern source is scanned directly. Only plain concatenation is
+    followed: alternations, classes, escapes, lookarounds and optional repeats
+    end a run and contribute nothing, so the result errs towards fewer
+    literals (more candidate files), never towards missed matches.
+    """
+    if pattern.flags & re.VERBOSE:
+        return []
+    literals, _ = _sequence_literals(pattern.pattern, 0)
+    return literals
+
+
+def _sequence_literals(source: str, index: int) -> tuple[list[str], int]:
+    """Scan from `index` to the closing `)` or the end; return literals and the next index."""
+    literals: list[str] = []
+    run: list[str] = []
+    alternates = False
+
+    def flush() -> None:
+        if run:
+            literals.append("".join(run))
+            run.clear()
+
+    while index < len(source):
+        char = source[index]
+        index += 1
+        if char == ")":
+            break
+        if char == "(":
+            flush()
+            required = True
+            if source.startswith("?#", index):
+                index = source.find(")", index) + 1 or len(source)
+                continue
+            if source.startswith("?", index):
+                prefix = _REQUIRED_GROUP_PREFIX.match(source, index)
+                # Lookarounds, conditionals, back-references and flag groups.
+                required = prefix is not None
+                index = prefix.end() if prefix is not None else index + 1
+            inner, index = _sequence_literals(source, index)
+            if required and not source.startswith(("?", "*", "{"), index):
+                literals.extend(inner)
+            continue
+        if char == "{" and (quantifier := _BRACE_QUANTIFIER.match(source, index - 1)):
+            index = quantifier.end()
+            char = "*"
+        if char in "?*":
+            if run:
+                run.pop()
+        elif char == "|":
+            alternates = True
+        elif char == "\\":
+            index = _escape_end(source, index)
+        elif char == "[":
+            index = _class_end(source, index)
+        elif char not in ".^$+{":
+            run.append(char)
+            continue
+        flush()
+    flush()
+    return ([] if alternates else literals), index
+
+
+def _escape_end(source: str, index: int) -> int:
+    escaped = source[index : index + 1]
+    index += 1
+    if escaped in _ESCAPE_DIGITS:
+        return index + _ESCAPE_DIGITS[escaped]
+    if escaped == "N":
+        return source.find("}", index) + 1 or len(source)
+    if escaped.isdigit():
+        # Octal escapes and group references; skipping a literal digit is harmless.
+        for _ in range(2):
+            if index < len(source) and source[index].isdigit():
+                index += 1
+    return index
+
+
+def _class_end(source: str, index: int) -> int:
+    if source.startswith("^", index):
+        index += 1
+    if source.startswith("]", index):
+        index += 1
+    while index < len(source) and source[index] != "]":
+        index += 2 if source[index] == "\\" else 1
+    return index + 1
+
+
+def _fold(text: str) -> str:
+    return text.translate(_FOLD_TABLE).lower()
+
+
+def _trigrams(text: str) -> set[int]:
+    # Only trigrams inside runs of ASCII word characters are kept, for indexed
+    # text and queries alike: any three such characters in a query literal lie
+    # inside one run of the matched text too, so no match is filtered out. ASCII
+    # case folding is per character, and taking words first keeps this cheap,
+    # since code repeats the same identifiers many times.
+    grams: set[str] = set()
+    for word in set(_WORD_RUN.findall(text)):
+        grams.update(word[index : index + 3] for index in range(len(word) - 2))
+    return {(ord(gram[0]) << 16) | (ord(gram[1]) << 8) | ord(gram[2]) for gram in grams}
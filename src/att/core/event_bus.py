@@ -0,0 +1,102 @@
+"""In-process fan-out of persisted ATT events to live subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Iterable, Sequence
+
+from att.models.events import ATTEvent, EventType
+
+
+class EventSubscription:
+    """Bounded per-client queue of events for one project.
+
+    When a client falls behind, the oldest queued events are dropped and
+    counted so the client can be told it lagged instead of stalling publishers.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        event_types: Iterable[EventType] | None,
+        *,
+        max_queue_size: int,
+    ) -> None:
+        self.project_id = project_id
+        self.event_types = frozenset(event_types) if event_types else None
+        self._loop = asyncio.get_running_loop()
+        self._events: deque[ATTEvent] = deque(maxlen=max(1, max_queue_size))
+        self._ready = asyncio.Event()
+        self._dropped = 0
+
+    def matches(self, event: ATTEvent) -> bool:
+        if event.project_id != self.project_id:
+            return False
+        return self.event_types is None or event.event_type in self.event_types
+
+    def offer(self, event: ATTEvent) -> None:
+        """Queue `event` without blocking; safe to call from any thread or loop."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._enqueue(event)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._enqueue, event)
+
+    async def get(self) -> ATTEvent:
+        while not self._events:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._events.popleft()
+
+    def take_dropped(self) -> int:
+        """Return and reset the number of events dropped since the last call."""
+        dropped, self._dropped = self._dropped, 0
+        return dropped
+
+    def _enqueue(self, event: ATTEvent) -> None:
+        if len(self._events) == self._events.maxlen:
+            self._dropped += 1
+        self._events.append(event)
+        self._ready.set()
+
+
+class EventBus:
+    """Publish persisted events to per-project subscribers."""
+
+    def __init__(self, *, max_queue_size: int = 256) -> None:
+        self._max_queue_size = max_queue_size
+        self._subscriptions: dict[str, set[EventSubscription]] = {}
+
+    def subscribe(
+        self,
+        project_id: str,
+        event_types: Iterable[EventType] | None = None,
+    ) -> EventSubscription:
+        subscription = EventSubscription(
+            project_id,
+            event_types,
+            max_queue_size=self._max_queue_size,
+        )
+        self._subscriptions.setdefault(project_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        subscribers = self._subscriptions.get(subscription.project_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            self._subscriptions.pop(subscription.project_id, None)
+
+    def subscriber_count(self, project_id: str) -> int:
+        return len(self._subscriptions.get(project_id, ()))
+
+    def publish(self, events: Sequence[ATTEvent]) -> None:
+        for event in events:
+            for subscription in tuple(self._subscriptions.get(event.project_id, ())):
+                if subscription.matches(event):
+                    subscription.offer(event)
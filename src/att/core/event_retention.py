@@ -0,0 +1,234 @@
+"""Retention, compaction and archival for the ATT event log."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import gzip
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from att.db.store import SQLiteStore
+from att.models.events import EventType
+
+type Sleeper = Callable[[float], Awaitable[None]]
+
+RETENTION_DAYS_ENV = "ATT_EVENT_RETENTION_DAYS"
+RETENTION_RULES_ENV = "ATT_EVENT_RETENTION_RULES"
+ARCHIVE_DIR_ENV = "ATT_EVENT_ARCHIVE_DIR"
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionRule:
+    """Maximum raw-event age for a project, an event type, or both."""
+
+    max_age: timedelta
+    project_id: str | None = None
+    event_type: EventType | None = None
+
+    def matches(self, project_id: str, event_type: EventType) -> bool:
+        return (self.project_id is None or self.project_id == project_id) and (
+            self.event_type is None or self.event_type == event_type
+        )
+
+    @property
+    def specificity(self) -> int:
+        return (2 if self.project_id is not None else 0) + (1 if self.event_type is not None else 0)
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionPolicy:
+    """Raw-event retention settings.
+
+    The most specific matching rule wins (project and type, then project, then
+    type); `default_max_age` applies otherwise. `None` keeps events forever.
+    """
+
+    default_max_age: timedelta | None = None
+    rules: tuple[RetentionRule, ...] = ()
+    archive_dir: Path | None = None
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str]) -> RetentionPolicy:
+        """Read a policy from `ATT_EVENT_RETENTION_*` and `ATT_EVENT_ARCHIVE_DIR`.
+
+        `ATT_EVENT_RETENTION_DAYS` sets the default maximum age and
+        `ATT_EVENT_RETENTION_RULES` adds per-type ages as comma-separated
+        `event_type=days` pairs, e.g. `test.passed=7,code.changed=30`.
+        """
+        days = environ.get(RETENTION_DAYS_ENV, "").strip()
+        rules: list[RetentionRule] = []
+        for entry in environ.get(RETENTION_RULES_ENV, "").split(","):
+            if not entry.strip():
+                continue
+            name, separator, value = entry.partition("=")
+            try:
+                event_type = EventType(name.strip())
+            except ValueError as exc:
+                msg = f"Unknown event type in {RETENTION_RULES_ENV}: {name.strip()!r}"
+                raise ValueError(msg) from exc
+            if not separator:
+                msg = f"Expected event_type=days in {RETENTION_RULES_ENV}: {entry.strip()!r}"
+                raise ValueError(msg)
+            rules.append(
+                RetentionRule(max_age=_days(RETENTION_RULES_ENV, value), event_type=event_type)
+            )
+        archive_dir = environ.get(ARCHIVE_DIR_ENV, "").strip()
+        return cls(
+            default_max_age=_days(RETENTION_DAYS_ENV, days) if days else None,
+            rules=tuple(rules),
+            archive_dir=Path(archive_dir) if archive_dir else None,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.default_max_age is not None or bool(self.rules)
+
+    def max_age_for(self, project_id: str, event_type: EventType) -> timedelta | None:
+        matching = [rule for rule in self.rules if rule.matches(project_id, event_type)]
+        if not matching:
+            return self.default_max_age
+        return max(matching, key=lambda rule: rule.specificity).max_age
+
+
+def _days(name: str, value: str) -> timedelta:
+    try:
+        days = float(value)
+    except ValueError:
+        days = -1.0
+    if days <= 0:
+        msg = f"{name} needs a positive number of days, got {value.strip()!r}"
+        raise ValueError(msg)
+    return timedelta(days=days)
+
+
+@dataclass(slots=True)
+class CompactionResult:
+    """Outcome of compacting one project and event type."""
+
+    project_id: str
+    event_type: EventType
+    cutoff: datetime
+    compacted: int
+    archive_path: Path | None = None
+
+
+class EventRetentionManager:
+    """Apply a retention policy to the event log, once or on a background interval."""
+
+    def __init__(
+        self,
+        store: SQLiteStore,
+        policy: RetentionPolicy,
+        *,
+        interval_seconds: float = 3600.0,
+        now_provider: Callable[[], datetime] | None = None,
+        sleeper: Sleeper | None = None,
+    ) -> None:
+        self._store = store
+        self._policy = policy
+        self._interval_seconds = interval_seconds
+        self._now = now_provider or (lambda: datetime.now(UTC))
+        self._sleep = sleeper or asyncio.sleep
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def policy(self) -> RetentionPolicy:
+        return self._policy
+
+    async def compact_once(self) -> list[CompactionResult]:
+        """Roll expired raw events into daily summaries, archiving them first if configured."""
+        if not self._policy.enabled:
+            return []
+        now = self._now()
+        results: list[CompactionResult] = []
+        for project_id, event_type in await self._store.event_groups():
+            max_age = self._policy.max_age_for(project_id, event_type)
+            if max_age is None:
+                continue
+            cutoff = now - max_age
+            expired = await self._store.count_events(
+                project_id=project_id,
+                event_type=event_type,
+                until=cutoff,
+            )
+            if expired == 0:
+                continue
+            archive_path = None
+            if self._policy.archive_dir is not None:
+                archive_path = await self._archive(
+                    self._policy.archive_dir,
+                    project_id,
+                    event_type,
+                    cutoff,
+                )
+            compacted = await self._store.compact_events(
+                project_id=project_id,
+                event_type=event_type,
+                until=cutoff,
+            )
+            results.append(
+                CompactionResult(
+                    project_id=project_id,
+                    event_type=event_type,
+                    cutoff=cutoff,
+                    compacted=compacted,
+                    archive_path=archive_path,
+                )
+            )
+        return results
+
+    def start(self) -> None:
+        """Start the background compaction loop if the policy retains anything."""
+        if not self._policy.enabled or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        task = self._task
+        self._task = None
+        if task is None or task.done():
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def _run(self) -> None:
+        while True:
+            # A failed pass is retried on the next interval.
+            with contextlib.suppress(Exception):
+                await self.compact_once()
+            await self._sleep(self._interval_seconds)
+
+    async def _archive(
+        self,
+        archive_dir: Path,
+        project_id: str,
+        event_type: EventType,
+        cutoff: datetime,
+    ) -> Path:
+        segment = (
+            archive_dir
+            / project_id
+            / f"{event_type.value}-{cutoff.strftime('%Y%m%dT%H%M%S%f')}.ndjson.gz"
+        )
+        await asyncio.to_thread(segment.parent.mkdir, parents=True, exist_ok=True)
+        handle = await asyncio.to_thread(gzip.open, segment, "wt", encoding="utf-8")
+        try:
+            batch: list[str] = []
+            async for record in self._store.iter_event_records(
+                project_id=project_id,
+                event_type=event_type,
+                until=cutoff,
+            ):
+                batch.append(record.to_json() + "\n")
+                if len(batch) >= 500:
+                    await asyncio.to_thread(handle.writelines, batch)
+                    batch = []
+            if batch:
+                await asyncio.to_thread(handle.writelines, batch)
+        finally:
+            await asyncio.to_thread(handle.close)
+        return segment
@@ -0,0 +1,313 @@
+"""Cached, ignore-aware file listing for project trees."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from att.core.ignore import IgnoreRules, is_ignored
+
+IGNORE_FILES = (".gitignore", ".attignore")
+ALWAYS_SKIPPED_DIRS = frozenset({".git"})
+# Applied before any project ignore file, so a `!pattern` there re-includes them.
+DEFAULT_IGNORE_PATTERNS = (
+    ".att/",
+    ".venv/",
+    "venv/",
+    "__pycache__/",
+    "node_modules/",
+    ".mypy_cache/",
+    ".pytest_cache/",
+    ".ruff_cache/",
+    ".tox/",
+    "*.egg-info/",
+    # Packaging outputs only at the project root; `src/pkg/build/` is source.
+    "/build/",
+    "/dist/",
+)
+_BINARY_SNIFF_BYTES = 8192
+# Directories modified this recently are rescanned on every refresh, since an
+# entry added in the same timestamp tick would not change their mtime again.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class FileFilter:
+    """Content filters applied to listed files; both are off by default."""
+
+    max_bytes: int | None = None
+    skip_binary: bool = False
+
+    @property
+    def active(self) -> bool:
+        return self.max_bytes is not None or self.skip_binary
+
+
+@dataclass(slots=True)
+class FilePage:
+    """One page of a project listing.
+
+    Cursors are positions in the sorted, ignore-filtered index; content filters
+    are applied within the page, so a page may hold fewer than `limit` files.
+    """
+
+    files: list[str]
+    cursor: int
+    next_cursor: int | None
+    total: int
+
+
+@dataclass(slots=True)
+class _Directory:
+    mtime_ns: int
+    scanned_ns: int
+    entries: tuple[tuple[str, bool], ...]
+    ignore_mtimes_ns: tuple[int | None, ...]
+    rules: tuple[IgnoreRules, ...]
+
+
+@dataclass(slots=True)
+class _ProjectIndex:
+    directories: dict[str, _Directory] = field(default_factory=dict)
+    rel_paths: list[str] = field(default_factory=list)
+    files: list[Path] = field(default_factory=list)
+
+
+class FileIndex:
+    """Per-project file listing, built once and refreshed incrementally.
+
+    Each directory's entries are cached with its mtime. A refresh stats every
+    indexed directory but only lists the ones whose mtime changed (or whose
+    ignore files did), so an unchanged tree costs one stat per directory
+    rather than one per file. Directories are read with `os.scandir`, and
+    `.git`, `ignore_patterns` and paths matched by `.gitignore`/`.attignore`
+    files are pruned before they are descended into. `invalidate` never waits
+    for a refresh in progress; it queues the directory for the next one.
+    """
+
+    def __init__(self, *, ignore_patterns: Sequence[str] = DEFAULT_IGNORE_PATTERNS) -> None:
+        defaults = IgnoreRules.parse("", "\n".join(ignore_patterns))
+        self._base_chain = (defaults,) if defaults.patterns else ()
+        self._projects: dict[Path, _ProjectIndex] = {}
+        self._lock = threading.Lock()
+        # Held only to queue or take invalidations, never during a refresh.
+        self._invalidations_lock = threading.Lock()
+        self._invalidated_dirs: dict[Path, set[str]] = {}
+        self._invalidated_projects: set[Path] = set()
+
+    def list_files(self, project_path: Path) -> list[Path]:
+        """Return the project's non-ignored files as sorted paths under `project_path`."""
+        with self._lock:
+            return list(self._refreshed(project_path).files)
+
+    def page(
+        self,
+        project_path: Path,
+        *,
+        cursor: int = 0,
+        limit: int | None = None,
+        file_filter: FileFilter | None = None,
+    ) -> FilePage:
+        """Return up to `limit` index positions from `cursor` as relative POSIX paths."""
+        with self._lock:
+            rel_paths = self._refreshed(project_path).rel_paths
+        start = max(cursor, 0)
+        end = len(rel_paths) if limit is None else min(start + max(limit, 0), len(rel_paths))
+        window = rel_paths[start:end]
+        if file_filter is not None and file_filter.active:
+            window = [path for path in window if _accepts(project_path / path, file_filter)]
+        return FilePage(
+            files=window,
+            cursor=start,
+            next_cursor=end if end < len(rel_paths) else None,
+            total=len(rel_paths),
+        )
+
+    def iter_files(
+        self,
+        project_path: Path,
+        *,
+        file_filter: FileFilter | None = None,
+    ) -> Iterator[Path]:
+        """Yield the project's files lazily, applying `file_filter` as each one is reached."""
+        with self._lock:
+            files = self._refreshed(project_path).files
+        for path in files:
+            if file_filter is None or not file_filter.active or _accepts(path, file_filter):
+                yield path
+
+    def invalidate(self, project_path: Path, rel_dir: str | None = None) -> None:
+        """Force `rel_dir` (or the whole project) to be listed again on the next refresh."""
+        if project_path not in self._projects:
+            return
+        with self._invalidations_lock:
+            if rel_dir is None:
+                self._invalidated_projects.add(project_path)
+                self._invalidated_dirs.pop(project_path, None)
+                return
+            key = Path(rel_dir).as_posix()
+            self._invalidated_dirs.setdefault(project_path, set()).add("" if key == "." else key)
+
+    def _refreshed(self, project_path: Path) -> _ProjectIndex:
+        with self._invalidations_lock:
+            rebuild = project_path in self._invalidated_projects
+            self._invalidated_projects.discard(project_path)
+            rel_dirs = self._invalidated_dirs.pop(project_path, set())
+        if rebuild:
+            self._projects.pop(project_path, None)
+        index = self._projects.setdefault(project_path, _ProjectIndex())
+        for rel_dir in rel_dirs:
+            index.directories.pop(rel_dir, None)
+        if _refresh(project_path, index, self._base_chain):
+            # Snapshots are replaced, never mutated, so callers may hold them unlocked.
+            index.rel_paths = _walk(index.directories, "")
+            index.files = [project_path / rel_path for rel_path in index.rel_paths]
+        return index
+
+
+def _refresh(root: Path, index: _ProjectIndex, chain: tuple[IgnoreRules, ...]) -> bool:
+    seen: set[str] = set()
+    changed = _refresh_directory(os.fspath(root), "", chain, index.directories, seen, force=False)
+    stale = index.directories.keys() - seen
+    for rel_dir in stale:
+        del index.directories[rel_dir]
+    return changed or bool(stale) or not index.directories
+
+
+def _refresh_directory(
+    root: str,
+    rel_dir: str,
+    chain: tuple[IgnoreRules, ...],
+    directories: dict[str, _Directory],
+    seen: set[str],
+    *,
+    force: bool,
+) -> bool:
+    # Plain strings rather than Path objects: this runs once per directory.
+    path = os.path.join(root, rel_dir) if rel_dir else root
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return False
+    seen.add(rel_dir)
+    cached = directories.get(rel_dir)
+    ignore_mtimes_ns = _ignore_file_mtimes(path, mtime_ns, cached)
+    rules_changed = cached is None or cached.ignore_mtimes_ns != ignore_mtimes_ns
+    changed = False
+    if (
+        cached is None
+        or force
+        or rules_changed
+        or cached.mtime_ns != mtime_ns
+        or cached.scanned_ns - mtime_ns < _RACY_WINDOW_NS
+    ):
+        rules = _read_rules(path, rel_dir) if rules_changed or cached is None else cached.rules
+        scanned_ns = time.time_ns()
+        entries = _scan(path, rel_dir, (*chain, *rules))
+        changed = cached is None or cached.entries != entries or rules_changed
+        cached = _Directory(
+            mtime_ns=mtime_ns,
+            scanned_ns=scanned_ns,
+            entries=entries,
+            ignore_mtimes_ns=ignore_mtimes_ns,
+            rules=rules,
+        )
+        directories[rel_dir] = cached
+    child_chain = (*chain, *cached.rules)
+    for name, is_dir in cached.entries:
+        if is_dir:
+            child = f"{rel_dir}/{name}" if rel_dir else name
+            changed |= _refresh_directory(
+                root,
+                child,
+                child_chain,
+                directories,
+                seen,
+                force=force or rules_changed,
+            )
+    return changed
+
+
+def _ignore_file_mtimes(
+    path: str,
+    mtime_ns: int,
+    cached: _Directory | None,
+) -> tuple[int | None, ...]:
+    # An unchanged directory mtime means no ignore file was added or removed,
+    # so only existing ones need a stat to catch in-place edits.
+    unchanged = cached is not None and cached.mtime_ns == mtime_ns
+    mtimes: list[int | None] = []
+    for position, name in enumerate(IGNORE_FILES):
+        if unchanged and cached is not None and cached.ignore_mtimes_ns[position] is None:
+            mtimes.append(None)
+            continue
+        try:
+            mtimes.append(os.stat(os.path.join(path, name)).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def _read_rules(path: str, rel_dir: str) -> tuple[IgnoreRules, ...]:
+    # Later files win, so `.attignore` can override `.gitignore` in the same directory.
+    rules: list[IgnoreRules] = []
+    for name in IGNORE_FILES:
+        try:
+            with open(os.path.join(path, name), encoding="utf-8", errors="replace") as handle:
+                parsed = IgnoreRules.parse(rel_dir, handle.read())
+        except OSError:
+            continue
+        if parsed.patterns:
+            rules.append(parsed)
+    return tuple(rules)
+
+
+def _scan(path: str, rel_dir: str, chain: Sequence[IgnoreRules]) -> tuple[tuple[str, bool], ...]:
+    entries: list[tuple[str, bool]] = []
+    try:
+        with os.scandir(path) as iterator:
+            for entry in iterator:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if not is_dir and not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                if is_dir and entry.name in ALWAYS_SKIPPED_DIRS:
+                    continue
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if not is_ignored(chain, rel_path, is_dir=is_dir):
+                    entries.append((entry.name, is_dir))
+    except OSError:
+        return ()
+    return tuple(sorted(entries))
+
+
+def _walk(directories: dict[str, _Directory], rel_dir: str) -> list[str]:
+    files: list[str] = []
+    directory = directories.get(rel_dir)
+    if directory is None:
+        return files
+    for name, is_dir in directory.entries:
+        rel_path = f"{rel_dir}/{name}" if rel_dir else name
+        if is_dir:
+            files.extend(_walk(directories, rel_path))
+        else:
+            files.append(rel_path)
+    return files
+
+
+def _accepts(path: Path, file_filter: FileFilter) -> bool:
+    try:
+        if file_filter.max_bytes is not None and path.stat().st_size > file_filter.max_bytes:
+            return False
+        if file_filter.skip_binary:
+            with path.open("rb") as handle:
+                return b"\0" not in handle.read(_BINARY_SNIFF_BYTES)
+    except OSError:
+        return False
+    return True
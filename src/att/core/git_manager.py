@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
+from att.core.process import run_process
+
 
 @dataclass(slots=True)
 class GitResult:
@@ -16,29 +17,39 @@ class GitResult:
 
 
 class GitManager:
-    """Thin wrapper around git CLI."""
+    """Thin async wrapper around the git and gh CLIs.
+
+    Commands run as asyncio subprocesses, so a slow network call only blocks
+    its own request. A command that exceeds `timeout_seconds` is killed and
+    raises `RuntimeError`, like a failing command.
+    """
 
-    def status(self, project_path: Path) -> GitResult:
-        return self._run_git(project_path, "status", "--short")
+    def __init__(self, *, timeout_seconds: float | None = 300.0) -> None:
+        self._timeout_seconds = timeout_seconds
 
-    def commit(self, project_path: Path, message: str) -> GitResult:
-        self._run_git(project_path, "add", ".")
-        return self._run_git(project_path, "commit", "-m", message)
+    async def status(self, project_path: Path) -> GitResult:
+        return await self._run_git(project_path, "status", "--short")
 
-    def push(self, project_path: Path, remote: str = "origin", branch: str = "HEAD") -> GitResult:
-        return self._run_git(project_path, "push", remote, branch)
+    async def commit(self, project_path: Path, message: str) -> GitResult:
+        await self._run_git(project_path, "add", ".")
+        return await self._run_git(project_path, "commit", "-m", message)
 
-    def branch(self, project_path: Path, name: str, *, checkout: bool = True) -> GitResult:
+    async def push(
+        self, project_path: Path, remote: str = "origin", branch: str = "HEAD"
+    ) -> GitResult:
+        return await self._run_git(project_path, "push", remote, branch)
+
+    async def branch(self, project_path: Path, name: str, *, checkout: bool = True) -> GitResult:
         if checkout:
-            return self._run_git(project_path, "checkout", "-b", name)
-        return self._run_git(project_path, "branch", name)
+            return await self._run_git(project_path, "checkout", "-b", name)
+        return await self._run_git(project_path, "branch", name)
 
-    def log(self, project_path: Path, limit: int = 20) -> GitResult:
-        return self._run_git(project_path, "log", f"--max-count={limit}", "--oneline")
+    async def log(self, project_path: Path, limit: int = 20) -> GitResult:
+        return await self._run_git(project_path, "log", f"--max-count={limit}", "--oneline")
 
-    def actions(self, project_path: Path, limit: int = 10) -> GitResult:
+    async def actions(self, project_path: Path, limit: int = 10) -> GitResult:
         """Get GitHub Actions runs using gh CLI."""
-        return self._run_command(
+        return await self._run_command(
             project_path,
             "gh",
             "run",
@@ -49,7 +60,7 @@ class GitManager:
             "databaseId,status,conclusion,displayTitle,headBranch",
         )
 
-    def pr_create(
+    async def pr_create(
         self,
         project_path: Path,
         *,
@@ -72,9 +83,9 @@ class GitManager:
         ]
         if head:
             args.extend(["--head", head])
-        return self._run_command(project_path, *args)
+        return await self._run_command(project_path, *args)
 
-    def pr_merge(
+    async def pr_merge(
         self,
         project_path: Path,
         *,
@@ -87,13 +98,13 @@ class GitManager:
             "merge": "--merge",
             "rebase": "--rebase",
         }.get(strategy, "--squash")
-        return self._run_command(
+        return await self._run_command(
             project_path, "gh", "pr", "merge", pull_request, mode, "--delete-branch"
         )
 
-    def pr_reviews(self, project_path: Path, *, pull_request: str) -> GitResult:
+    async def pr_reviews(self, project_path: Path, *, pull_request: str) -> GitResult:
         """Get pull request reviews using gh CLI."""
-        return self._run_command(
+        return await self._run_command(
             project_path,
             "gh",
             "pr",
@@ -103,21 +114,20 @@ class GitManager:
             "reviews",
         )
 
-    @staticmethod
-    def _run_git(project_path: Path, *args: str) -> GitResult:
-        command = ["git", *args]
-        return GitManager._run_command(project_path, *command)
-
-    @staticmethod
-    def _run_command(project_path: Path, *command: str) -> GitResult:
-        completed = subprocess.run(
-            [*command],
-            cwd=project_path,
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-        output = (completed.stdout or "") + (completed.stderr or "")
+    async def _run_git(self, project_path: Path, *args: str) -> GitResult:
+        return await self._run_command(project_path, "git", *args)
+
+    async def _run_command(self, project_path: Path, *command: str) -> GitResult:
+        try:
+            completed = await run_process(
+                command,
+                cwd=project_path,
+                timeout_seconds=self._timeout_seconds,
+            )
+        except TimeoutError as exc:
+            msg = f"{' '.join(command)} timed out after {self._timeout_seconds}s"
+            raise RuntimeError(msg) from exc
+        output = completed.stdout + completed.stderr
         if completed.returncode != 0:
             msg = f"{' '.join(command)} failed: {output.strip()}"
             raise RuntimeError(msg)
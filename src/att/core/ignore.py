@@ -0,0 +1,123 @@
+"""gitignore-style path matching."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class IgnorePattern:
+    """One compiled gitignore pattern."""
+
+    regex: re.Pattern[str]
+    negated: bool
+    directory_only: bool
+
+
+@dataclass(frozen=True, slots=True)
+class IgnoreRules:
+    """Patterns from one ignore file, relative to the directory holding it.
+
+    `base` is that directory as a POSIX path relative to the project root,
+    empty for the root itself.
+    """
+
+    base: str
+    patterns: tuple[IgnorePattern, ...]
+
+    @classmethod
+    def parse(cls, base: str, text: str) -> IgnoreRules:
+        patterns = (_compile(line) for line in text.splitlines())
+        return cls(base=base, patterns=tuple(pattern for pattern in patterns if pattern))
+
+    def match(self, rel_path: str, *, is_dir: bool) -> bool | None:
+        """Return whether the last matching pattern ignores `rel_path`; None if none match."""
+        if self.base:
+            if not rel_path.startswith(f"{self.base}/"):
+                return None
+            rel_path = rel_path[len(self.base) + 1 :]
+        for pattern in reversed(self.patterns):
+            if pattern.directory_only and not is_dir:
+                continue
+            if pattern.regex.match(rel_path):
+                return not pattern.negated
+        return None
+
+
+def is_ignored(chain: Sequence[IgnoreRules], rel_path: str, *, is_dir: bool) -> bool:
+    """Apply ignore files from the deepest directory up; the first one that matches decides."""
+    for rules in reversed(chain):
+        verdict = rules.match(rel_path, is_dir=is_dir)
+        if verdict is not None:
+            return verdict
+    return False
+
+
+def _compile(line: str) -> IgnorePattern | None:
+    if line.endswith("\\ "):
+        line = line[:-2].rstrip(" ") + "\\ "
+    else:
+        line = line.rstrip(" ")
+    if not line or line.startswith("#"):
+        return None
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    elif line.startswith("\\"):
+        line = line[1:]
+    directory_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+    # A slash anywhere but the end anchors the pattern to the ignore file's directory.
+    anchored = "/" in line
+    body = _translate(line.lstrip("/"))
+    regex = body if anchored else f"(?:.*/)?{body}"
+    return IgnorePattern(
+        regex=re.compile(f"^{regex}$", re.DOTALL),
+        negated=negated,
+        directory_only=directory_only,
+    )
+
+
+def _translate(pattern: str) -> str:
+    parts: list[str] = []
+    index = 0
+    size = len(pattern)
+    while index < size:
+        at_segment_start = index == 0 or pattern[index - 1] == "/"
+        char = pattern[index]
+        if at_segment_start and pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+        elif at_segment_start and pattern.startswith("**", index) and index + 2 == size:
+            parts.append(".*")
+            index += 2
+        elif char == "*":
+            while index + 1 < size and pattern[index + 1] == "*":
+                index += 1
+            parts.append("[^/]*")
+            index += 1
+        elif char == "?":
+            parts.append("[^/]")
+            index += 1
+        elif char == "[":
+            end = pattern.find("]", index + 2)
+            if end == -1:
+                parts.append(re.escape(char))
+                index += 1
+                continue
+            members = pattern[index + 1 : end].replace("\\", "\\\\")
+            if members.startswith("!"):
+                members = f"^{members[1:]}"
+            parts.append(f"[{members}]")
+            index = end + 1
+        elif char == "\\" and index + 1 < size:
+            parts.append(re.escape(pattern[index + 1]))
+            index += 2
+        else:
+            parts.append(re.escape(char))
+            index += 1
+    return "".join(parts)
@@ -0,0 +1,64 @@
+"""Asyncio subprocess helpers shared by ATT managers."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import signal
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(slots=True)
+class ProcessOutput:
+    """Exit status and decoded output of a finished subprocess."""
+
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+async def run_process(
+    command: Sequence[str],
+    *,
+    cwd: Path,
+    timeout_seconds: float | None = None,
+    env: Mapping[str, str] | None = None,
+) -> ProcessOutput:
+    """Run `command` without blocking the event loop.
+
+    The child runs in its own process group. On timeout (`TimeoutError`) or
+    cancellation the whole group is killed and reaped before the error
+    propagates, so helpers such as ssh or credential managers do not linger.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        cwd=cwd,
+        env=dict(env) if env is not None else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=True,
+    )
+    try:
+        async with asyncio.timeout(timeout_seconds):
+            stdout, stderr = await process.communicate()
+    except BaseException:
+        await kill_process_group(process)
+        raise
+    return ProcessOutput(
+        returncode=process.returncode if process.returncode is not None else -1,
+        stdout=stdout.decode("utf-8", errors="replace"),
+        stderr=stderr.decode("utf-8", errors="replace"),
+    )
+
+
+async def kill_process_group(process: asyncio.subprocess.Process) -> None:
+    """SIGKILL `process` and its process group, then wait for it to exit."""
+    if process.returncode is None:
+        with contextlib.suppress(ProcessLookupError, PermissionError):
+            os.killpg(process.pid, signal.SIGKILL)
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+    await process.wait()
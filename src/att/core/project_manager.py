@@ -22,11 +22,33 @@ class CreateProjectInput:
     nat_config_path: Path | None = None
 
 
+@dataclass(slots=True)
+class ProjectCacheStats:
+    """Project lookup cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+
 class ProjectManager:
-    """Manage registered projects."""
+    """Manage registered projects.
+
+    Lookups are served from an in-memory cache that `create`, `clone` and
+    `delete` write through, so projects must only be changed via this manager.
+    """
 
     def __init__(self, store: SQLiteStore) -> None:
         self._store = store
+        self._cache: dict[str, Project] = {}
+        # Bumped on every write so a lookup racing a write cannot cache stale data.
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def cache_stats(self) -> ProjectCacheStats:
+        return ProjectCacheStats(hits=self._hits, misses=self._misses, size=len(self._cache))
 
     async def create(self, payload: CreateProjectInput) -> Project:
         project = Project(
@@ -36,6 +58,7 @@ class ProjectManager:
             nat_config_path=payload.nat_config_path,
         )
         await self._store.upsert_project(project)
+        self._remember(project)
         await self._store.append_event(
             ATTEvent(
                 project_id=project.id,
@@ -71,6 +94,7 @@ class ProjectManager:
             status=ProjectStatus.CLONED,
         )
         await self._store.upsert_project(project)
+        self._remember(project)
         await self._store.append_event(
             ATTEvent(
                 project_id=project.id,
@@ -85,7 +109,7 @@ class ProjectManager:
         return project
 
     async def download(self, project_id: str, archive_basename: Path | None = None) -> Path:
-        project = await self._store.get_project(project_id)
+        project = await self.get(project_id)
         if project is None:
             msg = f"Project not found: {project_id}"
             raise ValueError(msg)
@@ -106,7 +130,22 @@ class ProjectManager:
         return await self._store.list_projects()
 
     async def get(self, project_id: str) -> Project | None:
-        return await self._store.get_project(project_id)
+        cached = self._cache.get(project_id)
+        if cached is not None:
+            self._hits += 1
+            return cached.model_copy()
+        self._misses += 1
+        generation = self._generation
+        project = await self._store.get_project(project_id)
+        if project is not None and generation == self._generation:
+            self._cache[project_id] = project.model_copy()
+        return project
 
     async def delete(self, project_id: str) -> None:
         await self._store.delete_project(project_id)
+        self._generation += 1
+        self._cache.pop(project_id, None)
+
+    def _remember(self, project: Project) -> None:
+        self._generation += 1
+        self._cache[project.id] = project.model_copy()
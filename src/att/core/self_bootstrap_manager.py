@@ -198,7 +198,7 @@ class SelfBootstrapManager:
         rollback_target_release_id = self._resolve_rollback_release_id(request, release_metadata)
         release_metadata_source = release_metadata.source if release_metadata is not None else None
 
-        self._git.branch(request.project_path, branch_name, checkout=True)
+        await self._git.branch(request.project_path, branch_name, checkout=True)
 
         workflow = await self._orchestrator.run_change_workflow(
             project_id=request.project_id,
@@ -232,7 +232,7 @@ class SelfBootstrapManager:
                 rollback_deployment_context=request.deployment_context,
             )
 
-        self._git.push(request.project_path, "origin", branch_name)
+        await self._git.push(request.project_path, "origin", branch_name)
 
         if request.create_pr and self._pr_creator is not None:
             pr_url = await self._pr_creator(request.project_id, branch_name)
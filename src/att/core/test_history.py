@@ -0,0 +1,121 @@
+"""Per-test outcome and duration statistics across recorded runs."""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from att.models.test_run import TestCaseResult, TestStats
+
+DEFAULT_RECENT_RUNS = 5
+REGRESSION_RATIO = 1.5
+REGRESSION_MIN_SECONDS = 0.05
+_FAILING_OUTCOMES = frozenset({"failed", "error"})
+_SKIPPED_OUTCOMES = frozenset({"skipped", "xfailed"})
+
+
+@dataclass(slots=True)
+class TestHistoryReport:
+    """Slowest, flakiest and newly slower tests of a project."""
+
+    __test__ = False  # not a pytest test class
+
+    runs: int
+    slowest: list[TestStats]
+    flaky: list[TestStats]
+    regressions: list[TestStats]
+
+
+def summarize_test_history(
+    history: Sequence[TestCaseResult],
+    *,
+    recent_runs: int = DEFAULT_RECENT_RUNS,
+) -> list[TestStats]:
+    """Aggregate chronological per-test results into one `TestStats` per node ID.
+
+    Skipped and xfailed results are ignored. A flip is a change between passing
+    and failing on consecutive runs, so `flake_rate` is flips per transition.
+    Durations of the latest `recent_runs` results are compared to the older
+    ones as the baseline.
+    """
+    by_nodeid: dict[str, list[TestCaseResult]] = {}
+    for result in history:
+        if result.outcome not in _SKIPPED_OUTCOMES:
+            by_nodeid.setdefault(result.nodeid, []).append(result)
+
+    stats: list[TestStats] = []
+    for nodeid, results in by_nodeid.items():
+        failing = [result.outcome in _FAILING_OUTCOMES for result in results]
+        flips = sum(previous != current for previous, current in itertools.pairwise(failing))
+        durations = [result.duration_seconds for result in results]
+        recent = durations[-recent_runs:]
+        baseline = durations[:-recent_runs]
+        stats.append(
+            TestStats(
+                nodeid=nodeid,
+                runs=len(results),
+                failures=sum(failing),
+                flips=flips,
+                failure_rate=sum(failing) / len(results),
+                flake_rate=flips / (len(results) - 1) if len(results) > 1 else 0.0,
+                mean_duration_seconds=sum(durations) / len(durations),
+                max_duration_seconds=max(durations),
+                recent_mean_duration_seconds=sum(recent) / len(recent),
+                baseline_mean_duration_seconds=sum(baseline) / len(baseline) if baseline else None,
+                last_outcome=results[-1].outcome,
+            )
+        )
+    return stats
+
+
+def build_test_history_report(
+    stats: Sequence[TestStats],
+    *,
+    runs: int,
+    limit: int,
+) -> TestHistoryReport:
+    """Rank summarized tests into the slowest, flaky and duration-regression lists."""
+    slowest = sorted(stats, key=lambda item: (-item.mean_duration_seconds, item.nodeid))
+    flaky = sorted(
+        (item for item in stats if item.flips),
+        key=lambda item: (-item.flake_rate, -item.flips, item.nodeid),
+    )
+    regressions = sorted(
+        (item for item in stats if _regressed(item)),
+        key=lambda item: (
+            -(item.recent_mean_duration_seconds - (item.baseline_mean_duration_seconds or 0.0)),
+            item.nodeid,
+        ),
+    )
+    return TestHistoryReport(
+        runs=runs,
+        slowest=slowest[:limit],
+        flaky=flaky[:limit],
+        regressions=regressions[:limit],
+    )
+
+
+def failing_first(stats: Sequence[TestStats]) -> list[str]:
+    """Return node IDs of tests that have failed, most likely to fail again first.
+
+    Tests whose latest result failed come before those that failed earlier;
+    within each group a higher failure rate ranks first.
+    """
+    failed = [item for item in stats if item.failures]
+    failed.sort(
+        key=lambda item: (
+            item.last_outcome not in _FAILING_OUTCOMES,
+            -item.failure_rate,
+            item.nodeid,
+        )
+    )
+    return [item.nodeid for item in failed]
+
+
+def _regressed(item: TestStats) -> bool:
+    baseline = item.baseline_mean_duration_seconds
+    if baseline is None:
+        return False
+    recent = item.recent_mean_duration_seconds
+    return recent - baseline >= REGRESSION_MIN_SECONDS and recent >= baseline * REGRESSION_RATIO
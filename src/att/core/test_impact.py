@@ -0,0 +1,203 @@
+"""Select the tests affected by a change from the project's import graph."""
+
+from __future__ import annotations
+
+import ast
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+
+_SKIPPED_DIRS = frozenset({"__pycache__", "node_modules", "build", "dist", "venv", "site-packages"})
+_SOURCE_ROOTS = ("", "src")
+
+
+@dataclass(slots=True)
+class _ModuleImports:
+    mtime_ns: int
+    size: int
+    imports: frozenset[str]
+
+
+@dataclass(slots=True)
+class _ProjectGraph:
+    modules: dict[str, _ModuleImports] = field(default_factory=dict)
+
+
+class TestImpactAnalyzer:
+    """Map each test file to the project modules it imports, directly or not.
+
+    The graph is kept per project and refreshed incrementally: only Python files
+    whose mtime or size changed since the last query are parsed again. Imports
+    are resolved against the project root and a `src/` layout; third-party and
+    standard-library imports are ignored.
+    """
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self) -> None:
+        self._graphs: dict[Path, _ProjectGraph] = {}
+        self._lock = threading.Lock()
+
+    def affected_tests(
+        self,
+        project_path: Path,
+        rel_path: str,
+        *,
+        within: str = "tests",
+    ) -> list[str] | None:
+        """Return test files under `within` that import `rel_path`, transitively.
+
+        A changed test file selects itself, and a `conftest.py` reached through
+        the imports selects every test below its directory. None means the
+        change cannot be mapped (not a project module, or a changed
+        `conftest.py` itself) and the caller should run the whole suite.
+        """
+        changed = PurePosixPath(rel_path).as_posix()
+        if not changed.endswith(".py") or PurePosixPath(changed).name == "conftest.py":
+            return None
+        with self._lock:
+            modules = self._refresh(project_path.resolve())
+        if changed not in modules:
+            return None
+
+        importers: dict[str, set[str]] = {}
+        for module, entry in modules.items():
+            for imported in entry.imports:
+                importers.setdefault(imported, set()).add(module)
+
+        affected: set[str] = set()
+        conftest_dirs: set[PurePosixPath] = set()
+        seen = {changed}
+        pending = deque([changed])
+        while pending:
+            module = pending.popleft()
+            if _is_test_file(module, within):
+                affected.add(module)
+            elif PurePosixPath(module).name == "conftest.py":
+                conftest_dirs.add(PurePosixPath(module).parent)
+            for importer in importers.get(module, ()):
+                if importer not in seen:
+                    seen.add(importer)
+                    pending.append(importer)
+        if conftest_dirs:
+            # Fixtures from a conftest reach every test below it without an import.
+            affected.update(
+                module
+                for module in modules
+                if _is_test_file(module, within)
+                and any(_is_below(module, directory) for directory in conftest_dirs)
+            )
+        return sorted(affected)
+
+    def forget(self, project_path: Path) -> None:
+        """Drop the cached graph for a project."""
+        with self._lock:
+            self._graphs.pop(project_path.resolve(), None)
+
+    def _refresh(self, root: Path) -> dict[str, _ModuleImports]:
+        graph = self._graphs.setdefault(root, _ProjectGraph())
+        files = _python_files(root)
+        index = _module_index(files)
+        stale = graph.modules.keys() - files.keys()
+        for rel_path in stale:
+            del graph.modules[rel_path]
+        for rel_path, stat in files.items():
+            cached = graph.modules.get(rel_path)
+            if (
+                cached is not None
+                and cached.mtime_ns == stat.st_mtime_ns
+                and cached.size == stat.st_size
+            ):
+                continue
+            graph.modules[rel_path] = _ModuleImports(
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                imports=_resolve_imports(root, rel_path, index),
+            )
+        if stale:
+            # A deleted module can change how other files' imports resolve.
+            for rel_path, entry in graph.modules.items():
+                entry.imports = _resolve_imports(root, rel_path, index)
+        return graph.modules
+
+
+def _python_files(root: Path) -> dict[str, os.stat_result]:
+    files: dict[str, os.stat_result] = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [
+            name for name in dirnames if not name.startswith(".") and name not in _SKIPPED_DIRS
+        ]
+        base = Path(dirpath)
+        for filename in filenames:
+            if filename.endswith(".py"):
+                path = base / filename
+                files[path.relative_to(root).as_posix()] = path.stat()
+    return files
+
+
+def _module_index(files: dict[str, os.stat_result]) -> dict[str, str]:
+    index: dict[str, str] = {}
+    for source_root in _SOURCE_ROOTS:
+        prefix = f"{source_root}/" if source_root else ""
+        for rel_path in files:
+            if not rel_path.startswith(prefix):
+                continue
+            name = _module_name(rel_path.removeprefix(prefix))
+            if name:
+                index.setdefault(name, rel_path)
+    return index
+
+
+def _module_name(rel_path: str) -> str:
+    parts = list(PurePosixPath(rel_path).with_suffix("").parts)
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _resolve_imports(root: Path, rel_path: str, index: dict[str, str]) -> frozenset[str]:
+    try:
+        tree = ast.parse((root / rel_path).read_bytes(), filename=rel_path)
+    except (OSError, SyntaxError, ValueError):
+        return frozenset()
+
+    package = _module_name(rel_path.removeprefix("src/"))
+    if not rel_path.endswith("__init__.py"):
+        package = package.rpartition(".")[0]
+
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                anchor = package.split(".") if package else []
+                anchor = anchor[: len(anchor) - (node.level - 1)] if node.level > 1 else anchor
+                base = ".".join([*anchor, base] if base else anchor)
+            names.add(base)
+            names.update(f"{base}.{alias.name}" if base else alias.name for alias in node.names)
+
+    resolved: set[str] = set()
+    for name in names:
+        # `import a.b.c` also executes `a` and `a.b`.
+        parts = name.split(".")
+        for end in range(1, len(parts) + 1):
+            module = index.get(".".join(parts[:end]))
+            if module is not None and module != rel_path:
+                resolved.add(module)
+    return frozenset(resolved)
+
+
+def _is_below(rel_path: str, directory: PurePosixPath) -> bool:
+    return str(directory) == "." or directory in PurePosixPath(rel_path).parents
+
+
+def _is_test_file(rel_path: str, within: str) -> bool:
+    path = PurePosixPath(rel_path)
+    scope = PurePosixPath(within.strip("/") or ".")
+    if str(scope) != "." and scope not in path.parents and path != scope:
+        return False
+    return path.name.startswith("test_") or path.stem.endswith("_test")
@@ -0,0 +1,322 @@
+"""Background test-run queue with bounded concurrency."""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+import contextlib
+import functools
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from att.core.test_history import (
+    TestHistoryReport,
+    build_test_history_report,
+    summarize_test_history,
+)
+from att.core.test_runner import TestOutputRead, TestOutputStream, TestRunner
+from att.db.store import SQLiteStore
+from att.models.events import ATTEvent, EventType
+from att.models.project import Project
+from att.models.test_run import MAX_TEST_SHARDS, TestCaseResult, TestRun, TestRunStatus
+
+INTERRUPTED_RUN_ERROR = "interrupted by server restart"
+
+
+@dataclass(slots=True)
+class _QueuedRun:
+    run: TestRun
+    project_path: Path
+    done: asyncio.Event
+    output: TestOutputStream
+
+
+class TestRunManager:
+    """Queue test runs and execute them on a bounded pool of workers.
+
+    `submit` persists the run and returns immediately. Queued runs start in
+    submission order once both the host-wide and the per-project limits allow;
+    a run for a busy project does not hold up runs for other projects. Every
+    status change is written to SQLite and recorded as a `test.*` event, so
+    clients can poll the run or follow it on the live event stream.
+    """
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(
+        self,
+        store: SQLiteStore,
+        test_runner: TestRunner,
+        *,
+        max_concurrency: int = 4,
+        max_concurrency_per_project: int = 1,
+    ) -> None:
+        if max_concurrency < 1 or max_concurrency_per_project < 1:
+            msg = "test run concurrency limits must be positive"
+            raise ValueError(msg)
+        self._store = store
+        self._runner = test_runner
+        self._max_concurrency = max_concurrency
+        self._max_concurrency_per_project = max_concurrency_per_project
+        self._queue: deque[_QueuedRun] = deque()
+        self._active: dict[str, asyncio.Task[None]] = {}
+        self._active_per_project: Counter[str] = Counter()
+        self._pending: dict[str, _QueuedRun] = {}
+
+    @property
+    def queued_count(self) -> int:
+        return len(self._queue)
+
+    @property
+    def running_count(self) -> int:
+        return len(self._active)
+
+    async def start(self) -> None:
+        """Fail runs a previous process left queued or running."""
+        await self._store.fail_unfinished_test_runs(INTERRUPTED_RUN_ERROR)
+
+    async def close(self) -> None:
+        """Cancel queued and running runs and wait for them to be recorded."""
+        while self._queue:
+            await self._finish_cancelled(self._queue.popleft())
+        tasks = tuple(self._active.values())
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def submit(
+        self,
+        project: Project,
+        *,
+        suite: str = "unit",
+        markers: str | None = None,
+        timeout_seconds: int | None = None,
+        shards: int = 1,
+    ) -> TestRun:
+        if not 1 <= shards <= MAX_TEST_SHARDS:
+            msg = f"shards must be between 1 and {MAX_TEST_SHARDS}"
+            raise ValueError(msg)
+        run = TestRun(
+            project_id=project.id,
+            suite=suite,
+            markers=markers,
+            timeout_seconds=timeout_seconds,
+            shards=shards,
+        )
+        await self._store.upsert_test_run(run)
+        await self._record(run, EventType.TEST_RUN)
+        queued = _QueuedRun(
+            run=run,
+            project_path=project.path,
+            done=asyncio.Event(),
+            output=TestOutputStream(),
+        )
+        self._pending[run.id] = queued
+        self._queue.append(queued)
+        self._dispatch()
+        return run.model_copy()
+
+    async def run(
+        self,
+        project: Project,
+        *,
+        suite: str = "unit",
+        markers: str | None = None,
+        timeout_seconds: int | None = None,
+        shards: int = 1,
+    ) -> TestRun:
+        """Submit a run and wait for it; cancelling the caller cancels the run."""
+        run = await self.submit(
+            project,
+            suite=suite,
+            markers=markers,
+            timeout_seconds=timeout_seconds,
+            shards=shards,
+        )
+        try:
+            finished = await self.wait(run.id)
+        except asyncio.CancelledError:
+            await self.cancel(run.id)
+            raise
+        return finished if finished is not None else run
+
+    async def get(self, run_id: str) -> TestRun | None:
+        return await self._store.get_test_run(run_id)
+
+    async def list(self, project_id: str, *, limit: int | None = None) -> list[TestRun]:
+        return await self._store.list_test_runs(project_id, limit=limit)
+
+    async def latest_finished(self, project_id: str) -> TestRun | None:
+        runs = await self._store.list_test_runs(
+            project_id,
+            statuses=[status for status in TestRunStatus if status.finished],
+            limit=1,
+        )
+        return runs[0] if runs else None
+
+    async def test_cases(self, run_id: str) -> builtins.list[TestCaseResult]:
+        """Return per-test outcomes recorded from the run's JUnit report."""
+        return await self._store.list_test_case_results(run_id)
+
+    async def history(
+        self,
+        project_id: str,
+        *,
+        runs: int = 50,
+        limit: int = 20,
+    ) -> TestHistoryReport:
+        """Report the slowest, flaky and regressed tests over the latest finished runs."""
+        statuses = [TestRunStatus.PASSED, TestRunStatus.FAILED]
+        analyzed = await self._store.list_test_runs(project_id, statuses=statuses, limit=runs)
+        history = await self._store.list_test_case_history(project_id, run_limit=runs)
+        return build_test_history_report(
+            summarize_test_history(history),
+            runs=len(analyzed),
+            limit=limit,
+        )
+
+    async def wait(self, run_id: str, timeout_seconds: float | None = None) -> TestRun | None:
+        """Return the run once finished, or its current state if `timeout_seconds` elapses."""
+        queued = self._pending.get(run_id)
+        if queued is not None:
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(timeout_seconds):
+                    await queued.done.wait()
+        return await self.get(run_id)
+
+    async def read_output(
+        self,
+        run_id: str,
+        *,
+        cursor: int | None = None,
+        limit: int | None = None,
+    ) -> TestOutputRead | None:
+        """Read a run's console output by cursor, live while it runs and from history after."""
+        queued = self._pending.get(run_id)
+        if queued is not None:
+            return queued.output.read(cursor=cursor, limit=limit)
+        run = await self.get(run_id)
+        if run is None:
+            return None
+        result = run.result or {}
+        output = result.get("output", "")
+        start_cursor = result.get("output_start_cursor", 0)
+        stream = TestOutputStream.from_output(
+            output if isinstance(output, str) else "",
+            start_cursor=start_cursor if isinstance(start_cursor, int) else 0,
+        )
+        return stream.read(cursor=cursor, limit=limit)
+
+    async def wait_for_output(
+        self,
+        run_id: str,
+        cursor: int,
+        timeout_seconds: float | None = None,
+    ) -> bool:
+        """Wait for output past `cursor` or the end of the run; False if the wait timed out."""
+        queued = self._pending.get(run_id)
+        if queued is None:
+            return True
+        try:
+            async with asyncio.timeout(timeout_seconds):
+                await queued.output.wait(cursor)
+        except TimeoutError:
+            return False
+        return True
+
+    async def cancel(self, run_id: str) -> TestRun | None:
+        """Cancel a queued or running run; finished runs are returned unchanged."""
+        queued = self._pending.get(run_id)
+        if queued is not None:
+            task = self._active.get(run_id)
+            if task is None:
+                self._queue.remove(queued)
+                await self._finish_cancelled(queued)
+            else:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        return await self.get(run_id)
+
+    def _dispatch(self) -> None:
+        for queued in tuple(self._queue):
+            if len(self._active) >= self._max_concurrency:
+                return
+            project_id = queued.run.project_id
+            if self._active_per_project[project_id] >= self._max_concurrency_per_project:
+                continue
+            self._queue.remove(queued)
+            self._active_per_project[project_id] += 1
+            task = asyncio.create_task(self._execute(queued))
+            self._active[queued.run.id] = task
+            task.add_done_callback(functools.partial(self._release, queued))
+
+    def _release(self, queued: _QueuedRun, _task: asyncio.Task[None]) -> None:
+        project_id = queued.run.project_id
+        self._active.pop(queued.run.id, None)
+        self._active_per_project[project_id] -= 1
+        if self._active_per_project[project_id] <= 0:
+            del self._active_per_project[project_id]
+        self._dispatch()
+
+    async def _execute(self, queued: _QueuedRun) -> None:
+        run = queued.run
+        run.status = TestRunStatus.RUNNING
+        run.started_at = datetime.now(UTC)
+        try:
+            await self._store.upsert_test_run(run)
+            await self._record(run, EventType.TEST_RUN)
+            durations = (
+                await self._store.average_test_durations(run.project_id) if run.shards > 1 else {}
+            )
+            result = await self._runner.run(
+                queued.project_path,
+                suite=run.suite,
+                markers=run.markers,
+                timeout_seconds=run.timeout_seconds,
+                output=queued.output,
+                shards=run.shards,
+                durations=durations,
+            )
+            run.result = result.as_payload()
+            await self._store.replace_test_case_results(run.id, run.project_id, result.tests)
+        except asyncio.CancelledError:
+            await self._finish_cancelled(queued)
+            raise
+        except Exception as exc:
+            run.status = TestRunStatus.ERROR
+            run.error = str(exc) or type(exc).__name__
+        else:
+            run.status = TestRunStatus.PASSED if result.returncode == 0 else TestRunStatus.FAILED
+        await self._finish(queued)
+
+    async def _finish_cancelled(self, queued: _QueuedRun) -> None:
+        queued.run.status = TestRunStatus.CANCELLED
+        await self._finish(queued)
+
+    async def _finish(self, queued: _QueuedRun) -> None:
+        run = queued.run
+        run.finished_at = datetime.now(UTC)
+        passed = run.status is TestRunStatus.PASSED
+        try:
+            await self._store.upsert_test_run(run)
+            await self._record(run, EventType.TEST_PASSED if passed else EventType.TEST_FAILED)
+        finally:
+            self._pending.pop(run.id, None)
+            queued.done.set()
+
+    async def _record(self, run: TestRun, event_type: EventType) -> None:
+        payload: dict[str, str | int | float | bool | None] = {
+            "run_id": run.id,
+            "suite": run.suite,
+            "status": run.status.value,
+        }
+        if run.result is not None:
+            payload["returncode"] = run.result["returncode"]
+        await self._store.append_event(
+            ATTEvent(project_id=run.project_id, event_type=event_type, payload=payload)
+        )
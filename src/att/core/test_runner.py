@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import json
 import re
-import subprocess
-from dataclasses import dataclass
+import tempfile
+from collections import Counter, deque
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TypedDict
+from typing import Any, TypedDict
+from xml.etree import ElementTree
+
+from att.core.process import kill_process_group, run_process
+from att.models.test_run import TestCaseResult, TestOutcome
 
 type TestResultValue = str | int | float | bool
 type TestResultPayload = dict[str, TestResultValue]
@@ -17,8 +25,39 @@ _SUMMARY_COUNT_PATTERN = re.compile(
 )
 _SUMMARY_DURATION_PATTERN = re.compile(r"\bin\s+(?P<seconds>[0-9]*\.?[0-9]+)s\b")
 _NO_TESTS_PATTERN = re.compile(r"\bno tests ran\b", re.IGNORECASE)
+_COLLECTED_PATTERN = re.compile(r"^(?P<count>\d+)(?:/\d+)? tests? collected\b")
+_HEADER_COLLECTED_PATTERN = re.compile(
+    r"^(?:collecting \.\.\. )?collected (?P<count>\d+) items?"
+    r"(?: / (?P<deselected>\d+) deselected)?"
+)
+_PYTEST_VERSION_PATTERN = re.compile(r"\bpytest(?: version)? (?P<major>\d+)\.(?P<minor>\d+)")
+# pytest reads `@path` argument files from 8.2 on; older versions get the
+# node IDs on the command line, within a length that every platform accepts.
+_ARGFILE_PYTEST_VERSION = (8, 2)
+_MAX_INLINE_NODEID_CHARS = 30_000
 _TESTSUITE_TAG_PATTERN = re.compile(r"<testsuite\b(?P<attrs>[^>]*)>", re.IGNORECASE)
 _XML_ATTR_PATTERN = re.compile(r'(?P<key>[A-Za-z_][A-Za-z0-9_]*)="(?P<value>[^"]*)"')
+_PROGRESS_FILE_PATTERN = re.compile(r"^\S+\.py\s+(?P<marks>[.FEsxX]+)(?:\s+\[\s*\d+%\])?$")
+_PROGRESS_QUIET_PATTERN = re.compile(r"^(?P<marks>[.FEsxX]+)\s+\[\s*\d+%\]$")
+_PROGRESS_VERBOSE_PATTERN = re.compile(
+    r"^\S+::.*\s(?P<outcome>PASSED|FAILED|ERROR|SKIPPED|XFAIL|XPASS)(?:\s+\[\s*\d+%\])?$"
+)
+_PROGRESS_MARKS = {
+    ".": "passed",
+    "F": "failed",
+    "E": "errors",
+    "s": "skipped",
+    "x": "xfailed",
+    "X": "xpassed",
+}
+_PROGRESS_OUTCOMES = {
+    "PASSED": "passed",
+    "FAILED": "failed",
+    "ERROR": "errors",
+    "SKIPPED": "skipped",
+    "XFAIL": "xfailed",
+    "XPASS": "xpassed",
+}
 
 
 class PytestSummary(TypedDict):
@@ -48,6 +87,9 @@ class RunResult:
     duration_seconds: float | None = None
     no_tests_collected: bool = False
     timed_out: bool = False
+    stopped_early: bool = False
+    tests: list[TestCaseResult] = field(default_factory=list)
+    output_start_cursor: int = 0
 
     def as_payload(self) -> TestResultPayload:
         """Return a transport-friendly result payload."""
@@ -63,73 +105,325 @@ class RunResult:
             "xpassed": self.xpassed,
             "no_tests_collected": self.no_tests_collected,
             "timed_out": self.timed_out,
+            "stopped_early": self.stopped_early,
+            "output_start_cursor": self.output_start_cursor,
         }
         if self.duration_seconds is not None:
             payload["duration_seconds"] = self.duration_seconds
         return payload
 
 
+@dataclass(slots=True)
+class TestOutputRead:
+    """Test output read payload with cursor metadata and live summary counts."""
+
+    __test__ = False  # not a pytest test class
+
+    logs: list[str]
+    cursor: int
+    start_cursor: int
+    end_cursor: int
+    truncated: bool
+    has_more: bool
+    finished: bool
+    summary: PytestSummary
+
+    def as_payload(self) -> dict[str, Any]:
+        """Return a transport-friendly read payload."""
+        return {
+            "logs": self.logs,
+            "cursor": self.cursor,
+            "start_cursor": self.start_cursor,
+            "end_cursor": self.end_cursor,
+            "truncated": self.truncated,
+            "has_more": self.has_more,
+            "finished": self.finished,
+            "summary": dict(self.summary),
+        }
+
+
+class TestOutputStream:
+    """Console output of one test run, readable by cursor while pytest runs.
+
+    Keeps the newest `max_lines` lines (all of them when `None`) and updates
+    the summary counts from pytest's progress lines as they arrive; once the
+    final summary line is seen its counts take over. `collected` is the number
+    of tests pytest's header says it selected, when the header was printed.
+    """
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, *, max_lines: int | None = 10_000) -> None:
+        self._lines: deque[str] = deque(maxlen=max(1, max_lines) if max_lines else None)
+        self._end_cursor = 0
+        self._progress: Counter[str] = Counter()
+        self._final_summary: PytestSummary | None = None
+        self._collected: int | None = None
+        self._finished = False
+        self._changed = asyncio.Event()
+
+    @classmethod
+    def from_output(cls, output: str, *, start_cursor: int = 0) -> TestOutputStream:
+        """Return a finished stream replaying console output captured from `start_cursor`."""
+        stream = cls(max_lines=None)
+        stream._end_cursor = start_cursor
+        lines = output.split("\n")
+        if lines and not lines[-1]:
+            lines.pop()
+        for line in lines:
+            stream.append(line)
+        stream.finish()
+        return stream
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    @property
+    def end_cursor(self) -> int:
+        return self._end_cursor
+
+    @property
+    def collected(self) -> int | None:
+        return self._collected
+
+    def summary(self) -> PytestSummary:
+        if self._final_summary is not None:
+            return self._final_summary
+        return {
+            "passed": self._progress["passed"],
+            "failed": self._progress["failed"],
+            "skipped": self._progress["skipped"],
+            "errors": self._progress["errors"],
+            "xfailed": self._progress["xfailed"],
+            "xpassed": self._progress["xpassed"],
+            "duration_seconds": None,
+            "no_tests_collected": False,
+        }
+
+    def append(self, line: str) -> None:
+        line = line.rstrip("\r")
+        self._lines.append(line)
+        self._end_cursor += 1
+        self._count_progress(line.strip())
+        self._changed.set()
+
+    def finish(self) -> None:
+        self._finished = True
+        self._changed.set()
+
+    async def wait(self, cursor: int) -> None:
+        """Wait until output past `cursor` exists or the run has finished."""
+        while self._end_cursor <= cursor and not self._finished:
+            self._changed.clear()
+            await self._changed.wait()
+
+    def read(self, *, cursor: int | None = None, limit: int | None = None) -> TestOutputRead:
+        entries = list(self._lines)
+        end_cursor = self._end_cursor
+        first_cursor = end_cursor - len(entries)
+
+        if cursor is None:
+            requested_cursor = first_cursor
+            if limit is not None and limit > 0:
+                requested_cursor = max(first_cursor, end_cursor - limit)
+        else:
+            requested_cursor = max(0, cursor)
+        truncated = cursor is not None and requested_cursor < first_cursor
+        effective_cursor = min(max(requested_cursor, first_cursor), end_cursor)
+        logs = entries[effective_cursor - first_cursor :]
+        if limit is not None and limit > 0:
+            logs = logs[:limit]
+        next_cursor = effective_cursor + len(logs)
+
+        return TestOutputRead(
+            logs=logs,
+            cursor=next_cursor,
+            start_cursor=effective_cursor,
+            end_cursor=end_cursor,
+            truncated=truncated,
+            has_more=next_cursor < end_cursor,
+            finished=self._finished,
+            summary=self.summary(),
+        )
+
+    def _count_progress(self, line: str) -> None:
+        if not line:
+            return
+        if _SUMMARY_DURATION_PATTERN.search(line) and (
+            _SUMMARY_COUNT_PATTERN.search(line) or _NO_TESTS_PATTERN.search(line)
+        ):
+            self._final_summary = parse_pytest_output_summary(line)
+            return
+        collected_match = _HEADER_COLLECTED_PATTERN.match(line)
+        if collected_match is not None:
+            deselected = int(collected_match.group("deselected") or 0)
+            self._collected = int(collected_match.group("count")) - deselected
+            return
+        marks_match = _PROGRESS_FILE_PATTERN.match(line) or _PROGRESS_QUIET_PATTERN.match(line)
+        if marks_match is not None:
+            for mark in marks_match.group("marks"):
+                self._progress[_PROGRESS_MARKS[mark]] += 1
+            return
+        outcome_match = _PROGRESS_VERBOSE_PATTERN.match(line)
+        if outcome_match is not None:
+            self._progress[_PROGRESS_OUTCOMES[outcome_match.group("outcome")]] += 1
+
+
+def suite_target(suite: str) -> str:
+    """Map a suite name to the pytest path it runs; unknown names are used as paths."""
+    suite_name = suite.strip()
+    return {
+        "unit": "tests/unit",
+        "integration": "tests/integration",
+        "e2e": "tests/e2e",
+        "property": "tests/property",
+        "all": "tests",
+    }.get(suite_name, suite_name or "tests")
+
+
 class TestRunner:
-    """Execute tests in project context."""
+    """Execute tests in project context.
+
+    Runs are asyncio subprocesses in their own process group, so a long suite
+    never blocks the event loop. On timeout the whole group is killed and the
+    partial output is returned; cancelling `run` kills the group and re-raises.
+    `RunResult.output` holds the full console output unless `output_tail_lines`
+    caps it to the last lines.
+    """
+
+    __test__ = False  # not a pytest test class
 
-    def run(
+    def __init__(
+        self,
+        *,
+        pytest_command: Sequence[str] = ("pytest",),
+        output_tail_lines: int | None = None,
+    ) -> None:
+        self._pytest_command = tuple(pytest_command)
+        self._output_tail_lines = output_tail_lines
+
+    async def run(
         self,
         project_path: Path,
         suite: str = "unit",
         *,
         markers: str | None = None,
         timeout_seconds: int | None = None,
+        output: TestOutputStream | None = None,
+        paths: Sequence[str] | None = None,
+        shards: int = 1,
+        durations: Mapping[str, float] | None = None,
+        fail_fast: bool = False,
+        first: Sequence[str] = (),
     ) -> RunResult:
-        suite_name = suite.strip()
-        target = {
-            "unit": "tests/unit",
-            "integration": "tests/integration",
-            "e2e": "tests/e2e",
-            "property": "tests/property",
-            "all": "tests",
-        }.get(suite_name, suite_name or "tests")
-
-        command = ["pytest", target]
+        """Run pytest, feeding console lines to `output` as they are produced.
+
+        `paths` narrows the run to the given test files instead of the whole suite.
+        With `shards` > 1 the collected tests are split across that many pytest
+        processes, balanced by `durations` (seconds per node ID), and their
+        reports are merged into one result; each shard reads its node IDs from a
+        pytest argument file (`@path`) on pytest 8.2+ and from its command line
+        before that, or runs unsharded if they do not fit. `first` lists node IDs or test files
+        to run before the rest, and `fail_fast` stops at the first failure, in
+        any shard; the result then covers only the tests that ran.
+        """
+        targets = list(paths) if paths else [suite_target(suite)]
+        command = [*self._pytest_command, *targets]
         if markers is not None and markers.strip():
             command.extend(["-m", markers.strip()])
+        options = ["-x"] if fail_fast else []
+        command.extend(options)
 
         timeout = timeout_seconds if timeout_seconds is not None and timeout_seconds > 0 else None
 
         command_text = " ".join(command)
-
-        try:
-            completed = subprocess.run(
-                command,
-                cwd=project_path,
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
-        except subprocess.TimeoutExpired as exc:
-            output = _coerce_text(exc.stdout) + _coerce_text(exc.stderr)
-            summary = parse_pytest_output_summary(output)
-            return RunResult(
-                command=command_text,
-                returncode=124,
-                output=output,
-                passed=summary["passed"],
-                failed=summary["failed"],
-                skipped=summary["skipped"],
-                errors=summary["errors"],
-                xfailed=summary["xfailed"],
-                xpassed=summary["xpassed"],
-                duration_seconds=summary["duration_seconds"],
-                no_tests_collected=summary["no_tests_collected"],
-                timed_out=True,
-            )
-
-        output = (completed.stdout or "") + (completed.stderr or "")
-        summary = parse_pytest_output_summary(output)
+        # Counts and per-test outcomes come from the JUnit report, so a capped
+        # console tail loses nothing but text.
+        capture = TestOutputStream(max_lines=self._output_tail_lines)
+        sinks = [capture] if output is None else [capture, output]
+
+        with tempfile.TemporaryDirectory(prefix="att-pytest-") as report_dir:
+            shard_commands = [command]
+            report_paths = [Path(report_dir) / "junit.xml"]
+            returncodes: list[int] = []
+            timed_out = False
+            collected: list[str] = []
+            counters: list[TestOutputStream] = []
+            try:
+                async with asyncio.timeout(timeout):
+                    argfiles = False
+                    if shards > 1 or first:
+                        collected, argfiles = await self._collect(project_path, command)
+                    if not argfiles and sum(map(len, collected)) > _MAX_INLINE_NODEID_CHARS:
+                        collected = []
+                    if collected and first:
+                        collected = prioritize_test_ids(collected, first)
+                        selection = await _selection_args(
+                            Path(report_dir) / "tests.txt", collected, argfile=argfiles
+                        )
+                        shard_commands = [[*self._pytest_command, *options, *selection]]
+                    if shards > 1 and len(collected) > 1:
+                        groups = shard_test_ids(collected, shards, durations or {})
+                        shard_commands = [
+                            [
+                                *self._pytest_command,
+                                *options,
+                                *await _selection_args(
+                                    Path(report_dir) / f"tests-{index}.txt",
+                                    group,
+                                    argfile=argfiles,
+                                ),
+                            ]
+                            for index, group in enumerate(groups)
+                        ]
+                        report_paths = [
+                            Path(report_dir) / f"junit-{index}.xml"
+                            for index in range(len(shard_commands))
+                        ]
+                        command_text = f"{command_text} ({len(shard_commands)} shards)"
+                    # One summary counter per process: the JUnit report cannot tell
+                    # an XPASS from a pass, but each console summary line can.
+                    counters = [TestOutputStream(max_lines=1) for _ in shard_commands]
+                    returncodes = await _run_shards(
+                        project_path,
+                        shard_commands,
+                        report_paths,
+                        sinks,
+                        counters,
+                        fail_fast=fail_fast,
+                    )
+            except TimeoutError:
+                timed_out = True
+            finally:
+                for sink in sinks:
+                    sink.finish()
+
+            reports = await asyncio.to_thread(_read_junit_reports, report_paths)
+
+        if reports:
+            summary, tests = _merge_junit_reports(reports)
+            xpassed = sum(counter.summary()["xpassed"] for counter in counters)
+            summary["passed"] = max(0, summary["passed"] - xpassed)
+            summary["xpassed"] = xpassed
+        else:
+            summary, tests = capture.summary(), []
+        tail = capture.read()
+        # pytest prints "stopping after N failures" even when the last test
+        # failed, so only fewer tests run than selected proves it stopped early.
+        selected = len(collected) if collected else capture.collected
+        ran = len(tests) if reports else _summary_total(summary)
+        stopped_early = (
+            fail_fast
+            and not timed_out
+            and summary["failed"] + summary["errors"] > 0
+            and selected is not None
+            and ran < selected
+        )
         return RunResult(
             command=command_text,
-            returncode=completed.returncode,
-            output=output,
+            returncode=124 if timed_out else _merge_returncodes(returncodes),
+            output="".join(f"{line}\n" for line in tail.logs),
             passed=summary["passed"],
             failed=summary["failed"],
             skipped=summary["skipped"],
@@ -138,7 +432,330 @@ class TestRunner:
             xpassed=summary["xpassed"],
             duration_seconds=summary["duration_seconds"],
             no_tests_collected=summary["no_tests_collected"],
+            timed_out=timed_out,
+            stopped_early=stopped_early,
+            tests=tests,
+            output_start_cursor=tail.start_cursor,
+        )
+
+    async def _collect(self, project_path: Path, command: Sequence[str]) -> tuple[list[str], bool]:
+        """Return the node IDs pytest would run and whether it reads argument files.
+
+        The node IDs are empty if they cannot be read reliably. The project's
+        own pytest is asked for its version alongside the collection.
+        """
+        nodeids, version = await asyncio.gather(
+            self._collect_nodeids(project_path, command),
+            run_process([*self._pytest_command, "--version"], cwd=project_path),
         )
+        pytest_version = parse_pytest_version(version.stdout + version.stderr)
+        return nodeids, pytest_version is not None and pytest_version >= _ARGFILE_PYTEST_VERSION
+
+    async def _collect_nodeids(self, project_path: Path, command: Sequence[str]) -> list[str]:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            "--collect-only",
+            # Absolute verbosity, so `-q` in the project's addopts cannot switch
+            # the listing to per-file counts.
+            "--verbosity=-1",
+            cwd=project_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        try:
+            stdout, _ = await process.communicate()
+        except BaseException:
+            await kill_process_group(process)
+            raise
+        if process.returncode != 0:
+            return []
+        return parse_pytest_collection(stdout.decode("utf-8", errors="replace"))
+
+
+def parse_pytest_collection(output: str) -> list[str]:
+    """Parse `pytest --collect-only -q` output into node IDs.
+
+    Returns an empty list unless the listing matches the reported count, so a
+    format this parser does not understand falls back to an unsharded run
+    instead of silently dropping tests.
+    """
+    nodeids: list[str] = []
+    lines = iter(output.splitlines())
+    for line in lines:
+        if not line.strip():
+            break
+        if "::" not in line or line.startswith(" "):
+            return []
+        nodeids.append(line.strip())
+    for line in lines:
+        match = _COLLECTED_PATTERN.match(line.strip())
+        if match is not None:
+            return nodeids if int(match.group("count")) == len(nodeids) else []
+    return []
+
+
+def parse_pytest_version(output: str) -> tuple[int, int] | None:
+    """Parse `pytest --version` output into (major, minor); None if it is not there."""
+    match = _PYTEST_VERSION_PATTERN.search(output)
+    if match is None:
+        return None
+    return int(match.group("major")), int(match.group("minor"))
+
+
+async def _selection_args(path: Path, nodeids: Sequence[str], *, argfile: bool) -> list[str]:
+    if not argfile:
+        return list(nodeids)
+    await asyncio.to_thread(_write_argfile, path, nodeids)
+    return [f"@{path}"]
+
+
+def _write_argfile(path: Path, nodeids: Sequence[str]) -> None:
+    # pytest reads `@path` as one argument per line, which keeps large
+    # selections off the command line.
+    path.write_text("".join(f"{nodeid}\n" for nodeid in nodeids), encoding="utf-8")
+
+
+def prioritize_test_ids(nodeids: Sequence[str], first: Sequence[str]) -> list[str]:
+    """Move node IDs matching `first` (node IDs or test files) to the front, in that order.
+
+    The relative collection order is kept within each priority and for the rest.
+    """
+    ranks: dict[str, int] = {}
+    for rank, entry in enumerate(first):
+        ranks.setdefault(entry, rank)
+    unranked = len(first)
+    return sorted(
+        nodeids,
+        key=lambda nodeid: min(
+            ranks.get(nodeid, unranked),
+            ranks.get(nodeid.partition("::")[0], unranked),
+        ),
+    )
+
+
+def shard_test_ids(
+    nodeids: Sequence[str],
+    shards: int,
+    durations: Mapping[str, float],
+) -> list[list[str]]:
+    """Split node IDs into at most `shards` groups of roughly equal expected duration.
+
+    Longest tests are placed first, each on the currently lightest shard. Tests
+    without history count as the mean known duration. Every group keeps the
+    collection order so module and class fixtures are still shared.
+    """
+    known = [durations[nodeid] for nodeid in nodeids if nodeid in durations]
+    default = sum(known) / len(known) if known else 1.0
+    count = max(1, min(shards, len(nodeids)))
+    loads = [(0.0, index) for index in range(count)]
+    assigned: list[list[int]] = [[] for _ in range(count)]
+    order = sorted(
+        range(len(nodeids)),
+        key=lambda position: -durations.get(nodeids[position], default),
+    )
+    for position in order:
+        load, shard = heapq.heappop(loads)
+        assigned[shard].append(position)
+        heapq.heappush(loads, (load + durations.get(nodeids[position], default), shard))
+    return [[nodeids[position] for position in sorted(group)] for group in assigned if group]
+
+
+async def _run_shards(
+    project_path: Path,
+    commands: Sequence[Sequence[str]],
+    report_paths: Sequence[Path],
+    sinks: Sequence[TestOutputStream],
+    counters: Sequence[TestOutputStream],
+    *,
+    fail_fast: bool = False,
+) -> list[int]:
+    tasks = [
+        asyncio.create_task(_run_pytest(project_path, command, report_path, [*sinks, counter]))
+        for command, report_path, counter in zip(commands, report_paths, counters, strict=True)
+    ]
+    returncodes: list[int] = []
+    try:
+        pending: set[asyncio.Task[int]] = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            returncodes.extend(task.result() for task in done)
+            if fail_fast and any(code not in {0, 5} for code in returncodes):
+                break
+        return returncodes
+    finally:
+        # If a shard raises, fails under fail_fast, or the run is cancelled,
+        # stop the others too.
+        for task in tasks:
+            task.cancel()
+        await asyncio.wait(tasks)
+
+
+async def _run_pytest(
+    project_path: Path,
+    command: Sequence[str],
+    report_path: Path,
+    sinks: Sequence[TestOutputStream],
+) -> int:
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        f"--junitxml={report_path}",
+        "-o",
+        "junit_family=xunit1",
+        cwd=project_path,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        start_new_session=True,
+    )
+    try:
+        await asyncio.gather(_drain(process.stdout, sinks), process.wait())
+    except BaseException:
+        await kill_process_group(process)
+        raise
+    return process.returncode or 0
+
+
+def _summary_total(summary: PytestSummary) -> int:
+    return (
+        summary["passed"]
+        + summary["failed"]
+        + summary["skipped"]
+        + summary["errors"]
+        + summary["xfailed"]
+        + summary["xpassed"]
+    )
+
+
+def _merge_returncodes(returncodes: Sequence[int]) -> int:
+    # pytest exits 5 when a process collected nothing; that only matters if
+    # every shard did, otherwise the worst real failure code wins.
+    failures = [code for code in returncodes if code not in {0, 5}]
+    if failures:
+        return max(failures)
+    return 0 if 0 in returncodes or not returncodes else 5
+
+
+def _merge_junit_reports(
+    reports: Sequence[tuple[PytestSummary, list[TestCaseResult]]],
+) -> tuple[PytestSummary, list[TestCaseResult]]:
+    tests = [case for _, cases in reports for case in cases]
+    durations = [
+        summary["duration_seconds"]
+        for summary, _ in reports
+        if summary["duration_seconds"] is not None
+    ]
+    # Shards run side by side, so the slowest one is the run's duration.
+    summary: PytestSummary = {
+        "passed": sum(summary["passed"] for summary, _ in reports),
+        "failed": sum(summary["failed"] for summary, _ in reports),
+        "skipped": sum(summary["skipped"] for summary, _ in reports),
+        "errors": sum(summary["errors"] for summary, _ in reports),
+        "xfailed": sum(summary["xfailed"] for summary, _ in reports),
+        "xpassed": sum(summary["xpassed"] for summary, _ in reports),
+        "duration_seconds": max(durations) if durations else None,
+        "no_tests_collected": not tests,
+    }
+    return summary, tests
+
+
+async def _drain(stream: asyncio.StreamReader | None, sinks: Sequence[TestOutputStream]) -> None:
+    if stream is None:
+        return
+    partial = b""
+    while chunk := await stream.read(65536):
+        *lines, partial = (partial + chunk).split(b"\n")
+        for raw_line in lines:
+            line = raw_line.decode("utf-8", errors="replace")
+            for sink in sinks:
+                sink.append(line)
+    if partial:
+        line = partial.decode("utf-8", errors="replace")
+        for sink in sinks:
+            sink.append(line)
+
+
+def _read_junit_reports(
+    paths: Sequence[Path],
+) -> list[tuple[PytestSummary, list[TestCaseResult]]]:
+    return [report for path in paths if (report := _read_junit_report(path)) is not None]
+
+
+def _read_junit_report(path: Path) -> tuple[PytestSummary, list[TestCaseResult]] | None:
+    if not path.is_file():
+        return None
+    try:
+        return parse_pytest_junit_report(path)
+    except ElementTree.ParseError:
+        return None
+
+
+def parse_pytest_junit_report(path: Path) -> tuple[PytestSummary, list[TestCaseResult]]:
+    """Stream-parse a pytest JUnit XML report into summary counts and per-test results.
+
+    Test case elements are discarded as soon as they are read, so memory stays
+    flat however large the suite is. xunit1 records a non-strict XPASS as a
+    plain passed test case, so `xpassed` is always 0 here and such tests count
+    as passed; `TestRunner.run` corrects the counts from the console summary.
+    """
+    counts: Counter[str] = Counter()
+    tests: list[TestCaseResult] = []
+    duration: float | None = None
+    # The report is written by the pytest run we just launched.
+    for _, element in ElementTree.iterparse(path, events=("end",)):  # noqa: S314
+        if element.tag == "testcase":
+            case = _junit_test_case(element)
+            tests.append(case)
+            counts["errors" if case.outcome == "error" else case.outcome] += 1
+            element.clear()
+        elif element.tag == "testsuite" and element.get("time"):
+            duration = (duration or 0.0) + float(element.get("time", "0"))
+    return (
+        {
+            "passed": counts["passed"],
+            "failed": counts["failed"],
+            "skipped": counts["skipped"],
+            "errors": counts["errors"],
+            "xfailed": counts["xfailed"],
+            "xpassed": 0,
+            "duration_seconds": duration,
+            "no_tests_collected": not tests,
+        },
+        tests,
+    )
+
+
+def _junit_test_case(element: ElementTree.Element) -> TestCaseResult:
+    outcome: TestOutcome = "passed"
+    message: str | None = None
+    for child in element:
+        if child.tag == "failure":
+            outcome = "failed"
+        elif child.tag == "error":
+            outcome = "error"
+        elif child.tag == "skipped":
+            outcome = "xfailed" if child.get("type") == "pytest.xfail" else "skipped"
+        else:
+            continue
+        message = child.get("message")
+        break
+    return TestCaseResult.model_construct(
+        nodeid=_junit_nodeid(element),
+        outcome=outcome,
+        duration_seconds=float(element.get("time") or 0.0),
+        message=message,
+    )
+
+
+def _junit_nodeid(element: ElementTree.Element) -> str:
+    name = element.get("name", "")
+    classname = element.get("classname", "")
+    file = element.get("file")
+    if not file:
+        return f"{classname}::{name}" if classname else name
+    module = file.removesuffix(".py").replace("/", ".")
+    class_path = classname.removeprefix(module).lstrip(".")
+    parts = [file, *class_path.split("."), name] if class_path else [file, name]
+    return "::".join(parts)
 
 
 def parse_pytest_output_summary(output: str) -> PytestSummary:
@@ -249,11 +866,3 @@ def parse_pytest_junit_xml(content: str) -> PytestSummary:
         "duration_seconds": duration,
         "no_tests_collected": tests == 0,
     }
-
-
-def _coerce_text(value: str | bytes | None) -> str:
-    if value is None:
-        return ""
-    if isinstance(value, bytes):
-        return value.decode("utf-8", errors="replace")
-    return value
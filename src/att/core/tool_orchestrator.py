@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from pathlib import Path
+from typing import Literal
 
 from att.core.code_manager import CodeManager
 from att.core.git_manager import GitManager
-from att.core.test_runner import RunResult, TestRunner
+from att.core.test_history import failing_first, summarize_test_history
+from att.core.test_impact import TestImpactAnalyzer
+from att.core.test_runner import RunResult, TestRunner, suite_target
 from att.db.store import SQLiteStore
 from att.models.events import ATTEvent, EventType
+from att.models.test_run import TestRun, TestRunStatus
+
+type TestSelection = Literal["suite", "affected"]
+
+FAIL_FAST_HISTORY_RUNS = 20
 
 
 @dataclass(slots=True)
@@ -21,6 +31,7 @@ class WorkflowRunResult:
     committed: bool
     commit_output: str | None
     events: list[ATTEvent]
+    selected_tests: list[str] = field(default_factory=list)
 
 
 class ToolOrchestrator:
@@ -32,11 +43,13 @@ class ToolOrchestrator:
         git_manager: GitManager,
         test_runner: TestRunner,
         store: SQLiteStore | None = None,
+        test_impact: TestImpactAnalyzer | None = None,
     ) -> None:
         self._code = code_manager
         self._git = git_manager
         self._tests = test_runner
         self._store = store
+        self._impact = test_impact or TestImpactAnalyzer()
 
     async def run_change_workflow(
         self,
@@ -47,10 +60,18 @@ class ToolOrchestrator:
         new_content: str,
         suite: str = "unit",
         commit_message: str | None = None,
+        test_selection: TestSelection = "suite",
+        fail_fast: bool = False,
     ) -> WorkflowRunResult:
-        """Apply code change, run tests, and optionally commit on green tests."""
+        """Apply code change, run tests, and optionally commit on green tests.
+
+        With `test_selection="affected"` only the suite's tests that import the
+        changed file are run; the whole suite runs when none can be mapped.
+        With `fail_fast` previously failing tests and the tests affected by the
+        change run first, and the run stops at the first failure.
+        """
         old_content = self._code.read_file(project_path, rel_path)
-        self._code.write_file(project_path, rel_path, new_content)
+        await asyncio.to_thread(self._code.write_file, project_path, rel_path, new_content)
         diff = self._code.diff(
             old_content,
             new_content,
@@ -66,14 +87,44 @@ class ToolOrchestrator:
         )
         await self._record_event(code_event, events)
 
+        affected_tests: list[str] = []
+        if test_selection == "affected" or fail_fast:
+            mapped = await asyncio.to_thread(
+                self._impact.affected_tests,
+                project_path,
+                rel_path,
+                within=suite_target(suite),
+            )
+            affected_tests = mapped or []
+        selected_tests = affected_tests if test_selection == "affected" else []
+
         test_run_event = ATTEvent(
             project_id=project_id,
             event_type=EventType.TEST_RUN,
-            payload={"suite": suite},
+            payload={
+                "suite": suite,
+                "selection": "affected" if selected_tests else "suite",
+                "selected_tests": len(selected_tests),
+                "fail_fast": fail_fast,
+            },
         )
         await self._record_event(test_run_event, events)
 
-        test_result = self._tests.run(project_path, suite=suite)
+        started_at = datetime.now(UTC)
+        if fail_fast:
+            first = [*await self._failing_tests(project_id), *affected_tests]
+            test_result = await self._tests.run(
+                project_path,
+                suite=suite,
+                paths=selected_tests or None,
+                fail_fast=True,
+                first=first,
+            )
+        elif selected_tests:
+            test_result = await self._tests.run(project_path, suite=suite, paths=selected_tests)
+        else:
+            test_result = await self._tests.run(project_path, suite=suite)
+        await self._record_test_run(project_id, suite, started_at, test_result)
         pass_fail_event = ATTEvent(
             project_id=project_id,
             event_type=(
@@ -82,6 +133,8 @@ class ToolOrchestrator:
             payload={
                 "suite": suite,
                 "returncode": test_result.returncode,
+                "failed": test_result.failed + test_result.errors,
+                "stopped_early": test_result.stopped_early,
             },
         )
         await self._record_event(pass_fail_event, events)
@@ -89,7 +142,7 @@ class ToolOrchestrator:
         committed = False
         commit_output: str | None = None
         if commit_message and test_result.returncode == 0:
-            commit_result = self._git.commit(project_path, commit_message)
+            commit_result = await self._git.commit(project_path, commit_message)
             committed = True
             commit_output = commit_result.output
             git_event = ATTEvent(
@@ -105,11 +158,45 @@ class ToolOrchestrator:
             committed=committed,
             commit_output=commit_output,
             events=events,
+            selected_tests=selected_tests,
         )
 
-    def status(self, project_path: Path) -> str:
+    async def status(self, project_path: Path) -> str:
         """Return current git working tree status."""
-        return self._git.status(project_path).output
+        result = await self._git.status(project_path)
+        return result.output
+
+    async def _failing_tests(self, project_id: str) -> list[str]:
+        """Tests that failed in the project's recorded runs, most likely to fail again first."""
+        if self._store is None:
+            return []
+        history = await self._store.list_test_case_history(
+            project_id,
+            run_limit=FAIL_FAST_HISTORY_RUNS,
+        )
+        return failing_first(summarize_test_history(history))
+
+    async def _record_test_run(
+        self,
+        project_id: str,
+        suite: str,
+        started_at: datetime,
+        result: RunResult,
+    ) -> None:
+        """Store the workflow's test run like a queued one, for history and fail-fast order."""
+        if self._store is None:
+            return
+        run = TestRun(
+            project_id=project_id,
+            suite=suite,
+            status=TestRunStatus.PASSED if result.returncode == 0 else TestRunStatus.FAILED,
+            result=result.as_payload(),
+            created_at=started_at,
+            started_at=started_at,
+            finished_at=datetime.now(UTC),
+        )
+        await self._store.upsert_test_run(run)
+        await self._store.replace_test_case_results(run.id, project_id, result.tests)
 
     async def _record_event(self, event: ATTEvent, sink: list[ATTEvent]) -> None:
         sink.append(event)
@@ -2,49 +2,328 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+
 import aiosqlite
 
-SCHEMA_VERSION = 1
+from att.db.payloads import reencode_payload
+from att.db.timestamps import iso_to_epoch_micros
 
+type MigrationStep = Callable[[aiosqlite.Connection], Awaitable[None]]
 
-async def apply_migrations(conn: aiosqlite.Connection) -> None:
-    """Create core schema if missing and set schema version."""
-    await conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS schema_migrations (
-            version INTEGER PRIMARY KEY
-        )
-        """
+
+@dataclass(frozen=True, slots=True)
+class Migration:
+    """Forward-only schema step applied exactly once per database.
+
+    `apply`, when set, runs after `statements` inside the same transaction for
+    steps that need Python, such as data backfills.
+    """
+
+    version: int
+    description: str
+    statements: tuple[str, ...]
+    apply: MigrationStep | None = None
+
+
+# SQLite cannot change a column's type in place, so v5 rebuilds each table and
+# backfills the ISO-8601 TEXT timestamps as integer epoch microseconds.
+_EPOCH_MICROS_REBUILD = (
+    """
+    CREATE TABLE projects_v5 (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        path TEXT NOT NULL,
+        git_remote TEXT,
+        nat_config_path TEXT,
+        status TEXT NOT NULL,
+        created_at INTEGER NOT NULL,
+        updated_at INTEGER NOT NULL
+    )
+    """,
+    """
+    INSERT INTO projects_v5
+    SELECT
+        id,
+        name,
+        path,
+        git_remote,
+        nat_config_path,
+        status,
+        att_iso_to_epoch_micros(created_at),
+        att_iso_to_epoch_micros(updated_at)
+    FROM projects
+    """,
+    "DROP TABLE projects",
+    "ALTER TABLE projects_v5 RENAME TO projects",
+    """
+    CREATE TABLE att_events_v5 (
+        id TEXT PRIMARY KEY,
+        project_id TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        timestamp INTEGER NOT NULL,
+        FOREIGN KEY(project_id) REFERENCES projects(id)
+    )
+    """,
+    """
+    INSERT INTO att_events_v5
+    SELECT id, project_id, event_type, payload, att_iso_to_epoch_micros(timestamp)
+    FROM att_events
+    """,
+    "DROP TABLE att_events",
+    "ALTER TABLE att_events_v5 RENAME TO att_events",
+    """
+    CREATE INDEX idx_att_events_project_timestamp
+    ON att_events(project_id, timestamp, id)
+    """,
+    """
+    CREATE INDEX idx_att_events_project_type_timestamp
+    ON att_events(project_id, event_type, timestamp, id)
+    """,
+    """
+    CREATE TABLE att_event_daily_summaries_v5 (
+        project_id TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        day TEXT NOT NULL,
+        event_count INTEGER NOT NULL,
+        first_timestamp INTEGER NOT NULL,
+        last_timestamp INTEGER NOT NULL,
+        PRIMARY KEY(project_id, event_type, day)
     )
+    """,
+    """
+    INSERT INTO att_event_daily_summaries_v5
+    SELECT
+        project_id,
+        event_type,
+        day,
+        event_count,
+        att_iso_to_epoch_micros(first_timestamp),
+        att_iso_to_epoch_micros(last_timestamp)
+    FROM att_event_daily_summaries
+    """,
+    "DROP TABLE att_event_daily_summaries",
+    "ALTER TABLE att_event_daily_summaries_v5 RENAME TO att_event_daily_summaries",
+)
 
-    await conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS projects (
-            id TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            path TEXT NOT NULL,
-            git_remote TEXT,
-            nat_config_path TEXT,
-            status TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL
-        )
-        """
+
+async def _migrate_to_epoch_micros(conn: aiosqlite.Connection) -> None:
+    await conn.create_function(
+        "att_iso_to_epoch_micros",
+        1,
+        iso_to_epoch_micros,
+        deterministic=True,
     )
+    for statement in _EPOCH_MICROS_REBUILD:
+        await conn.execute(statement)
 
-    await conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS att_events (
-            id TEXT PRIMARY KEY,
-            project_id TEXT NOT NULL,
-            event_type TEXT NOT NULL,
-            payload TEXT NOT NULL,
-            timestamp TEXT NOT NULL,
-            FOREIGN KEY(project_id) REFERENCES projects(id)
-        )
-        """
+
+async def _reencode_event_payloads(conn: aiosqlite.Connection) -> None:
+    await conn.create_function(
+        "att_reencode_payload",
+        1,
+        reencode_payload,
+        deterministic=True,
     )
+    await conn.execute("UPDATE att_events SET payload = att_reencode_payload(payload)")
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(
+        version=1,
+        description="core projects and events schema",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS projects (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                path TEXT NOT NULL,
+                git_remote TEXT,
+                nat_config_path TEXT,
+                status TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS att_events (
+                id TEXT PRIMARY KEY,
+                project_id TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                FOREIGN KEY(project_id) REFERENCES projects(id)
+            )
+            """,
+        ),
+    ),
+    Migration(
+        version=2,
+        description="att_events lookup indexes",
+        statements=(
+            """
+            CREATE INDEX IF NOT EXISTS idx_att_events_project_timestamp
+            ON att_events(project_id, timestamp)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_att_events_project_type_timestamp
+            ON att_events(project_id, event_type, timestamp)
+            """,
+        ),
+    ),
+    Migration(
+        version=3,
+        description="att_events keyset pagination indexes",
+        statements=(
+            "DROP INDEX IF EXISTS idx_att_events_project_timestamp",
+            "DROP INDEX IF EXISTS idx_att_events_project_type_timestamp",
+            """
+            CREATE INDEX idx_att_events_project_timestamp
+            ON att_events(project_id, timestamp, id)
+            """,
+            """
+            CREATE INDEX idx_att_events_project_type_timestamp
+            ON att_events(project_id, event_type, timestamp, id)
+            """,
+        ),
+    ),
+    Migration(
+        version=4,
+        description="per-day summaries for compacted att_events",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS att_event_daily_summaries (
+                project_id TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                day TEXT NOT NULL,
+                event_count INTEGER NOT NULL,
+                first_timestamp TEXT NOT NULL,
+                last_timestamp TEXT NOT NULL,
+                PRIMARY KEY(project_id, event_type, day)
+            )
+            """,
+        ),
+    ),
+    Migration(
+        version=5,
+        description="integer epoch-microsecond timestamps",
+        statements=(),
+        apply=_migrate_to_epoch_micros,
+    ),
+    Migration(
+        version=6,
+        description="persisted background test runs",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS test_runs (
+                id TEXT PRIMARY KEY,
+                project_id TEXT NOT NULL,
+                suite TEXT NOT NULL,
+                markers TEXT,
+                timeout_seconds INTEGER,
+                status TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                created_at INTEGER NOT NULL,
+                started_at INTEGER,
+                finished_at INTEGER
+            )
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_test_runs_project_created
+            ON test_runs(project_id, created_at, id)
+            """,
+        ),
+    ),
+    Migration(
+        version=7,
+        description="per-test outcomes from pytest JUnit reports",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS test_case_results (
+                run_id TEXT NOT NULL,
+                project_id TEXT NOT NULL,
+                nodeid TEXT NOT NULL,
+                outcome TEXT NOT NULL,
+                duration_seconds REAL NOT NULL,
+                message TEXT,
+                PRIMARY KEY(run_id, nodeid)
+            )
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_test_case_results_project_nodeid
+            ON test_case_results(project_id, nodeid)
+            """,
+        ),
+    ),
+    Migration(
+        version=8,
+        description="sharded test runs",
+        statements=("ALTER TABLE test_runs ADD COLUMN shards INTEGER NOT NULL DEFAULT 1",),
+    ),
+    Migration(
+        version=9,
+        description="event payloads in the API's compact JSON encoding",
+        statements=(),
+        apply=_reencode_event_payloads,
+    ),
+)
 
-    await conn.execute("DELETE FROM schema_migrations")
-    await conn.execute("INSERT INTO schema_migrations(version) VALUES (?)", (SCHEMA_VERSION,))
-    await conn.commit()
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+async def schema_version(conn: aiosqlite.Connection) -> int:
+    """Return the highest applied migration version, or 0 for a fresh database."""
+    cursor = await conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_migrations'"
+    )
+    if await cursor.fetchone() is None:
+        return 0
+    cursor = await conn.execute("SELECT MAX(version) FROM schema_migrations")
+    row = await cursor.fetchone()
+    return int(row[0]) if row is not None and row[0] is not None else 0
+
+
+async def apply_migrations(
+    conn: aiosqlite.Connection,
+    migrations: Sequence[Migration] = MIGRATIONS,
+) -> int:
+    """Apply pending forward migrations and return the resulting schema version.
+
+    Read-only when the database is already current, so it is cheap to call on
+    every startup.
+    """
+    target = max((migration.version for migration in migrations), default=0)
+    current = await schema_version(conn)
+    if current >= target:
+        return current
+
+    # Take the write lock before re-checking so concurrent processes migrate once.
+    await conn.execute("BEGIN IMMEDIATE")
+    try:
+        await conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY
+            )
+            """
+        )
+        current = await schema_version(conn)
+        for migration in sorted(migrations, key=lambda item: item.version):
+            if migration.version <= current:
+                continue
+            for statement in migration.statements:
+                await conn.execute(statement)
+            if migration.apply is not None:
+                await migration.apply(conn)
+            await conn.execute(
+                "INSERT INTO schema_migrations(version) VALUES (?)", (migration.version,)
+            )
+            current = migration.version
+        await conn.commit()
+    except BaseException:
+        await conn.rollback()
+        raise
+    return current
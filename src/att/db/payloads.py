@@ -0,0 +1,22 @@
+"""Stored encoding of event payloads."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from pydantic_core import to_json
+
+
+def encode_payload(payload: dict[str, Any]) -> str:
+    """Encode a payload exactly as the API serializes it.
+
+    Compact, UTF-8 and with non-finite floats as null, so stored payload text
+    can be spliced into responses without decoding it.
+    """
+    return to_json(payload, inf_nan_mode="null").decode("utf-8")
+
+
+def reencode_payload(text: str) -> str:
+    """Rewrite payload text written by an earlier encoder in the current encoding."""
+    return encode_payload(json.loads(text))
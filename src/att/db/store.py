@@ -2,37 +2,398 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
+import contextlib
+import importlib
 import json
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from contextlib import asynccontextmanager
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
 from pathlib import Path
+from typing import Any, Literal, cast
 
 import aiosqlite
 
 from att.db.migrations import apply_migrations
+from att.db.payloads import encode_payload
+from att.db.timestamps import from_epoch_micros, to_epoch_micros
 from att.models.events import ATTEvent, EventType
 from att.models.project import Project, ProjectStatus
+from att.models.test_run import TestCaseResult, TestRun, TestRunStatus
+
+
+def _json_loader() -> Callable[[str], Any]:
+    try:
+        module = importlib.import_module("orjson")
+    except ImportError:
+        return json.loads
+    return cast(Callable[[str], Any], module.loads)
+
+
+# orjson is an optional speedup for payload decoding.
+_load_json = _json_loader()
+
+
+@dataclass(slots=True)
+class EventDailySummary:
+    """Per-day count of compacted events for one project and event type."""
+
+    project_id: str
+    event_type: EventType
+    day: date
+    event_count: int
+    first_timestamp: datetime
+    last_timestamp: datetime
+
+
+@dataclass(slots=True)
+class EventAggregate:
+    """Event count for one group; ungrouped dimensions are `None`."""
+
+    count: int
+    project_id: str | None = None
+    event_type: EventType | None = None
+    bucket: str | None = None
+
+
+@dataclass(slots=True)
+class EventPage:
+    """One keyset page of events."""
+
+    items: list[ATTEvent]
+    next_cursor: str | None
+
+
+@dataclass(slots=True)
+class EventRecord:
+    """Undecoded event row for callers that only re-serialize events.
+
+    `payload` is the stored JSON text and `timestamp` the stored epoch
+    microseconds.
+    """
+
+    id: str
+    project_id: str
+    event_type: str
+    payload: str
+    timestamp: int
+
+    def to_json(self) -> str:
+        """Serialize in the `EventResponse` wire shape without decoding the payload.
+
+        Payloads are stored in the API's own encoding, so the stored text is
+        spliced in as is; timestamps use its `Z` suffix for UTC.
+        """
+        timestamp = from_epoch_micros(self.timestamp).isoformat().removesuffix("+00:00")
+        return (
+            f'{{"id":{_dump_str(self.id)},"project_id":{_dump_str(self.project_id)},'
+            f'"event_type":{_dump_str(self.event_type)},"payload":{self.payload},'
+            f'"timestamp":"{timestamp}Z"}}'
+        )
+
+    def to_event(self) -> ATTEvent:
+        return ATTEvent.model_construct(
+            id=self.id,
+            project_id=self.project_id,
+            event_type=EventType(self.event_type),
+            payload=_load_json(self.payload),
+            timestamp=from_epoch_micros(self.timestamp),
+        )
+
+
+def _dump_str(value: str) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def encode_event_cursor(event: ATTEvent) -> str:
+    """Encode an opaque keyset cursor positioned after `event`."""
+    raw = f"{to_epoch_micros(event.timestamp)}|{event.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_event_cursor(cursor: str) -> tuple[int, str]:
+    """Decode an opaque keyset cursor into its (epoch microseconds, id) key.
+
+    Raises `ValueError` for malformed cursors.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+    except (binascii.Error, UnicodeError) as exc:
+        msg = "Invalid event cursor"
+        raise ValueError(msg) from exc
+    timestamp, separator, event_id = raw.partition("|")
+    if not separator or not timestamp.isdigit() or not event_id:
+        msg = "Invalid event cursor"
+        raise ValueError(msg)
+    return int(timestamp), event_id
+
+
+type EventGroupField = Literal["project", "event_type", "bucket"]
+type EventBucket = Literal["hour", "day", "month"]
+type WriteOperation = Callable[[aiosqlite.Connection], Awaitable[None]]
+type _WriteRequest = tuple[WriteOperation, asyncio.Future[int]]
+type EventListener = Callable[[Sequence[ATTEvent]], None]
+
+# Raw events are bucketed with strftime over UTC epoch seconds; summary days
+# ("YYYY-MM-DD") are truncated to the same labels.
+_EVENT_BUCKET_FORMATS: dict[EventBucket, str] = {
+    "hour": "%Y-%m-%dT%H",
+    "day": "%Y-%m-%d",
+    "month": "%Y-%m",
+}
+_EVENT_BUCKET_LENGTHS: dict[EventBucket, int] = {"hour": 13, "day": 10, "month": 7}
+_EVENT_GROUP_COLUMNS: dict[EventGroupField, str] = {
+    "project": "project_id",
+    "event_type": "event_type",
+    "bucket": "bucket",
+}
+
+_JOURNAL_MODES = frozenset({"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"})
+_SYNCHRONOUS_MODES = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
+
+
+@dataclass(frozen=True, slots=True)
+class SQLitePragmas:
+    """Connection tuning applied to every pooled connection."""
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size_kib: int = 16_384
+    mmap_size_bytes: int = 256 * 1024 * 1024
+    busy_timeout_ms: int = 5_000
+
+    def __post_init__(self) -> None:
+        if self.journal_mode.upper() not in _JOURNAL_MODES:
+            msg = f"Unsupported journal_mode: {self.journal_mode}"
+            raise ValueError(msg)
+        if self.synchronous.upper() not in _SYNCHRONOUS_MODES:
+            msg = f"Unsupported synchronous mode: {self.synchronous}"
+            raise ValueError(msg)
+
+    def connection_statements(self) -> tuple[str, ...]:
+        # Negative cache_size is interpreted by SQLite as KiB rather than pages.
+        return (
+            f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}",
+            f"PRAGMA synchronous = {self.synchronous.upper()}",
+            f"PRAGMA cache_size = {-int(self.cache_size_kib)}",
+            f"PRAGMA mmap_size = {int(self.mmap_size_bytes)}",
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class EventBufferPolicy:
+    """Group-commit thresholds for buffered event appends.
+
+    Buffering trades durability for write throughput: ``append_event``
+    returns before the event is committed, so a crash or unclean shutdown
+    loses up to ``max_events`` events or ``max_delay_ms`` worth of them.
+    """
+
+    max_events: int = 100
+    max_delay_ms: int = 50
 
 
 class SQLiteStore:
-    """Data access layer for projects and events."""
+    """Data access layer for projects and events.
+
+    Connections are pooled for the lifetime of the store: one shared writer
+    plus up to ``max_readers`` reader connections, and WAL journaling keeps
+    readers from blocking behind writes. ``open`` starts a single writer task
+    on the running event loop, fed by a bounded queue; ``close`` drains and
+    stops it. A store used without ``open`` opens its connections lazily and
+    runs writes directly, serialized by a lock, so no background task outlives
+    it; writes from a loop other than the writer task's take that path too.
+    With an ``event_buffer`` policy, ``append_event`` group-commits events
+    every ``max_delay_ms`` or ``max_events``; reads and ``close`` flush the
+    buffer first. Event listeners are called with each batch once it has
+    committed.
+    """
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        max_readers: int = 4,
+        max_pending_writes: int = 1024,
+        pragmas: SQLitePragmas | None = None,
+        event_buffer: EventBufferPolicy | None = None,
+        event_listeners: Sequence[EventListener] = (),
+    ) -> None:
         self._db_path = db_path
+        self._max_readers = max(1, max_readers)
+        self._max_pending_writes = max(1, max_pending_writes)
+        self._pragmas = pragmas or SQLitePragmas()
+        self._writer: aiosqlite.Connection | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+        self._write_queue: asyncio.Queue[_WriteRequest] | None = None
+        self._open_lock = asyncio.Lock()
+        self._direct_write_lock: asyncio.Lock | None = None
+        self._direct_write_loop: asyncio.AbstractEventLoop | None = None
+        self._reader_slots = asyncio.Semaphore(self._max_readers)
+        self._readers: list[aiosqlite.Connection] = []
+        self._idle_readers: list[aiosqlite.Connection] = []
+        self._event_buffer = event_buffer
+        self._pending_events: list[ATTEvent] = []
+        self._event_flush_task: asyncio.Task[None] | None = None
+        self._event_listeners = tuple(event_listeners)
+
+    @property
+    def is_open(self) -> bool:
+        return self._writer is not None
+
+    async def open(self) -> None:
+        """Open the pool, ensure the schema exists and start the writer task.
+
+        The writer task belongs to the running event loop; call ``close`` from
+        the same loop to stop it.
+        """
+        await self._open_connection()
+        async with self._open_lock:
+            task = self._writer_task
+            if task is None or task.done():
+                self._write_queue = asyncio.Queue(maxsize=self._max_pending_writes)
+                self._writer_task = asyncio.get_running_loop().create_task(
+                    self._run_writer(self._write_queue)
+                )
+
+    async def _open_connection(self) -> None:
+        async with self._open_lock:
+            if self._writer is not None:
+                return
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            writer = await self._connect()
+            await writer.execute(f"PRAGMA journal_mode = {self._pragmas.journal_mode.upper()}")
+            await apply_migrations(writer)
+            self._writer = writer
+
+    async def close(self) -> None:
+        """Flush buffered events, drain queued writes and close every pooled connection."""
+        flush_task = self._event_flush_task
+        self._event_flush_task = None
+        if (
+            flush_task is not None
+            and not flush_task.done()
+            and flush_task.get_loop() is asyncio.get_running_loop()
+        ):
+            flush_task.cancel()
+        await self.flush_events()
+        async with self._open_lock:
+            await self._stop_writer_task()
+            connections = [*self._readers]
+            if self._writer is not None:
+                connections.append(self._writer)
+            self._writer = None
+            self._readers.clear()
+            self._idle_readers.clear()
+            for conn in connections:
+                await conn.close()
+
+    async def write(self, operation: WriteOperation) -> int:
+        """Run `operation` as one transaction and return the number of rows changed.
+
+        The operation must not commit: the writer commits on success and rolls
+        back on error. With a writer task running on this loop, callers wait
+        while its pending-write queue is full.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._writer_task
+        queue = self._write_queue
+        if task is not None and queue is not None and not task.done() and task.get_loop() is loop:
+            future: asyncio.Future[int] = loop.create_future()
+            await queue.put((operation, future))
+            return await future
+        await self._open_connection()
+        async with self._direct_lock(loop):
+            return await self._apply_write(operation)
 
     @asynccontextmanager
-    async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
-        conn = await aiosqlite.connect(self._db_path)
-        conn.row_factory = aiosqlite.Row
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a pooled read-only connection."""
+        if self._writer is None:
+            await self._open_connection()
+        async with self._reader_slots:
+            if self._idle_readers:
+                conn = self._idle_readers.pop()
+            else:
+                conn = await self._connect()
+                self._readers.append(conn)
+            try:
+                yield conn
+            finally:
+                if conn in self._readers:
+                    self._idle_readers.append(conn)
+
+    async def _connect(self) -> aiosqlite.Connection:
+        conn = aiosqlite.connect(self._db_path)
+        # Pooled connections outlive individual requests; never block interpreter exit.
+        conn.daemon = True
+        opened = await conn
+        opened.row_factory = aiosqlite.Row
+        for statement in self._pragmas.connection_statements():
+            await opened.execute(statement)
+        return opened
+
+    def _direct_lock(self, loop: asyncio.AbstractEventLoop) -> asyncio.Lock:
+        # asyncio locks bind to the loop that first waits on them.
+        if self._direct_write_lock is None or self._direct_write_loop is not loop:
+            self._direct_write_lock = asyncio.Lock()
+            self._direct_write_loop = loop
+        return self._direct_write_lock
+
+    async def _stop_writer_task(self) -> None:
+        task = self._writer_task
+        queue = self._write_queue
+        self._writer_task = None
+        self._write_queue = None
+        if task is None or task.done():
+            return
+        if task.get_loop() is not asyncio.get_running_loop():
+            if not task.get_loop().is_closed():
+                task.get_loop().call_soon_threadsafe(task.cancel)
+            return
+        if queue is not None:
+            await queue.join()
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def _run_writer(self, queue: asyncio.Queue[_WriteRequest]) -> None:
+        while True:
+            operation, future = await queue.get()
+            try:
+                if not future.done():
+                    changes = await self._apply_write(operation)
+                    if not future.done():
+                        future.set_result(changes)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+            finally:
+                queue.task_done()
+
+    async def _apply_write(self, operation: WriteOperation) -> int:
+        conn = self._writer
+        if conn is None:
+            msg = "SQLiteStore is closed"
+            raise RuntimeError(msg)
+        changes_before = conn.total_changes
         try:
-            await apply_migrations(conn)
-            yield conn
-        finally:
-            await conn.close()
+            await operation(conn)
+            await conn.commit()
+        except BaseException:
+            await conn.rollback()
+            raise
+        return conn.total_changes - changes_before
 
     async def upsert_project(self, project: Project) -> None:
-        async with self.connection() as conn:
+        async def operation(conn: aiosqlite.Connection) -> None:
             await conn.execute(
                 """
                 INSERT INTO projects(
@@ -61,20 +422,21 @@ class SQLiteStore:
                     project.git_remote,
                     str(project.nat_config_path) if project.nat_config_path else None,
                     project.status.value,
-                    project.created_at.isoformat(),
-                    project.updated_at.isoformat(),
+                    to_epoch_micros(project.created_at),
+                    to_epoch_micros(project.updated_at),
                 ),
             )
-            await conn.commit()
+
+        await self.write(operation)
 
     async def list_projects(self) -> list[Project]:
-        async with self.connection() as conn:
+        async with self.reader() as conn:
             cursor = await conn.execute("SELECT * FROM projects ORDER BY created_at ASC")
             rows = await cursor.fetchall()
         return [self._project_from_row(row) for row in rows]
 
     async def get_project(self, project_id: str) -> Project | None:
-        async with self.connection() as conn:
+        async with self.reader() as conn:
             cursor = await conn.execute("SELECT * FROM projects WHERE id = ?", (project_id,))
             row = await cursor.fetchone()
         if row is None:
@@ -82,26 +444,262 @@ class SQLiteStore:
         return self._project_from_row(row)
 
     async def delete_project(self, project_id: str) -> None:
-        async with self.connection() as conn:
+        async def operation(conn: aiosqlite.Connection) -> None:
             await conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
-            await conn.commit()
 
-    async def append_event(self, event: ATTEvent) -> None:
-        async with self.connection() as conn:
+        await self.write(operation)
+
+    async def upsert_test_run(self, run: TestRun) -> None:
+        async def operation(conn: aiosqlite.Connection) -> None:
             await conn.execute(
                 """
-                INSERT INTO att_events(id, project_id, event_type, payload, timestamp)
-                VALUES (?, ?, ?, ?, ?)
+                INSERT INTO test_runs(
+                    id,
+                    project_id,
+                    suite,
+                    markers,
+                    timeout_seconds,
+                    shards,
+                    status,
+                    result,
+                    error,
+                    created_at,
+                    started_at,
+                    finished_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    status=excluded.status,
+                    result=excluded.result,
+                    error=excluded.error,
+                    started_at=excluded.started_at,
+                    finished_at=excluded.finished_at
                 """,
                 (
-                    event.id,
-                    event.project_id,
-                    event.event_type.value,
-                    json.dumps(event.payload),
-                    event.timestamp.isoformat(),
+                    run.id,
+                    run.project_id,
+                    run.suite,
+                    run.markers,
+                    run.timeout_seconds,
+                    run.shards,
+                    run.status.value,
+                    json.dumps(run.result) if run.result is not None else None,
+                    run.error,
+                    to_epoch_micros(run.created_at),
+                    to_epoch_micros(run.started_at) if run.started_at else None,
+                    to_epoch_micros(run.finished_at) if run.finished_at else None,
                 ),
             )
-            await conn.commit()
+
+        await self.write(operation)
+
+    async def get_test_run(self, run_id: str) -> TestRun | None:
+        async with self.reader() as conn:
+            cursor = await conn.execute("SELECT * FROM test_runs WHERE id = ?", (run_id,))
+            row = await cursor.fetchone()
+        if row is None:
+            return None
+        return self._test_run_from_row(row)
+
+    async def list_test_runs(
+        self,
+        project_id: str,
+        *,
+        statuses: Sequence[TestRunStatus] | None = None,
+        limit: int | None = None,
+    ) -> list[TestRun]:
+        """Return a project's test runs, newest first."""
+        query = "SELECT * FROM test_runs WHERE project_id = ?"
+        params: list[object] = [project_id]
+        if statuses:
+            query += f" AND status IN ({', '.join('?' for _ in statuses)})"
+            params.extend(status.value for status in statuses)
+        query += " ORDER BY created_at DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        async with self.reader() as conn:
+            cursor = await conn.execute(query, params)
+            rows = await cursor.fetchall()
+        return [self._test_run_from_row(row) for row in rows]
+
+    async def replace_test_case_results(
+        self,
+        run_id: str,
+        project_id: str,
+        results: Sequence[TestCaseResult],
+    ) -> None:
+        async def operation(conn: aiosqlite.Connection) -> None:
+            await conn.execute("DELETE FROM test_case_results WHERE run_id = ?", (run_id,))
+            await conn.executemany(
+                """
+                INSERT OR REPLACE INTO test_case_results(
+                    run_id,
+                    project_id,
+                    nodeid,
+                    outcome,
+                    duration_seconds,
+                    message
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        run_id,
+                        project_id,
+                        result.nodeid,
+                        result.outcome,
+                        result.duration_seconds,
+                        result.message,
+                    )
+                    for result in results
+                ],
+            )
+
+        await self.write(operation)
+
+    async def list_test_case_results(self, run_id: str) -> list[TestCaseResult]:
+        async with self.reader() as conn:
+            cursor = await conn.execute(
+                "SELECT * FROM test_case_results WHERE run_id = ? ORDER BY rowid",
+                (run_id,),
+            )
+            rows = await cursor.fetchall()
+        return [self._test_case_from_row(row) for row in rows]
+
+    async def list_test_case_history(
+        self,
+        project_id: str,
+        *,
+        run_limit: int,
+    ) -> list[TestCaseResult]:
+        """Return per-test results of the project's latest finished runs, oldest run first."""
+        async with self.reader() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT results.*
+                FROM test_case_results AS results
+                JOIN (
+                    SELECT id, created_at
+                    FROM test_runs
+                    WHERE project_id = ? AND status IN (?, ?)
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT ?
+                ) AS runs ON runs.id = results.run_id
+                ORDER BY runs.created_at, runs.id, results.rowid
+                """,
+                (
+                    project_id,
+                    TestRunStatus.PASSED.value,
+                    TestRunStatus.FAILED.value,
+                    run_limit,
+                ),
+            )
+            rows = await cursor.fetchall()
+        return [self._test_case_from_row(row) for row in rows]
+
+    async def average_test_durations(self, project_id: str) -> dict[str, float]:
+        """Return each test's mean recorded duration in seconds, keyed by node ID."""
+        async with self.reader() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT nodeid, AVG(duration_seconds) AS duration_seconds
+                FROM test_case_results
+                WHERE project_id = ?
+                GROUP BY nodeid
+                """,
+                (project_id,),
+            )
+            rows = await cursor.fetchall()
+        return {row["nodeid"]: row["duration_seconds"] for row in rows}
+
+    async def fail_unfinished_test_runs(self, error: str) -> int:
+        """Mark queued and running test runs as errored; used after a restart."""
+
+        async def operation(conn: aiosqlite.Connection) -> None:
+            await conn.execute(
+                """
+                UPDATE test_runs
+                SET status = ?, error = ?, finished_at = ?
+                WHERE status IN (?, ?)
+                """,
+                (
+                    TestRunStatus.ERROR.value,
+                    error,
+                    to_epoch_micros(datetime.now(UTC)),
+                    TestRunStatus.QUEUED.value,
+                    TestRunStatus.RUNNING.value,
+                ),
+            )
+
+        return await self.write(operation)
+
+    async def append_event(self, event: ATTEvent) -> None:
+        """Persist one event, group-committing it when an event buffer is configured."""
+        policy = self._event_buffer
+        if policy is None:
+            await self.append_events([event])
+            return
+        self._pending_events.append(event)
+        if len(self._pending_events) >= policy.max_events:
+            await self.flush_events()
+        else:
+            self._schedule_event_flush(policy)
+
+    async def append_events(self, events: Sequence[ATTEvent]) -> None:
+        """Insert a batch of events in a single transaction."""
+        rows = [
+            (
+                event.id,
+                event.project_id,
+                event.event_type.value,
+                encode_payload(event.payload),
+                to_epoch_micros(event.timestamp),
+            )
+            for event in events
+        ]
+        if not rows:
+            return
+
+        async def operation(conn: aiosqlite.Connection) -> None:
+            await conn.executemany(
+                """
+                INSERT INTO att_events(id, project_id, event_type, payload, timestamp)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+
+        await self.write(operation)
+        for listener in self._event_listeners:
+            listener(events)
+
+    async def flush_events(self) -> None:
+        """Commit any buffered events now."""
+        batch = self._pending_events
+        if not batch:
+            return
+        self._pending_events = []
+        try:
+            # Shielded so cancelling a flusher never abandons a batch mid-commit.
+            await asyncio.shield(self.append_events(batch))
+        except Exception:
+            self._pending_events[:0] = batch
+            raise
+
+    def _schedule_event_flush(self, policy: EventBufferPolicy) -> None:
+        loop = asyncio.get_running_loop()
+        task = self._event_flush_task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        self._event_flush_task = loop.create_task(self._delayed_event_flush(policy))
+
+    async def _delayed_event_flush(self, policy: EventBufferPolicy) -> None:
+        await asyncio.sleep(policy.max_delay_ms / 1000)
+        # A failed background flush leaves the batch pending; the next append,
+        # read, explicit flush or close retries it and surfaces the error.
+        with contextlib.suppress(Exception):
+            await self.flush_events()
 
     async def list_events(
         self,
@@ -110,53 +708,458 @@ class SQLiteStore:
         event_type: EventType | None = None,
         since: datetime | None = None,
         until: datetime | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
     ) -> list[ATTEvent]:
-        query = "SELECT * FROM att_events WHERE 1 = 1"
-        params: list[str] = []
+        rows = await self._select_event_rows(
+            project_id=project_id,
+            event_type=event_type,
+            since=since,
+            until=until,
+            after=decode_event_cursor(cursor) if cursor else None,
+            limit=limit,
+        )
+        return [self._event_from_row(row) for row in rows]
+
+    async def list_events_page(
+        self,
+        *,
+        project_id: str | None = None,
+        event_type: EventType | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> EventPage:
+        """Return one keyset page ordered by (timestamp, id).
+
+        Raises `ValueError` for malformed cursors.
+        """
+        page_size = max(1, limit)
+        events = await self.list_events(
+            project_id=project_id,
+            event_type=event_type,
+            since=since,
+            until=until,
+            cursor=cursor,
+            limit=page_size + 1,
+        )
+        has_more = len(events) > page_size
+        items = events[:page_size]
+        next_cursor = encode_event_cursor(items[-1]) if has_more else None
+        return EventPage(items=items, next_cursor=next_cursor)
+
+    async def iter_events(
+        self,
+        *,
+        project_id: str | None = None,
+        event_type: EventType | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        cursor: str | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[ATTEvent]:
+        """Yield matching events batch by batch without materializing the full history.
+
+        A reader connection is only held while each batch is fetched.
+        """
+        next_cursor = cursor
+        while True:
+            page = await self.list_events_page(
+                project_id=project_id,
+                event_type=event_type,
+                since=since,
+                until=until,
+                cursor=next_cursor,
+                limit=batch_size,
+            )
+            for event in page.items:
+                yield event
+            if page.next_cursor is None:
+                return
+            next_cursor = page.next_cursor
+
+    async def iter_event_records(
+        self,
+        *,
+        project_id: str | None = None,
+        event_type: EventType | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        cursor: str | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[EventRecord]:
+        """Like `iter_events`, but yield undecoded rows for re-serialization."""
+        page_size = max(1, batch_size)
+        after = decode_event_cursor(cursor) if cursor else None
+        while True:
+            rows = await self._select_event_rows(
+                project_id=project_id,
+                event_type=event_type,
+                since=since,
+                until=until,
+                after=after,
+                limit=page_size,
+            )
+            for row in rows:
+                yield EventRecord(
+                    id=row["id"],
+                    project_id=row["project_id"],
+                    event_type=row["event_type"],
+                    payload=row["payload"],
+                    timestamp=row["timestamp"],
+                )
+            if len(rows) < page_size:
+                return
+            after = (rows[-1]["timestamp"], rows[-1]["id"])
+
+    async def _select_event_rows(
+        self,
+        *,
+        project_id: str | None,
+        event_type: EventType | None,
+        since: datetime | None,
+        until: datetime | None,
+        after: tuple[int, str] | None,
+        limit: int | None,
+    ) -> list[aiosqlite.Row]:
+        if self._pending_events:
+            await self.flush_events()
+        query, params = self._events_query(
+            project_id=project_id,
+            event_type=event_type,
+            since=since,
+            until=until,
+            after=after,
+            limit=limit,
+        )
+        async with self.reader() as conn:
+            db_cursor = await conn.execute(query, params)
+            return list(await db_cursor.fetchall())
+
+    async def event_groups(self) -> list[tuple[str, EventType]]:
+        """Return the distinct (project_id, event_type) pairs that have raw events."""
+        async with self.reader() as conn:
+            cursor = await conn.execute(
+                "SELECT DISTINCT project_id, event_type FROM att_events ORDER BY 1, 2"
+            )
+            rows = await cursor.fetchall()
+        return [(str(row["project_id"]), EventType(str(row["event_type"]))) for row in rows]
+
+    async def count_events(
+        self,
+        *,
+        project_id: str | None = None,
+        event_type: EventType | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> int:
+        if self._pending_events:
+            await self.flush_events()
+        query, params = self._events_query(
+            project_id=project_id,
+            event_type=event_type,
+            since=since,
+            until=until,
+            count=True,
+        )
+        async with self.reader() as conn:
+            cursor = await conn.execute(query, params)
+            row = await cursor.fetchone()
+        return int(row[0]) if row is not None else 0
 
+    async def compact_events(
+        self, *, project_id: str, event_type: EventType, until: datetime
+    ) -> int:
+        """Fold raw events at or before `until` into daily summaries and delete them.
+
+        Returns the number of raw events removed.
+        """
+        if self._pending_events:
+            await self.flush_events()
+        cutoff = to_epoch_micros(until)
+        deleted = 0
+
+        async def operation(conn: aiosqlite.Connection) -> None:
+            nonlocal deleted
+            await conn.execute(
+                """
+                INSERT INTO att_event_daily_summaries(
+                    project_id,
+                    event_type,
+                    day,
+                    event_count,
+                    first_timestamp,
+                    last_timestamp
+                )
+                SELECT
+                    project_id,
+                    event_type,
+                    strftime('%Y-%m-%d', timestamp / 1000000, 'unixepoch'),
+                    COUNT(*),
+                    MIN(timestamp),
+                    MAX(timestamp)
+                FROM att_events
+                WHERE project_id = ? AND event_type = ? AND timestamp <= ?
+                GROUP BY project_id, event_type, 3
+                ON CONFLICT(project_id, event_type, day) DO UPDATE SET
+                    event_count = event_count + excluded.event_count,
+                    first_timestamp = min(first_timestamp, excluded.first_timestamp),
+                    last_timestamp = max(last_timestamp, excluded.last_timestamp)
+                """,
+                (project_id, event_type.value, cutoff),
+            )
+            cursor = await conn.execute(
+                """
+                DELETE FROM att_events
+                WHERE project_id = ? AND event_type = ? AND timestamp <= ?
+                """,
+                (project_id, event_type.value, cutoff),
+            )
+            deleted = cursor.rowcount
+
+        await self.write(operation)
+        return deleted
+
+    async def list_event_summaries(
+        self,
+        *,
+        project_id: str | None = None,
+        event_type: EventType | None = None,
+    ) -> list[EventDailySummary]:
+        query = "SELECT * FROM att_event_daily_summaries WHERE 1 = 1"
+        params: list[str] = []
         if project_id:
             query += " AND project_id = ?"
             params.append(project_id)
-
         if event_type:
             query += " AND event_type = ?"
             params.append(event_type.value)
+        query += " ORDER BY project_id ASC, day ASC, event_type ASC"
 
-        if since:
-            query += " AND timestamp >= ?"
-            params.append(since.isoformat())
+        async with self.reader() as conn:
+            cursor = await conn.execute(query, tuple(params))
+            rows = await cursor.fetchall()
+        return [
+            EventDailySummary(
+                project_id=str(row["project_id"]),
+                event_type=EventType(str(row["event_type"])),
+                day=date.fromisoformat(str(row["day"])),
+                event_count=int(row["event_count"]),
+                first_timestamp=from_epoch_micros(row["first_timestamp"]),
+                last_timestamp=from_epoch_micros(row["last_timestamp"]),
+            )
+            for row in rows
+        ]
 
-        if until:
-            query += " AND timestamp <= ?"
-            params.append(until.isoformat())
+    async def aggregate_events(
+        self,
+        *,
+        group_by: Sequence[EventGroupField] = ("event_type",),
+        bucket: EventBucket = "day",
+        project_id: str | None = None,
+        event_type: EventType | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        include_compacted: bool = True,
+    ) -> list[EventAggregate]:
+        """Count events per group with SQL GROUP BY instead of loading rows.
 
-        query += " ORDER BY timestamp ASC"
+        `bucket` sets the time-bucket width when grouping by "bucket". Compacted
+        daily summaries are included when they fit the requested granularity;
+        with `since`/`until`, only summaries whose whole span is in range count.
+        """
+        fields = list(dict.fromkeys(group_by))
+        for field in fields:
+            if field not in _EVENT_GROUP_COLUMNS:
+                msg = f"Unsupported group_by field: {field}"
+                raise ValueError(msg)
+        if bucket not in _EVENT_BUCKET_LENGTHS:
+            msg = f"Unsupported bucket: {bucket}"
+            raise ValueError(msg)
+        if self._pending_events:
+            await self.flush_events()
+
+        raw_where, raw_params = self._events_where(
+            project_id=project_id,
+            event_type=event_type,
+            since=since,
+            until=until,
+        )
+        raw_query = (
+            "SELECT project_id, event_type, "
+            "strftime(?, timestamp / 1000000, 'unixepoch') AS bucket, "
+            "COUNT(*) AS event_count FROM att_events"
+        )
+        raw_query += raw_where
+        raw_query += " GROUP BY project_id, event_type, bucket"
+        sources = [raw_query]
+        params: list[str | int] = [_EVENT_BUCKET_FORMATS[bucket], *raw_params]
 
-        async with self.connection() as conn:
+        summary_fits = "bucket" not in fields or bucket != "hour"
+        if include_compacted and summary_fits:
+            summary_query = (
+                "SELECT project_id, event_type, substr(day, 1, ?) AS bucket, "
+                "SUM(event_count) AS event_count FROM att_event_daily_summaries WHERE 1 = 1"
+            )
+            params.append(_EVENT_BUCKET_LENGTHS[bucket])
+            if project_id:
+                summary_query += " AND project_id = ?"
+                params.append(project_id)
+            if event_type:
+                summary_query += " AND event_type = ?"
+                params.append(event_type.value)
+            if since:
+                summary_query += " AND first_timestamp >= ?"
+                params.append(to_epoch_micros(since))
+            if until:
+                summary_query += " AND last_timestamp <= ?"
+                params.append(to_epoch_micros(until))
+            sources.append(summary_query + " GROUP BY project_id, event_type, bucket")
+
+        columns = [_EVENT_GROUP_COLUMNS[field] for field in fields]
+        select = ", ".join([*columns, "SUM(event_count) AS event_count"])
+        query = f"SELECT {select} FROM ({' UNION ALL '.join(sources)})"  # noqa: S608
+        if columns:
+            query += f" GROUP BY {', '.join(columns)} ORDER BY {', '.join(columns)}"
+
+        async with self.reader() as conn:
             cursor = await conn.execute(query, tuple(params))
             rows = await cursor.fetchall()
 
-        return [self._event_from_row(row) for row in rows]
+        aggregates: list[EventAggregate] = []
+        for row in rows:
+            keys = row.keys()
+            count = int(row["event_count"] or 0)
+            if not columns and count == 0:
+                continue
+            aggregates.append(
+                EventAggregate(
+                    count=count,
+                    project_id=str(row["project_id"]) if "project_id" in keys else None,
+                    event_type=EventType(str(row["event_type"])) if "event_type" in keys else None,
+                    bucket=str(row["bucket"]) if "bucket" in keys else None,
+                )
+            )
+        return aggregates
+
+    @staticmethod
+    def _events_query(
+        *,
+        project_id: str | None,
+        event_type: EventType | None,
+        since: datetime | None,
+        until: datetime | None,
+        after: tuple[int, str] | None = None,
+        limit: int | None = None,
+        count: bool = False,
+    ) -> tuple[str, tuple[str | int, ...]]:
+        where, params = SQLiteStore._events_where(
+            project_id=project_id,
+            event_type=event_type,
+            since=since,
+            until=until,
+            after=after,
+        )
+        query = "SELECT COUNT(*) FROM att_events" if count else "SELECT * FROM att_events"
+        query += where
+        if count:
+            return query, tuple(params)
+
+        query += " ORDER BY timestamp ASC, id ASC"
+        if limit is not None and limit > 0:
+            query += " LIMIT ?"
+            params.append(limit)
+        return query, tuple(params)
+
+    @staticmethod
+    def _events_where(
+        *,
+        project_id: str | None,
+        event_type: EventType | None,
+        since: datetime | None,
+        until: datetime | None,
+        after: tuple[int, str] | None = None,
+    ) -> tuple[str, list[str | int]]:
+        # Filters are ordered to match idx_att_events_project_type_timestamp and
+        # idx_att_events_project_timestamp so range scans stay on an index.
+        where = " WHERE 1 = 1"
+        params: list[str | int] = []
+
+        if project_id:
+            where += " AND project_id = ?"
+            params.append(project_id)
+
+        if event_type:
+            where += " AND event_type = ?"
+            params.append(event_type.value)
+
+        # Emit a single lower bound: whichever of `since` and the keyset cursor is
+        # tighter. Overlapping range terms make SQLite pick the narrower index.
+        since_value = to_epoch_micros(since) if since is not None else None
+        if after and (since_value is None or after[0] >= since_value):
+            where += " AND (timestamp, id) > (?, ?)"
+            params.extend(after)
+        elif since_value is not None:
+            where += " AND timestamp >= ?"
+            params.append(since_value)
+
+        if until is not None:
+            where += " AND timestamp <= ?"
+            params.append(to_epoch_micros(until))
+
+        return where, params
 
     @staticmethod
     def _project_from_row(row: aiosqlite.Row) -> Project:
-        return Project(
-            id=str(row["id"]),
-            name=str(row["name"]),
-            path=Path(str(row["path"])),
-            git_remote=str(row["git_remote"]) if row["git_remote"] else None,
-            nat_config_path=Path(str(row["nat_config_path"])) if row["nat_config_path"] else None,
-            status=ProjectStatus(str(row["status"])),
-            created_at=datetime.fromisoformat(str(row["created_at"])),
-            updated_at=datetime.fromisoformat(str(row["updated_at"])),
+        # Rows were validated on the way in, so skip Pydantic validation here.
+        return Project.model_construct(
+            id=row["id"],
+            name=row["name"],
+            path=Path(row["path"]),
+            git_remote=row["git_remote"] or None,
+            nat_config_path=Path(row["nat_config_path"]) if row["nat_config_path"] else None,
+            status=ProjectStatus(row["status"]),
+            created_at=from_epoch_micros(row["created_at"]),
+            updated_at=from_epoch_micros(row["updated_at"]),
+        )
+
+    @staticmethod
+    def _test_case_from_row(row: aiosqlite.Row) -> TestCaseResult:
+        return TestCaseResult.model_construct(
+            nodeid=row["nodeid"],
+            outcome=row["outcome"],
+            duration_seconds=row["duration_seconds"],
+            message=row["message"],
+        )
+
+    @staticmethod
+    def _test_run_from_row(row: aiosqlite.Row) -> TestRun:
+        return TestRun.model_construct(
+            id=row["id"],
+            project_id=row["project_id"],
+            suite=row["suite"],
+            markers=row["markers"],
+            timeout_seconds=row["timeout_seconds"],
+            shards=row["shards"],
+            status=TestRunStatus(row["status"]),
+            result=_load_json(row["result"]) if row["result"] is not None else None,
+            error=row["error"],
+            created_at=from_epoch_micros(row["created_at"]),
+            started_at=(
+                from_epoch_micros(row["started_at"]) if row["started_at"] is not None else None
+            ),
+            finished_at=(
+                from_epoch_micros(row["finished_at"]) if row["finished_at"] is not None else None
+            ),
         )
 
     @staticmethod
     def _event_from_row(row: aiosqlite.Row) -> ATTEvent:
-        return ATTEvent(
-            id=str(row["id"]),
-            project_id=str(row["project_id"]),
-            event_type=EventType(str(row["event_type"])),
-            payload=json.loads(str(row["payload"])),
-            timestamp=datetime.fromisoformat(str(row["timestamp"])),
+        return ATTEvent.model_construct(
+            id=row["id"],
+            project_id=row["project_id"],
+            event_type=EventType(row["event_type"]),
+            payload=_load_json(row["payload"]),
+            timestamp=from_epoch_micros(row["timestamp"]),
         )
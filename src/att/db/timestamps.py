@@ -0,0 +1,24 @@
+"""Conversions between datetimes and stored epoch-microsecond integers."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_micros(value: datetime) -> int:
+    """Return microseconds since the Unix epoch; naive datetimes are taken as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_epoch_micros(value: int) -> datetime:
+    """Return the UTC datetime for a stored epoch-microsecond value."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def iso_to_epoch_micros(value: str) -> int:
+    return to_epoch_micros(datetime.fromisoformat(value))
@@ -388,6 +388,11 @@ class NATMCPTransportAdapter:
             return True
         return False
 
+    async def close(self) -> None:
+        """Close every cached server session."""
+        for server_name in list(self._sessions):
+            await self.invalidate_session(server_name)
+
     def session_diagnostics(self, server_name: str) -> AdapterSessionDiagnostics:
         """Return non-sensitive diagnostics for one server session."""
         state = self._sessions.get(server_name)
@@ -898,6 +903,16 @@ class MCPClientManager:
             server.initialization_expires_at = None
         return invalidated
 
+    async def close(self) -> None:
+        """Release adapter sessions; registered servers are kept."""
+        adapter = self._adapter_with_session_controls()
+        if adapter is None:
+            return
+        await adapter.close()
+        for server in self._servers.values():
+            server.initialized = False
+            server.initialization_expires_at = None
+
     async def refresh_adapter_session(self, name: str) -> ExternalServer | None:
         """Force refresh adapter session and reinitialize server."""
         server = self._servers.get(name)
@@ -50,6 +50,8 @@ _REGISTERED_TOOLS: Final[list[MCPTool]] = [
     MCPTool(name="att.runtime.logs", description="Get runtime logs"),
     MCPTool(name="att.runtime.status", description="Get runtime status"),
     MCPTool(name="att.test.run", description="Run test suite"),
+    MCPTool(name="att.test.submit", description="Queue a background test run"),
+    MCPTool(name="att.test.status", description="Get a queued test run"),
     MCPTool(name="att.test.results", description="Get latest test results"),
     MCPTool(name="att.debug.errors", description="Get current error snapshots"),
     MCPTool(name="att.debug.logs", description="Get filtered debug logs"),
@@ -63,6 +65,10 @@ _REGISTERED_RESOURCES: Final[list[MCPResource]] = [
     MCPResource(uri="att://project/{id}/files", description="Project file tree"),
     MCPResource(uri="att://project/{id}/config", description="NAT config for project"),
     MCPResource(uri="att://project/{id}/tests", description="Latest test results"),
+    MCPResource(
+        uri="att://project/{id}/tests/{run_id}/output",
+        description="Test run console output by cursor",
+    ),
     MCPResource(uri="att://project/{id}/logs", description="Runtime logs"),
     MCPResource(uri="att://project/{id}/ci", description="CI pipeline status"),
 ]
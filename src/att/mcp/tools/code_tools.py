@@ -21,6 +21,12 @@ class CodeToolCall:
     updated: str | None = None
     from_name: str = "original"
     to_name: str = "updated"
+    cursor: int = 0
+    limit: int | None = None
+    max_bytes: int | None = None
+    skip_binary: bool = False
+    regex: bool = False
+    ignore_case: bool = False
 
 
 _CODE_TOOL_OPERATIONS: dict[str, CodeOperation] = {
@@ -53,7 +59,14 @@ def parse_code_tool_call(tool_name: str, arguments: dict[str, Any]) -> CodeToolC
 
     project_id = _required_string(arguments, "project_id")
     if operation == "list":
-        return CodeToolCall(operation="list", project_id=project_id)
+        return CodeToolCall(
+            operation="list",
+            project_id=project_id,
+            cursor=_optional_non_negative_int(arguments, "cursor") or 0,
+            limit=_optional_non_negative_int(arguments, "limit"),
+            max_bytes=_optional_non_negative_int(arguments, "max_bytes"),
+            skip_binary=_optional_bool(arguments, "skip_binary"),
+        )
     if operation == "read":
         return CodeToolCall(
             operation="read",
@@ -72,6 +85,9 @@ def parse_code_tool_call(tool_name: str, arguments: dict[str, Any]) -> CodeToolC
             operation="search",
             project_id=project_id,
             pattern=_required_string(arguments, "pattern"),
+            limit=_optional_non_negative_int(arguments, "limit"),
+            regex=_optional_bool(arguments, "regex"),
+            ignore_case=_optional_bool(arguments, "ignore_case"),
         )
     msg = f"Code tool operation not implemented: {operation}"
     raise ValueError(msg)
@@ -102,3 +118,23 @@ def _optional_string(arguments: dict[str, Any], key: str) -> str | None:
         return stripped or None
     msg = f"{key} must be a string"
     raise ValueError(msg)
+
+
+def _optional_non_negative_int(arguments: dict[str, Any], key: str) -> int | None:
+    value = arguments.get(key)
+    if value is None:
+        return None
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    msg = f"{key} must be a non-negative integer"
+    raise ValueError(msg)
+
+
+def _optional_bool(arguments: dict[str, Any], key: str) -> bool:
+    value = arguments.get(key)
+    if value is None:
+        return False
+    if isinstance(value, bool):
+        return value
+    msg = f"{key} must be a boolean"
+    raise ValueError(msg)
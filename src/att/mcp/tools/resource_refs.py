@@ -7,7 +7,9 @@ from dataclasses import dataclass
 from typing import Literal
 from urllib.parse import parse_qs
 
-type ResourceOperation = Literal["projects", "files", "config", "tests", "logs", "ci"]
+type ResourceOperation = Literal[
+    "projects", "files", "config", "tests", "test_output", "logs", "ci"
+]
 
 
 @dataclass(slots=True)
@@ -16,6 +18,7 @@ class ResourceRef:
 
     operation: ResourceOperation
     project_id: str | None = None
+    run_id: str | None = None
     cursor: int | None = None
     limit: int | None = None
 
@@ -23,6 +26,7 @@ class ResourceRef:
 _PROJECT_FILES_URI = re.compile(r"^att://project/([^/]+)/files$")
 _PROJECT_CONFIG_URI = re.compile(r"^att://project/([^/]+)/config$")
 _PROJECT_TESTS_URI = re.compile(r"^att://project/([^/]+)/tests$")
+_PROJECT_TEST_OUTPUT_URI = re.compile(r"^att://project/([^/]+)/tests/([^/]+)/output$")
 _PROJECT_LOGS_URI = re.compile(r"^att://project/([^/]+)/logs$")
 _PROJECT_CI_URI = re.compile(r"^att://project/([^/]+)/ci$")
 
@@ -41,7 +45,13 @@ def parse_resource_ref(uri: str) -> ResourceRef | None:
 
     files_match = _PROJECT_FILES_URI.match(base_uri)
     if files_match:
-        return ResourceRef(operation="files", project_id=files_match.group(1))
+        cursor, limit = _parse_cursor_query(query, "files")
+        return ResourceRef(
+            operation="files",
+            project_id=files_match.group(1),
+            cursor=cursor,
+            limit=limit,
+        )
 
     config_match = _PROJECT_CONFIG_URI.match(base_uri)
     if config_match:
@@ -51,9 +61,20 @@ def parse_resource_ref(uri: str) -> ResourceRef | None:
     if tests_match:
         return ResourceRef(operation="tests", project_id=tests_match.group(1))
 
+    test_output_match = _PROJECT_TEST_OUTPUT_URI.match(base_uri)
+    if test_output_match:
+        cursor, limit = _parse_cursor_query(query, "test output")
+        return ResourceRef(
+            operation="test_output",
+            project_id=test_output_match.group(1),
+            run_id=test_output_match.group(2),
+            cursor=cursor,
+            limit=limit,
+        )
+
     logs_match = _PROJECT_LOGS_URI.match(base_uri)
     if logs_match:
-        cursor, limit = _parse_logs_query(query)
+        cursor, limit = _parse_cursor_query(query, "logs")
         return ResourceRef(
             operation="logs",
             project_id=logs_match.group(1),
@@ -68,12 +89,12 @@ def parse_resource_ref(uri: str) -> ResourceRef | None:
     return None
 
 
-def _parse_logs_query(query: str) -> tuple[int | None, int | None]:
+def _parse_cursor_query(query: str, resource: str) -> tuple[int | None, int | None]:
     if not query:
         return None, None
     parsed = parse_qs(query, strict_parsing=True)
     if not set(parsed).issubset({"cursor", "limit"}):
-        msg = "unsupported query parameters for logs resource"
+        msg = f"unsupported query parameters for {resource} resource"
         raise ValueError(msg)
     cursor = _parse_optional_non_negative_int(parsed, "cursor")
     limit = _parse_optional_non_negative_int(parsed, "limit")
@@ -5,7 +5,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Literal
 
-type TestOperation = Literal["run", "results"]
+from att.models.test_run import MAX_TEST_SHARDS
+
+type TestOperation = Literal["run", "submit", "status", "results"]
 
 
 @dataclass(slots=True)
@@ -17,10 +19,14 @@ class MCPTestToolCall:
     suite: str = "unit"
     markers: str | None = None
     timeout_seconds: int | None = None
+    shards: int = 1
+    run_id: str | None = None
 
 
 _TEST_TOOL_OPERATIONS: dict[str, TestOperation] = {
     "att.test.run": "run",
+    "att.test.submit": "submit",
+    "att.test.status": "status",
     "att.test.results": "results",
 }
 
@@ -38,12 +44,19 @@ def parse_test_tool_call(tool_name: str, arguments: dict[str, Any]) -> MCPTestTo
     suite = _optional_string(arguments, "suite") or "unit"
     markers = _optional_string(arguments, "markers")
     timeout_seconds = _optional_positive_int(arguments, "timeout_seconds")
+    shards = _optional_positive_int(arguments, "shards") or 1
+    if shards > MAX_TEST_SHARDS:
+        msg = f"shards must be at most {MAX_TEST_SHARDS}"
+        raise ValueError(msg)
+    run_id = _required_string(arguments, "run_id") if operation == "status" else None
     return MCPTestToolCall(
         operation=operation,
         project_id=project_id,
         suite=suite,
         markers=markers,
         timeout_seconds=timeout_seconds,
+        shards=shards,
+        run_id=run_id,
     )
 
 
@@ -0,0 +1,79 @@
+"""Background test run models."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from enum import Enum
+from typing import ClassVar, Literal
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+type TestOutcome = Literal["passed", "failed", "error", "skipped", "xfailed"]
+
+MAX_TEST_SHARDS = 64
+
+
+class TestRunStatus(str, Enum):
+    """Lifecycle status for a queued test run."""
+
+    __test__ = False  # not a pytest test class
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    PASSED = "passed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    ERROR = "error"
+
+    @property
+    def finished(self) -> bool:
+        return self not in {TestRunStatus.QUEUED, TestRunStatus.RUNNING}
+
+
+class TestRun(BaseModel):
+    """One submitted test run and, once finished, its result payload."""
+
+    __test__: ClassVar[bool] = False  # not a pytest test class
+
+    id: str = Field(default_factory=lambda: str(uuid4()))
+    project_id: str
+    suite: str = "unit"
+    markers: str | None = None
+    timeout_seconds: int | None = None
+    shards: int = 1
+    status: TestRunStatus = TestRunStatus.QUEUED
+    result: dict[str, str | int | float | bool] | None = None
+    error: str | None = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
+class TestCaseResult(BaseModel):
+    """Outcome and duration of one test case from a pytest JUnit report."""
+
+    __test__: ClassVar[bool] = False  # not a pytest test class
+
+    nodeid: str
+    outcome: TestOutcome
+    duration_seconds: float
+    message: str | None = None
+
+
+class TestStats(BaseModel):
+    """Outcome and duration history of one test across recent runs."""
+
+    __test__: ClassVar[bool] = False  # not a pytest test class
+
+    nodeid: str
+    runs: int
+    failures: int
+    flips: int
+    failure_rate: float
+    flake_rate: float
+    mean_duration_seconds: float
+    max_duration_seconds: float
+    recent_mean_duration_seconds: float
+    baseline_mean_duration_seconds: float | None = None
+    last_outcome: TestOutcome
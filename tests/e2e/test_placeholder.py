@@ -1,25 +1,29 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
 
 from att.api.app import create_app
+from att.api.container import AppContainer
 from att.api.deps import get_project_manager
 from att.core.project_manager import ProjectManager
 from att.db.store import SQLiteStore
 
 
-def _client(tmp_path: Path) -> TestClient:
-    app = create_app()
+@pytest.fixture
+def client(tmp_path: Path) -> Iterator[TestClient]:
+    app = create_app(AppContainer(db_path=tmp_path / "app.db"))
     app.dependency_overrides[get_project_manager] = lambda: ProjectManager(
         SQLiteStore(tmp_path / "att.db")
     )
-    return TestClient(app)
+    with TestClient(app) as test_client:
+        yield test_client
 
 
-def test_e2e_health_and_mcp_discovery(tmp_path: Path) -> None:
-    client = _client(tmp_path)
+def test_e2e_health_and_mcp_discovery(client: TestClient) -> None:
 
     health = client.get("/api/v1/health")
     assert health.status_code == 200
@@ -33,8 +37,7 @@ def test_e2e_health_and_mcp_discovery(tmp_path: Path) -> None:
     assert payload["endpoint"] == "/mcp"
 
 
-def test_e2e_mcp_transport_list_surface(tmp_path: Path) -> None:
-    client = _client(tmp_path)
+def test_e2e_mcp_transport_list_surface(client: TestClient) -> None:
 
     response = client.post(
         "/mcp",
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import json
+from collections.abc import Mapping
 from datetime import UTC, datetime
 from pathlib import Path
 
 from fastapi.testclient import TestClient
 
 from att.api.app import create_app
+from att.api.container import AppContainer
 from att.api.deps import (
     get_code_manager,
     get_debug_log_store,
@@ -14,8 +17,7 @@ from att.api.deps import (
     get_git_manager,
     get_project_manager,
     get_runtime_manager,
-    get_test_result_store,
-    get_test_runner,
+    get_test_run_manager,
 )
 from att.core.code_manager import CodeManager
 from att.core.debug_manager import DebugManager
@@ -23,39 +25,43 @@ from att.core.deploy_manager import DeployStatus
 from att.core.git_manager import GitResult
 from att.core.project_manager import ProjectManager
 from att.core.runtime_manager import RuntimeHealthProbe, RuntimeLogRead, RuntimeState
-from att.core.test_runner import RunResult, TestResultPayload
+from att.core.test_run_manager import TestRunManager
+from att.core.test_runner import RunResult, TestOutputStream
 from att.db.store import SQLiteStore
+from att.models.test_run import TestCaseResult
 
 
 class FakeGitManager:
     def __init__(self) -> None:
         self.calls: list[str] = []
 
-    def status(self, project_path: Path) -> GitResult:
+    async def status(self, project_path: Path) -> GitResult:
         self.calls.append(f"status:{project_path}")
         return GitResult(command="git status --short", output="M README.md")
 
-    def commit(self, project_path: Path, message: str) -> GitResult:
+    async def commit(self, project_path: Path, message: str) -> GitResult:
         self.calls.append(f"commit:{message}")
         return GitResult(command="git commit", output=f"committed:{message}")
 
-    def push(self, project_path: Path, remote: str = "origin", branch: str = "HEAD") -> GitResult:
+    async def push(
+        self, project_path: Path, remote: str = "origin", branch: str = "HEAD"
+    ) -> GitResult:
         self.calls.append(f"push:{remote}:{branch}")
         return GitResult(command="git push", output=f"pushed:{remote}/{branch}")
 
-    def branch(self, project_path: Path, name: str, *, checkout: bool = True) -> GitResult:
+    async def branch(self, project_path: Path, name: str, *, checkout: bool = True) -> GitResult:
         self.calls.append(f"branch:{name}:{checkout}")
         return GitResult(command="git branch", output=f"branch:{name}")
 
-    def log(self, project_path: Path, limit: int = 20) -> GitResult:
+    async def log(self, project_path: Path, limit: int = 20) -> GitResult:
         self.calls.append(f"log:{limit}")
         return GitResult(command="git log", output="abc123 init")
 
-    def actions(self, project_path: Path, limit: int = 10) -> GitResult:
+    async def actions(self, project_path: Path, limit: int = 10) -> GitResult:
         self.calls.append(f"actions:{limit}")
         return GitResult(command="gh run list", output='[{"status":"completed"}]')
 
-    def pr_create(
+    async def pr_create(
         self,
         project_path: Path,
         *,
@@ -67,7 +73,7 @@ class FakeGitManager:
         self.calls.append(f"pr_create:{title}:{base}:{head}")
         return GitResult(command="gh pr create", output="https://example.com/pr/1")
 
-    def pr_merge(
+    async def pr_merge(
         self,
         project_path: Path,
         *,
@@ -77,7 +83,7 @@ class FakeGitManager:
         self.calls.append(f"pr_merge:{pull_request}:{strategy}")
         return GitResult(command="gh pr merge", output="merged")
 
-    def pr_reviews(self, project_path: Path, *, pull_request: str) -> GitResult:
+    async def pr_reviews(self, project_path: Path, *, pull_request: str) -> GitResult:
         self.calls.append(f"pr_reviews:{pull_request}")
         return GitResult(command="gh pr view", output='{"reviews":[]}')
 
@@ -146,19 +152,29 @@ class FakeRuntimeManager:
 
 
 class FakeTestRunner:
-    def run(
+    async def run(
         self,
         project_path: Path,
         suite: str = "unit",
         *,
         markers: str | None = None,
         timeout_seconds: int | None = None,
+        output: TestOutputStream | None = None,
+        shards: int = 1,
+        durations: Mapping[str, float] | None = None,
     ) -> RunResult:
-        del project_path, markers, timeout_seconds
+        del output, shards, durations, project_path, markers, timeout_seconds
         return RunResult(
             command=f"pytest tests/{suite}",
             returncode=0,
             output=f"{suite}:ok",
+            tests=[
+                TestCaseResult(
+                    nodeid=f"tests/{suite}/test_ok.py::test_ok",
+                    outcome="passed",
+                    duration_seconds=0.5,
+                )
+            ],
         )
 
 
@@ -179,28 +195,27 @@ class FakeDeployManager:
 
 def _client_with_project(
     tmp_path: Path,
-) -> tuple[TestClient, str, dict[str, list[str]], dict[str, TestResultPayload], FakeGitManager]:
+) -> tuple[TestClient, str, dict[str, list[str]], TestRunManager, FakeGitManager]:
     app = create_app()
 
-    project_manager = ProjectManager(SQLiteStore(tmp_path / "att.db"))
+    store = SQLiteStore(tmp_path / "att.db")
+    project_manager = ProjectManager(store)
     code_manager = CodeManager()
     debug_manager = DebugManager()
     git_manager = FakeGitManager()
     runtime_manager = FakeRuntimeManager()
-    test_runner = FakeTestRunner()
+    test_runs = TestRunManager(store, FakeTestRunner())
     deploy_manager = FakeDeployManager()
     debug_logs: dict[str, list[str]] = {}
-    test_results: dict[str, TestResultPayload] = {}
 
     app.dependency_overrides[get_project_manager] = lambda: project_manager
     app.dependency_overrides[get_code_manager] = lambda: code_manager
     app.dependency_overrides[get_debug_manager] = lambda: debug_manager
     app.dependency_overrides[get_git_manager] = lambda: git_manager
     app.dependency_overrides[get_runtime_manager] = lambda: runtime_manager
-    app.dependency_overrides[get_test_runner] = lambda: test_runner
     app.dependency_overrides[get_deploy_manager] = lambda: deploy_manager
     app.dependency_overrides[get_debug_log_store] = lambda: debug_logs
-    app.dependency_overrides[get_test_result_store] = lambda: test_results
+    app.dependency_overrides[get_test_run_manager] = lambda: test_runs
 
     client = TestClient(app)
 
@@ -214,7 +229,7 @@ def _client_with_project(
     assert create.status_code == 201
     project_id = create.json()["id"]
 
-    return client, project_id, debug_logs, test_results, git_manager
+    return client, project_id, debug_logs, test_runs, git_manager
 
 
 def test_code_endpoints_round_trip(tmp_path: Path) -> None:
@@ -233,6 +248,18 @@ def test_code_endpoints_round_trip(tmp_path: Path) -> None:
     listing = client.get(f"/api/v1/projects/{project_id}/files")
     assert listing.status_code == 200
     assert "src/app.py" in listing.json()["files"]
+    assert listing.json()["next_cursor"] is None
+
+    total = listing.json()["total"]
+    first_page = client.get(f"/api/v1/projects/{project_id}/files", params={"limit": 1}).json()
+    assert len(first_page["files"]) == 1
+    assert first_page["next_cursor"] == (1 if total > 1 else None)
+
+    streamed = client.get(f"/api/v1/projects/{project_id}/files/stream")
+    assert streamed.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line)["path"] for line in streamed.text.splitlines()] == (
+        listing.json()["files"]
+    )
 
     search = client.post(
         f"/api/v1/projects/{project_id}/files/search",
@@ -240,6 +267,29 @@ def test_code_endpoints_round_trip(tmp_path: Path) -> None:
     )
     assert search.status_code == 200
     assert search.json()["matches"] == ["src/app.py"]
+    assert search.json()["results"][0]["path"] == "src/app.py"
+    assert search.json()["truncated"] is False
+    regex_search = client.post(
+        f"/api/v1/projects/{project_id}/files/search",
+        json={"pattern": "HEL+O", "regex": True, "ignore_case": True},
+    )
+    assert regex_search.json()["matches"] == ["src/app.py"]
+    bad_regex = client.post(
+        f"/api/v1/projects/{project_id}/files/search",
+        json={"pattern": "(", "regex": True},
+    )
+    assert bad_regex.status_code == 400
+    client.put(
+        f"/api/v1/projects/{project_id}/files/src/greet.py",
+        json={"content": "print('hello again')\n"},
+    )
+    capped = client.post(
+        f"/api/v1/projects/{project_id}/files/search",
+        json={"pattern": "hello", "max_results": 1},
+    )
+    assert capped.json()["matches"] == ["src/app.py"]
+    assert len(capped.json()["results"]) == 1
+    assert capped.json()["truncated"] is True
 
     diff = client.get(
         f"/api/v1/projects/{project_id}/files/diff",
@@ -414,3 +464,58 @@ def test_feature_endpoints_validate_project_exists(tmp_path: Path) -> None:
     assert client.get(f"/api/v1/projects/{missing}/test/results").status_code == 404
     assert client.get(f"/api/v1/projects/{missing}/debug/logs").status_code == 404
     assert client.get(f"/api/v1/projects/{missing}/deploy/status").status_code == 404
+
+
+def test_test_runs_are_queued_and_polled(tmp_path: Path) -> None:
+    container = AppContainer(db_path=tmp_path / "att.db")
+    container.test_run_manager = TestRunManager(container.store, FakeTestRunner())
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+
+    with TestClient(create_app(container)) as client:
+        create = client.post("/api/v1/projects", json={"name": "demo", "path": str(project_path)})
+        project_id = create.json()["id"]
+
+        submit = client.post(
+            f"/api/v1/projects/{project_id}/test/runs",
+            json={"suite": "integration"},
+        )
+        assert submit.status_code == 202
+        run_id = submit.json()["id"]
+        assert submit.json()["status"] == "queued"
+
+        polled = client.get(
+            f"/api/v1/projects/{project_id}/test/runs/{run_id}",
+            params={"wait_seconds": 5},
+        )
+        assert polled.status_code == 200
+        assert polled.json()["status"] == "passed"
+        assert polled.json()["result"]["output"] == "integration:ok"
+
+        history = client.get(f"/api/v1/projects/{project_id}/test/runs")
+        assert [item["id"] for item in history.json()["items"]] == [run_id]
+        latest = client.get(f"/api/v1/projects/{project_id}/test/results")
+        assert latest.json()["run_id"] == run_id
+        ranked = client.get(f"/api/v1/projects/{project_id}/test/history").json()
+        assert ranked["runs"] == 1
+        assert ranked["slowest"][0]["nodeid"] == "tests/integration/test_ok.py::test_ok"
+        assert ranked["flaky"] == []
+
+        output = client.get(
+            f"/api/v1/projects/{project_id}/test/runs/{run_id}/output",
+            params={"cursor": 0},
+        )
+        assert output.json()["logs"] == ["integration:ok"]
+        assert output.json()["finished"] is True
+
+        stream = client.get(
+            f"/api/v1/projects/{project_id}/test/runs/{run_id}/output/stream",
+            headers={"Last-Event-ID": "0"},
+        )
+        assert stream.headers["content-type"].startswith("text/event-stream")
+        assert "id: 1\nevent: output\n" in stream.text
+        assert '"logs": ["integration:ok"]' in stream.text
+        assert "event: end\n" in stream.text
+
+        missing = client.get(f"/api/v1/projects/{project_id}/test/runs/nope")
+        assert missing.status_code == 404
@@ -1,6 +1,18 @@
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from fastapi import Depends
 from fastapi.testclient import TestClient
 
 from att.api.app import create_app
+from att.api.container import AppContainer
+from att.api.deps import get_self_bootstrap_manager, get_store, get_tool_orchestrator
+from att.core.self_bootstrap_manager import SelfBootstrapManager
+from att.core.tool_orchestrator import ToolOrchestrator
+from att.db.store import SQLiteStore
+from att.models.events import ATTEvent, EventType
 
 
 def test_health_endpoint() -> None:
@@ -8,3 +20,98 @@ def test_health_endpoint() -> None:
     response = client.get("/api/v1/health")
     assert response.status_code == 200
     assert response.json()["status"] == "ok"
+
+
+def test_lifespan_starts_and_closes_app_container(tmp_path: Path) -> None:
+    container = AppContainer(db_path=tmp_path / "att.db")
+    app = create_app(container)
+
+    with TestClient(app) as client:
+        assert container.store.is_open
+        first = client.get("/api/v1/projects")
+        second = client.get("/api/v1/projects")
+        assert first.status_code == second.status_code == 200
+        assert container.project_manager.cache_stats.size == 0
+
+    assert not container.store.is_open
+
+
+def test_dependencies_resolve_to_container_singletons(tmp_path: Path) -> None:
+    container = AppContainer(db_path=tmp_path / "att.db")
+    app = create_app(container)
+    resolved: list[object] = []
+
+    @app.get("/probe")
+    async def probe(
+        store: SQLiteStore = Depends(get_store),
+        orchestrator: ToolOrchestrator = Depends(get_tool_orchestrator),
+        bootstrap: SelfBootstrapManager = Depends(get_self_bootstrap_manager),
+    ) -> dict[str, str]:
+        resolved.extend((store, orchestrator, bootstrap))
+        return {}
+
+    with TestClient(app) as client:
+        client.get("/probe")
+        client.get("/probe")
+
+    assert (
+        resolved
+        == [
+            container.store,
+            container.tool_orchestrator,
+            container.self_bootstrap_manager,
+        ]
+        * 2
+    )
+
+
+def test_dependencies_require_the_lifespan(tmp_path: Path) -> None:
+    app = create_app(AppContainer(db_path=tmp_path / "att.db"))
+
+    @app.get("/probe")
+    async def probe(store: SQLiteStore = Depends(get_store)) -> dict[str, str]:
+        return {}
+
+    client = TestClient(app, raise_server_exceptions=True)
+    with pytest.raises(RuntimeError, match="container is not started"):
+        client.get("/probe")
+
+
+def test_container_commits_events_before_append_returns(tmp_path: Path) -> None:
+    container = AppContainer(db_path=tmp_path / "att.db")
+    event = ATTEvent(project_id="p1", event_type=EventType.TEST_RUN)
+
+    with TestClient(create_app(container)) as client:
+        assert client.portal is not None
+        client.portal.call(container.store.append_event, event)
+        with sqlite3.connect(tmp_path / "att.db") as conn:
+            rows = conn.execute("SELECT id FROM att_events").fetchall()
+
+    assert rows == [(event.id,)]
+
+
+def test_lifespan_applies_retention_policy_from_environment(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ATT_EVENT_RETENTION_DAYS", "1")
+    monkeypatch.setenv("ATT_EVENT_ARCHIVE_DIR", str(tmp_path / "archive"))
+    old = ATTEvent(
+        project_id="p1",
+        event_type=EventType.TEST_RUN,
+        timestamp=datetime.now(UTC) - timedelta(days=3),
+    )
+    app = create_app()
+
+    with TestClient(app) as client:
+        container: AppContainer = app.state.container
+        assert container.event_retention_manager.policy.default_max_age == timedelta(days=1)
+        assert client.portal is not None
+        client.portal.call(container.store.append_event, old)
+        client.portal.call(container.event_retention_manager.compact_once)
+        remaining = client.portal.call(container.store.list_events)
+
+    assert old.id not in {event.id for event in remaining}
+    assert list((tmp_path / "archive" / "p1").glob("*.ndjson.gz"))
+    assert (tmp_path / ".att" / "att.db").is_file()
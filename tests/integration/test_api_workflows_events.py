@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
+import pytest
+from fastapi import WebSocketDisconnect
 from fastapi.testclient import TestClient
 
 from att.api.app import create_app
-from att.api.deps import get_project_manager, get_store, get_tool_orchestrator
+from att.api.deps import get_event_bus, get_project_manager, get_store, get_tool_orchestrator
 from att.core.code_manager import CodeManager
+from att.core.event_bus import EventBus
 from att.core.git_manager import GitResult
 from att.core.project_manager import ProjectManager
 from att.core.test_runner import RunResult
@@ -15,10 +19,10 @@ from att.db.store import SQLiteStore
 
 
 class FakeGitManager:
-    def commit(self, project_path: Path, message: str) -> GitResult:
+    async def commit(self, project_path: Path, message: str) -> GitResult:
         return GitResult(command="git commit", output=f"committed:{message}")
 
-    def status(self, project_path: Path) -> GitResult:
+    async def status(self, project_path: Path) -> GitResult:
         return GitResult(command="git status --short", output="M app.py")
 
 
@@ -26,7 +30,7 @@ class FakeTestRunner:
     def __init__(self, returncode: int = 0) -> None:
         self.returncode = returncode
 
-    def run(self, project_path: Path, suite: str = "unit") -> RunResult:
+    async def run(self, project_path: Path, suite: str = "unit") -> RunResult:
         return RunResult(command=f"pytest tests/{suite}", returncode=self.returncode, output="ok")
 
 
@@ -106,3 +110,145 @@ def test_events_endpoint_rejects_invalid_event_type(tmp_path: Path) -> None:
         params={"event_type": "unknown.event"},
     )
     assert response.status_code == 400
+
+
+def test_events_endpoint_pages_and_streams(tmp_path: Path) -> None:
+    client, _store = _setup_app(tmp_path)
+
+    project_path = tmp_path / "project"
+    project_path.mkdir(parents=True, exist_ok=True)
+    (project_path / "app.py").write_text("print('old')\n", encoding="utf-8")
+    project_id = client.post(
+        "/api/v1/projects",
+        json={"name": "demo", "path": str(project_path)},
+    ).json()["id"]
+    client.post(
+        f"/api/v1/projects/{project_id}/workflows/change-test",
+        json={"file_path": "app.py", "content": "print('new')\n", "suite": "unit"},
+    )
+
+    paged_ids: list[str] = []
+    params: dict[str, str | int] = {"limit": 2}
+    while True:
+        page = client.get(f"/api/v1/projects/{project_id}/events", params=params)
+        assert page.status_code == 200
+        body = page.json()
+        assert len(body["items"]) <= 2
+        paged_ids.extend(item["id"] for item in body["items"])
+        if body["next_cursor"] is None:
+            break
+        params = {"limit": 2, "cursor": body["next_cursor"]}
+
+    full = client.get(f"/api/v1/projects/{project_id}/events").json()
+    assert full["next_cursor"] is None
+    assert paged_ids == [item["id"] for item in full["items"]]
+    assert len(paged_ids) == 4
+
+    stream = client.get(f"/api/v1/projects/{project_id}/events/stream")
+    assert stream.status_code == 200
+    assert stream.headers["content-type"].startswith("application/x-ndjson")
+    streamed = [json.loads(line) for line in stream.text.splitlines()]
+    assert streamed == full["items"]
+    assert all(item["project_id"] == project_id for item in streamed)
+
+    bad_cursor = client.get(
+        f"/api/v1/projects/{project_id}/events/stream",
+        params={"cursor": "%%%"},
+    )
+    assert bad_cursor.status_code == 400
+
+
+def test_events_aggregate_endpoints(tmp_path: Path) -> None:
+    client, _store = _setup_app(tmp_path)
+
+    project_path = tmp_path / "project"
+    project_path.mkdir(parents=True, exist_ok=True)
+    (project_path / "app.py").write_text("print('old')\n", encoding="utf-8")
+    project_id = client.post(
+        "/api/v1/projects",
+        json={"name": "demo", "path": str(project_path)},
+    ).json()["id"]
+    client.post(
+        f"/api/v1/projects/{project_id}/workflows/change-test",
+        json={"file_path": "app.py", "content": "print('new')\n", "suite": "unit"},
+    )
+
+    by_type = client.get(f"/api/v1/projects/{project_id}/events/aggregate")
+    assert by_type.status_code == 200
+    body = by_type.json()
+    assert body["total"] == 4
+    assert {item["event_type"]: item["count"] for item in body["items"]} == {
+        "code.changed": 1,
+        "project.created": 1,
+        "test.passed": 1,
+        "test.run": 1,
+    }
+
+    per_project = client.get(
+        "/api/v1/events/aggregate",
+        params=[("group_by", "project"), ("group_by", "bucket"), ("bucket", "month")],
+    )
+    assert per_project.status_code == 200
+    [item] = per_project.json()["items"]
+    assert item["project_id"] == project_id
+    assert item["event_type"] is None
+    assert item["count"] == 4
+
+    invalid = client.get("/api/v1/events/aggregate", params={"group_by": "payload"})
+    assert invalid.status_code == 422
+
+
+def test_project_websocket_pushes_live_events(tmp_path: Path) -> None:
+    app = create_app()
+    bus = EventBus()
+    store = SQLiteStore(tmp_path / "att.db", event_listeners=(bus.publish,))
+    project_manager = ProjectManager(store)
+    orchestrator = ToolOrchestrator(
+        code_manager=CodeManager(),
+        git_manager=FakeGitManager(),
+        test_runner=FakeTestRunner(returncode=0),
+        store=store,
+    )
+    app.dependency_overrides[get_store] = lambda: store
+    app.dependency_overrides[get_event_bus] = lambda: bus
+    app.dependency_overrides[get_project_manager] = lambda: project_manager
+    app.dependency_overrides[get_tool_orchestrator] = lambda: orchestrator
+    client = TestClient(app)
+
+    project_path = tmp_path / "project"
+    project_path.mkdir(parents=True, exist_ok=True)
+    (project_path / "app.py").write_text("print('old')\n", encoding="utf-8")
+    project_id = client.post(
+        "/api/v1/projects",
+        json={"name": "demo", "path": str(project_path)},
+    ).json()["id"]
+
+    with client.websocket_connect(
+        f"/api/v1/projects/{project_id}/ws?event_type=test.passed&event_type=git.commit"
+    ) as websocket:
+        run = client.post(
+            f"/api/v1/projects/{project_id}/workflows/change-test",
+            json={
+                "file_path": "app.py",
+                "content": "print('new')\n",
+                "suite": "unit",
+                "commit_message": "feat: live",
+            },
+        )
+        assert run.status_code == 200
+
+        first = websocket.receive_json()
+        second = websocket.receive_json()
+
+    assert [first["type"], second["type"]] == ["event", "event"]
+    assert [first["event"]["event_type"], second["event"]["event_type"]] == [
+        "test.passed",
+        "git.commit",
+    ]
+    assert bus.subscriber_count(project_id) == 0
+
+    with (
+        pytest.raises(WebSocketDisconnect),
+        client.websocket_connect("/api/v1/projects/missing/ws") as websocket,
+    ):
+        websocket.receive_json()
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
 
 from att.api.app import create_app
+from att.api.container import AppContainer
 from att.api.deps import get_project_manager, get_runtime_manager
 from att.core.project_manager import ProjectManager
 from att.core.runtime_manager import RuntimeLogRead
@@ -49,18 +52,19 @@ class _FakeRuntimeManager:
         )
 
 
-def _client(tmp_path: Path) -> TestClient:
-    app = create_app()
+@pytest.fixture
+def client(tmp_path: Path) -> Iterator[TestClient]:
+    app = create_app(AppContainer(db_path=tmp_path / "app.db"))
     runtime_manager = _FakeRuntimeManager()
     app.dependency_overrides[get_project_manager] = lambda: ProjectManager(
         SQLiteStore(tmp_path / "att.db")
     )
     app.dependency_overrides[get_runtime_manager] = lambda: runtime_manager
-    return TestClient(app)
+    with TestClient(app) as test_client:
+        yield test_client
 
 
-def test_mcp_transport_list_methods(tmp_path: Path) -> None:
-    client = _client(tmp_path)
+def test_mcp_transport_list_methods(client: TestClient) -> None:
 
     initialize = client.post(
         "/mcp",
@@ -88,8 +92,7 @@ def test_mcp_transport_list_methods(tmp_path: Path) -> None:
     assert "resources" in resources.json()["result"]
 
 
-def test_mcp_transport_tool_call_and_resource_read(tmp_path: Path) -> None:
-    client = _client(tmp_path)
+def test_mcp_transport_tool_call_and_resource_read(client: TestClient, tmp_path: Path) -> None:
 
     project_path = tmp_path / "project"
     project_path.mkdir(parents=True, exist_ok=True)
@@ -198,6 +201,35 @@ def test_mcp_transport_tool_call_and_resource_read(tmp_path: Path) -> None:
     assert listed.status_code == 200
     assert "app.py" in listed.json()["result"]["files"]
 
+    for path in ("lib.py", "main.py"):
+        client.post(
+            "/mcp",
+            json={
+                "jsonrpc": "2.0",
+                "id": f"write-{path}",
+                "method": "tools/call",
+                "params": {
+                    "name": "att.code.write",
+                    "arguments": {"project_id": project_id, "path": path, "content": "print()"},
+                },
+            },
+        )
+    searched = client.post(
+        "/mcp",
+        json={
+            "jsonrpc": "2.0",
+            "id": "6e",
+            "method": "tools/call",
+            "params": {
+                "name": "att.code.search",
+                "arguments": {"project_id": project_id, "pattern": "print", "limit": 2},
+            },
+        },
+    )
+    assert searched.status_code == 200
+    assert searched.json()["result"]["matches"] == ["app.py", "lib.py"]
+    assert searched.json()["result"]["truncated"] is True
+
     downloaded = client.post(
         "/mcp",
         json={
@@ -216,8 +248,7 @@ def test_mcp_transport_tool_call_and_resource_read(tmp_path: Path) -> None:
     assert archive_path.exists()
 
 
-def test_mcp_transport_reports_errors(tmp_path: Path) -> None:
-    client = _client(tmp_path)
+def test_mcp_transport_reports_errors(client: TestClient, tmp_path: Path) -> None:
 
     unknown_method = client.post(
         "/mcp",
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[2]
+
+
+def test_bench_event_decoding_reports_rows_per_second() -> None:
+    env = {**os.environ, "PYTHONPATH": str(_repo_root() / "src")}
+    completed = subprocess.run(
+        [
+            sys.executable,
+            str(_repo_root() / "scripts" / "bench_event_decoding.py"),
+            "--events",
+            "200",
+            "--repeat",
+            "1",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+    lines = completed.stdout.splitlines()
+    assert len(lines) == 6
+    assert all(line.endswith("rows/s") for line in lines)
+    assert any(line.startswith("decode+json: EventRecord") for line in lines)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from att.core.code_manager import CodeManager
+from att.core.code_search import CodeSearchIndex, _required_literals
+
+
+def _write(root: Path, rel_path: str, content: str) -> Path:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def _hits(manager: CodeManager, root: Path, query: str, **options: bool) -> list[tuple[str, int]]:
+    return [(match.path, match.line) for match in manager.search_lines(root, query, **options)]
+
+
+def test_search_lines_supports_substring_regex_and_ignore_case(tmp_path: Path) -> None:
+    _write(tmp_path, "pkg/app.py", "import os\n\ndef Handle_Request(req):\n    return req\n")
+    _write(tmp_path, "pkg/util.py", "def helper():\n    return 'handle_request'\n")
+    (tmp_path / "blob.bin").write_bytes(b"\xff\xfehandle_request")
+    manager = CodeManager()
+
+    assert _hits(manager, tmp_path, "handle_request") == [("pkg/util.py", 2)]
+    assert _hits(manager, tmp_path, "handle_request", ignore_case=True) == [
+        ("pkg/app.py", 3),
+        ("pkg/util.py", 2),
+    ]
+    assert _hits(manager, tmp_path, r"^def \w+\(", regex=True) == [
+        ("pkg/app.py", 3),
+        ("pkg/util.py", 1),
+    ]
+    match = manager.search_lines(tmp_path, "req", max_matches=1)[0]
+    assert (match.path, match.line, match.column) == ("pkg/app.py", 3, 20)
+    assert match.snippet == "def Handle_Request(req):"
+    assert manager.search(tmp_path, "return") == [tmp_path / "pkg/app.py", tmp_path / "pkg/util.py"]
+    with pytest.raises(ValueError, match="Invalid regex"):
+        manager.search_lines(tmp_path, "def (", regex=True)
+    manager.close()
+
+
+def test_index_tracks_writes_and_filesystem_changes(
+    tmp_path: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    index_dir = tmp_path_factory.mktemp("index")
+    changed = _write(tmp_path, "a.py", "alpha = 1\n")
+    removed = _write(tmp_path, "b.py", "beta = 2\n")
+    _age(changed)
+    manager = CodeManager(
+        search_index=CodeSearchIndex(index_dir=index_dir, refresh_interval_seconds=3600),
+    )
+    assert manager.search(tmp_path, "alpha") == [tmp_path / "a.py"]
+
+    manager.write_file(tmp_path, "a.py", "gamma = 3\n")
+    assert manager.search(tmp_path, "alpha") == []
+    assert manager.search(tmp_path, "gamma") == [tmp_path / "a.py"]
+    manager.close()
+
+    removed.unlink()
+    _write(tmp_path, "c.py", "beta = 4\n")
+    changed.write_text("gamma = 5\n", encoding="utf-8")
+    reopened = CodeManager(
+        search_index=CodeSearchIndex(index_dir=index_dir, refresh_interval_seconds=0),
+    )
+    assert _hits(reopened, tmp_path, "beta") == [("c.py", 1)]
+    assert reopened.search_lines(tmp_path, "gamma")[0].snippet == "gamma = 5"
+    reopened.close()
+    assert [path.suffix for path in index_dir.iterdir()] == [".sqlite3"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.py", "c.py"]
+
+
+def test_oversized_files_are_searched_without_index(tmp_path: Path) -> None:
+    _write(tmp_path, "big.txt", "x" * 64 + "\nneedle here\n")
+    _write(tmp_path, "small.txt", "nothing\n")
+    (tmp_path / "big.bin").write_bytes(b"\0needle" * 16)
+    manager = CodeManager(search_index=CodeSearchIndex(max_indexed_bytes=32))
+
+    assert _hits(manager, tmp_path, "needle") == [("big.txt", 2)]
+    manager.close()
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("foo(bar|baz)qux", ["foo", "qux"]),
+        (r"class \w+Error", ["class ", "Error"]),
+        ("abc?def", ["ab", "def"]),
+        ("abc{0,2}de", ["ab", "de"]),
+        ("(?:hello)+ world", ["hello", " world"]),
+        ("(?P<name>key)s*=", ["key", "="]),
+        ("(?=look)ahead(?!tail)", ["ahead"]),
+        (r"(ab)\1c\x41yz", ["ab", "c", "yz"]),
+        (r"x[]a-z]yz\N{BULLET}item", ["x", "yz", "item"]),
+        ("(?x)lit # comment", []),
+        ("one|two", []),
+    ],
+)
+def test_required_literals_only_follow_mandatory_concatenation(
+    pattern: str,
+    expected: list[str],
+) -> None:
+    assert _required_literals(re.compile(pattern)) == expected
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [r"x[^y\n]*z", r"a *b", r"^xz", r"z$", r"\bab\b", r"x(?!z)", r"\w+", r"z +x"],
+)
+def test_single_line_regex_results_match_a_line_by_line_scan(tmp_path: Path, pattern: str) -> None:
+    text = "x\nxz\r\nab\n\nfoo x ab z\nxzx"
+    _write(tmp_path, "t.txt", text)
+    compiled = re.compile(pattern)
+    expected = [
+        (number, found.start() + 1)
+        for number, line in enumerate(text.split("\n"), start=1)
+        if (found := compiled.search(line.removesuffix("\r"))) is not None
+    ]
+    manager = CodeManager()
+
+    matches = manager.search_lines(tmp_path, pattern, regex=True)
+
+    assert [(match.line, match.column) for match in matches] == expected
+    manager.close()
+
+
+def test_matches_may_span_lines(tmp_path: Path) -> None:
+    _write(tmp_path, "t.txt", "x\nxz\r\nab\n\nfoo x ab z\nxzx")
+    manager = CodeManager()
+
+    def positions(query: str, *, regex: bool) -> list[tuple[int, int]]:
+        return [
+            (match.line, match.column)
+            for match in manager.search_lines(tmp_path, query, regex=regex)
+        ]
+
+    assert positions(r"x[^y]*z", regex=True) == [(1, 1), (2, 1), (5, 5), (6, 1)]
+    assert positions(r"z\s+x", regex=True) == [(5, 10)]
+    assert positions("z\nab", regex=False) == [(2, 2)]
+    assert manager.search_lines(tmp_path, "ab z\nxz")[0].snippet == "foo x ab z"
+    manager.close()
@@ -10,6 +10,25 @@ def test_parse_code_list_tool() -> None:
     assert call is not None
     assert call.operation == "list"
     assert call.project_id == "p1"
+    assert (call.cursor, call.limit, call.max_bytes, call.skip_binary) == (0, None, None, False)
+
+    paged = parse_code_tool_call(
+        "att.code.list",
+        {"project_id": "p1", "cursor": 10, "limit": 5, "max_bytes": 100, "skip_binary": True},
+    )
+    assert paged is not None
+    assert (paged.cursor, paged.limit, paged.max_bytes, paged.skip_binary) == (10, 5, 100, True)
+    with pytest.raises(ValueError, match="skip_binary must be a boolean"):
+        parse_code_tool_call("att.code.list", {"project_id": "p1", "skip_binary": "yes"})
+
+
+def test_parse_code_search_options() -> None:
+    call = parse_code_tool_call(
+        "att.code.search",
+        {"project_id": "p1", "pattern": "def \\w+", "regex": True, "ignore_case": True, "limit": 5},
+    )
+    assert call is not None
+    assert (call.pattern, call.regex, call.ignore_case, call.limit) == ("def \\w+", True, True, 5)
 
 
 def test_parse_code_write_requires_content() -> None:
@@ -0,0 +1,63 @@
+import asyncio
+from pathlib import Path
+
+from att.api.routes.events import sse_messages
+from att.core.event_bus import EventBus
+from att.db.store import SQLiteStore
+from att.models.events import ATTEvent, EventType
+
+
+async def test_event_bus_filters_by_project_and_event_type() -> None:
+    bus = EventBus()
+    all_events = bus.subscribe("p1")
+    passed_only = bus.subscribe("p1", [EventType.TEST_PASSED])
+
+    bus.publish(
+        [
+            ATTEvent(project_id="p1", event_type=EventType.TEST_RUN),
+            ATTEvent(project_id="p2", event_type=EventType.TEST_PASSED),
+            ATTEvent(project_id="p1", event_type=EventType.TEST_PASSED),
+        ]
+    )
+
+    assert (await all_events.get()).event_type == EventType.TEST_RUN
+    assert (await all_events.get()).event_type == EventType.TEST_PASSED
+    passed = await passed_only.get()
+    assert (passed.project_id, passed.event_type) == ("p1", EventType.TEST_PASSED)
+
+    bus.unsubscribe(all_events)
+    bus.unsubscribe(passed_only)
+    assert bus.subscriber_count("p1") == 0
+
+
+async def test_event_bus_drops_oldest_for_slow_subscribers() -> None:
+    bus = EventBus(max_queue_size=2)
+    subscription = bus.subscribe("p1")
+    events = [ATTEvent(project_id="p1", event_type=EventType.TEST_RUN) for _ in range(5)]
+
+    bus.publish(events)
+
+    assert subscription.take_dropped() == 3
+    assert subscription.take_dropped() == 0
+    assert [await subscription.get(), await subscription.get()] == events[3:]
+
+
+async def test_store_publishes_committed_events_to_sse_stream(tmp_path: Path) -> None:
+    bus = EventBus()
+    store = SQLiteStore(tmp_path / "att.db", event_listeners=(bus.publish,))
+    subscription = bus.subscribe("p1", [EventType.TEST_FAILED])
+    frames = sse_messages(bus, subscription, keepalive_seconds=0.01)
+
+    assert await anext(frames) == ": keepalive\n\n"
+    event = ATTEvent(project_id="p1", event_type=EventType.TEST_FAILED, payload={"n": 1})
+    await store.append_events(
+        [ATTEvent(project_id="p1", event_type=EventType.TEST_RUN), event],
+    )
+
+    frame = await asyncio.wait_for(anext(frames), timeout=1)
+    assert frame.startswith(f"id: {event.id}\nevent: test.failed\ndata: ")
+    assert '"payload":{"n":1}' in frame
+
+    await frames.aclose()
+    await store.close()
+    assert bus.subscriber_count("p1") == 0
@@ -0,0 +1,119 @@
+import gzip
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from att.core.event_retention import EventRetentionManager, RetentionPolicy, RetentionRule
+from att.db.store import SQLiteStore
+from att.models.events import ATTEvent, EventType
+
+NOW = datetime(2026, 3, 10, 12, 0, tzinfo=UTC)
+
+
+def _event(project_id: str, event_type: EventType, days_ago: float) -> ATTEvent:
+    return ATTEvent(
+        project_id=project_id,
+        event_type=event_type,
+        timestamp=NOW - timedelta(days=days_ago),
+    )
+
+
+def test_retention_policy_prefers_most_specific_rule() -> None:
+    policy = RetentionPolicy(
+        default_max_age=timedelta(days=30),
+        rules=(
+            RetentionRule(max_age=timedelta(days=7), event_type=EventType.TEST_RUN),
+            RetentionRule(max_age=timedelta(days=90), project_id="p1"),
+            RetentionRule(
+                max_age=timedelta(days=1),
+                project_id="p1",
+                event_type=EventType.TEST_RUN,
+            ),
+        ),
+    )
+
+    assert policy.max_age_for("p1", EventType.TEST_RUN) == timedelta(days=1)
+    assert policy.max_age_for("p1", EventType.ERROR) == timedelta(days=90)
+    assert policy.max_age_for("p2", EventType.TEST_RUN) == timedelta(days=7)
+    assert policy.max_age_for("p2", EventType.ERROR) == timedelta(days=30)
+    assert not RetentionPolicy().enabled
+
+
+def test_retention_policy_reads_the_environment() -> None:
+    policy = RetentionPolicy.from_env(
+        {
+            "ATT_EVENT_RETENTION_DAYS": "30",
+            "ATT_EVENT_RETENTION_RULES": "test.passed=7, code.changed=0.5",
+            "ATT_EVENT_ARCHIVE_DIR": "/var/att/archive",
+        }
+    )
+
+    assert policy.default_max_age == timedelta(days=30)
+    assert policy.max_age_for("p1", EventType.TEST_PASSED) == timedelta(days=7)
+    assert policy.max_age_for("p1", EventType.CODE_CHANGED) == timedelta(hours=12)
+    assert policy.archive_dir == Path("/var/att/archive")
+    assert RetentionPolicy.from_env({}) == RetentionPolicy()
+    with pytest.raises(ValueError, match="ATT_EVENT_RETENTION_DAYS"):
+        RetentionPolicy.from_env({"ATT_EVENT_RETENTION_DAYS": "forever"})
+    with pytest.raises(ValueError, match="Unknown event type"):
+        RetentionPolicy.from_env({"ATT_EVENT_RETENTION_RULES": "nope=1"})
+
+
+@pytest.mark.asyncio
+async def test_compaction_rolls_expired_events_into_daily_summaries(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    await store.append_events(
+        [
+            _event("p1", EventType.TEST_RUN, days_ago=10),
+            _event("p1", EventType.TEST_RUN, days_ago=10.1),
+            _event("p1", EventType.TEST_RUN, days_ago=9),
+            _event("p1", EventType.TEST_RUN, days_ago=1),
+            _event("p1", EventType.ERROR, days_ago=10),
+        ]
+    )
+    manager = EventRetentionManager(
+        store,
+        RetentionPolicy(
+            rules=(RetentionRule(max_age=timedelta(days=5), event_type=EventType.TEST_RUN),),
+        ),
+        now_provider=lambda: NOW,
+    )
+
+    results = await manager.compact_once()
+
+    assert [(result.event_type, result.compacted) for result in results] == [
+        (EventType.TEST_RUN, 3)
+    ]
+    remaining = await store.list_events(project_id="p1")
+    assert sorted(event.event_type.value for event in remaining) == ["error", "test.run"]
+    summaries = await store.list_event_summaries(project_id="p1")
+    assert [(summary.day.isoformat(), summary.event_count) for summary in summaries] == [
+        ("2026-02-28", 2),
+        ("2026-03-01", 1),
+    ]
+    assert await manager.compact_once() == []
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_compaction_archives_raw_rows_before_deleting(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    expired = _event("p1", EventType.DEPLOY_COMPLETED, days_ago=40)
+    await store.append_events([expired, _event("p1", EventType.DEPLOY_COMPLETED, days_ago=1)])
+    manager = EventRetentionManager(
+        store,
+        RetentionPolicy(default_max_age=timedelta(days=30), archive_dir=tmp_path / "archive"),
+        now_provider=lambda: NOW,
+    )
+
+    [result] = await manager.compact_once()
+
+    assert result.archive_path is not None
+    assert result.archive_path.parent == tmp_path / "archive" / "p1"
+    with gzip.open(result.archive_path, "rt", encoding="utf-8") as handle:
+        archived = [json.loads(line) for line in handle]
+    assert [row["id"] for row in archived] == [expired.id]
+    assert len(await store.list_events(project_id="p1")) == 1
+    await store.close()
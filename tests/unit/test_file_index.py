@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+from att.core.code_manager import CodeManager
+from att.core.file_index import FileFilter, FileIndex
+
+
+def _write(root: Path, rel_path: str, content: str = "") -> Path:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def _relative(root: Path, paths: list[Path]) -> list[str]:
+    return [path.relative_to(root).as_posix() for path in paths]
+
+
+def test_list_files_skips_git_and_ignored_paths(tmp_path: Path) -> None:
+    _write(tmp_path, ".gitignore", "node_modules/\n*.log\n")
+    _write(tmp_path, ".git/HEAD", "ref: refs/heads/main\n")
+    _write(tmp_path, "node_modules/pkg/index.js")
+    _write(tmp_path, "app.log")
+    _write(tmp_path, "src/app.py")
+    _write(tmp_path, "src/.gitignore", "!keep.log\n")
+    _write(tmp_path, "src/keep.log")
+    _write(tmp_path, "src.txt")
+
+    files = FileIndex().list_files(tmp_path)
+
+    assert _relative(tmp_path, files) == [
+        ".gitignore",
+        "src/.gitignore",
+        "src/app.py",
+        "src/keep.log",
+        "src.txt",
+    ]
+
+
+def test_list_files_refreshes_changed_directories(tmp_path: Path) -> None:
+    index = FileIndex()
+    _write(tmp_path, "a/one.py")
+    _write(tmp_path, "b/two.py")
+    for directory in (tmp_path, tmp_path / "a", tmp_path / "b"):
+        _age(directory)
+    assert _relative(tmp_path, index.list_files(tmp_path)) == ["a/one.py", "b/two.py"]
+
+    _write(tmp_path, "a/three.py")
+    (tmp_path / "b" / "two.py").unlink()
+    assert _relative(tmp_path, index.list_files(tmp_path)) == ["a/one.py", "a/three.py"]
+
+    gitignore = _write(tmp_path, ".gitignore", "a/\n")
+    assert _relative(tmp_path, index.list_files(tmp_path)) == [".gitignore"]
+
+    gitignore.write_text("three.py\n", encoding="utf-8")
+    _age(gitignore, seconds=-5)
+    assert _relative(tmp_path, index.list_files(tmp_path)) == [".gitignore", "a/one.py"]
+
+
+def test_invalidate_does_not_wait_for_a_refresh(tmp_path: Path) -> None:
+    index = FileIndex()
+    _write(tmp_path, "a/one.py")
+    for directory in (tmp_path, tmp_path / "a"):
+        _age(directory)
+    assert _relative(tmp_path, index.list_files(tmp_path)) == ["a/one.py"]
+    stat = (tmp_path / "a").stat()
+    _write(tmp_path, "a/two.py")
+    # Same directory mtime, so only the invalidation reveals the new file.
+    os.utime(tmp_path / "a", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    with index._lock:  # as if a full refresh were running
+        worker = threading.Thread(target=index.invalidate, args=(tmp_path, "a"))
+        worker.start()
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+
+    assert _relative(tmp_path, index.list_files(tmp_path)) == ["a/one.py", "a/two.py"]
+
+
+def test_code_manager_write_file_is_listed_immediately(tmp_path: Path) -> None:
+    manager = CodeManager()
+    _write(tmp_path, "pkg/a.py")
+    assert _relative(tmp_path, manager.list_files(tmp_path)) == ["pkg/a.py"]
+
+    manager.write_file(tmp_path, "pkg/b.py", "x = 1\n")
+
+    assert _relative(tmp_path, manager.list_files(tmp_path)) == ["pkg/a.py", "pkg/b.py"]
+
+
+def test_default_patterns_prune_tool_outputs_unless_reincluded(tmp_path: Path) -> None:
+    _write(tmp_path, ".venv/lib/site.py")
+    _write(tmp_path, "pkg/__pycache__/mod.cpython-312.pyc")
+    _write(tmp_path, "pkg/mod.py")
+    _write(tmp_path, "pkg/build/steps.py")
+    _write(tmp_path, "build/out.o")
+    _write(tmp_path, "dist/pkg.whl")
+    _write(tmp_path, ".attignore", "!dist/\nsecrets.txt\n")
+    _write(tmp_path, "secrets.txt")
+
+    files = FileIndex().list_files(tmp_path)
+
+    assert _relative(tmp_path, files) == [
+        ".attignore",
+        "dist/pkg.whl",
+        "pkg/build/steps.py",
+        "pkg/mod.py",
+    ]
+    assert _relative(tmp_path, FileIndex(ignore_patterns=()).list_files(tmp_path)) == [
+        ".attignore",
+        ".venv/lib/site.py",
+        "build/out.o",
+        "dist/pkg.whl",
+        "pkg/__pycache__/mod.cpython-312.pyc",
+        "pkg/build/steps.py",
+        "pkg/mod.py",
+    ]
+
+
+def test_page_and_iter_files_apply_size_and_binary_filters(tmp_path: Path) -> None:
+    _write(tmp_path, "a.txt", "small")
+    _write(tmp_path, "b.txt", "x" * 100)
+    (tmp_path / "c.bin").write_bytes(b"\x00\x01\x02")
+    _write(tmp_path, "d.txt", "tiny")
+    index = FileIndex()
+    file_filter = FileFilter(max_bytes=10, skip_binary=True)
+
+    first = index.page(tmp_path, limit=3, file_filter=file_filter)
+    assert (first.files, first.cursor, first.next_cursor, first.total) == (["a.txt"], 0, 3, 4)
+    last = index.page(tmp_path, cursor=3, limit=3, file_filter=file_filter)
+    assert (last.files, last.next_cursor) == (["d.txt"], None)
+    assert index.page(tmp_path).files == ["a.txt", "b.txt", "c.bin", "d.txt"]
+    assert _relative(tmp_path, list(index.iter_files(tmp_path, file_filter=file_filter))) == [
+        "a.txt",
+        "d.txt",
+    ]
@@ -0,0 +1,63 @@
+import asyncio
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from att.core.git_manager import GitManager
+from att.core.process import run_process
+
+
+def _init_repo(path: Path) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+    for command in (
+        ["git", "init", "-q"],
+        ["git", "config", "user.email", "att@example.com"],
+        ["git", "config", "user.name", "ATT"],
+    ):
+        subprocess.run(command, cwd=path, check=True)
+
+
+@pytest.mark.asyncio
+async def test_git_manager_runs_commands_asynchronously(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    _init_repo(repo)
+    (repo / "app.py").write_text("print('hi')\n", encoding="utf-8")
+    git = GitManager()
+
+    status = await git.status(repo)
+    assert "app.py" in status.output
+
+    commit = await git.commit(repo, "feat: add app")
+    assert commit.command == "git commit -m feat: add app"
+    log = await git.log(repo, limit=1)
+    assert "feat: add app" in log.output
+
+    await git.branch(repo, "feat")
+    with pytest.raises(RuntimeError, match="git checkout -b feat failed"):
+        await git.branch(repo, "feat")
+
+
+@pytest.mark.asyncio
+async def test_git_manager_times_out_and_kills_command(tmp_path: Path) -> None:
+    git = GitManager(timeout_seconds=0.1)
+
+    started = time.perf_counter()
+    with pytest.raises(RuntimeError, match="timed out"):
+        await git._run_command(tmp_path, "sleep", "5")
+    assert time.perf_counter() - started < 2
+
+
+@pytest.mark.asyncio
+async def test_run_process_does_not_block_other_commands(tmp_path: Path) -> None:
+    started = time.perf_counter()
+    slow = asyncio.create_task(run_process(["sleep", "0.5"], cwd=tmp_path))
+    fast = await run_process(["echo", "ready"], cwd=tmp_path)
+    fast_elapsed = time.perf_counter() - started
+
+    assert fast.stdout.strip() == "ready"
+    assert fast_elapsed < 0.4
+    slow.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await slow
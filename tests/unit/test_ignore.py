@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from att.core.ignore import IgnoreRules, is_ignored
+
+_RULES = IgnoreRules.parse(
+    "",
+    "\n".join(
+        [
+            "# build outputs",
+            "*.pyc",
+            "/dist",
+            "build/",
+            "docs/**/*.tmp",
+            "logs/**",
+            "!logs/keep.log",
+            "data/[!a]*.csv",
+            "\\#literal",
+        ]
+    ),
+)
+
+
+@pytest.mark.parametrize(
+    ("rel_path", "is_dir", "expected"),
+    [
+        ("pkg/mod.pyc", False, True),
+        ("pkg/mod.py", False, False),
+        ("dist", True, True),
+        ("pkg/dist", True, False),
+        ("build", False, False),
+        ("pkg/build", True, True),
+        ("docs/a/b/c.tmp", False, True),
+        ("docs/c.tmp", False, True),
+        ("logs/today.log", False, True),
+        ("logs/keep.log", False, False),
+        ("data/b.csv", False, True),
+        ("data/a.csv", False, False),
+        ("#literal", False, True),
+    ],
+)
+def test_root_rules_follow_gitignore_semantics(rel_path: str, is_dir: bool, expected: bool) -> None:
+    assert is_ignored([_RULES], rel_path, is_dir=is_dir) is expected
+
+
+def test_deeper_ignore_files_take_precedence() -> None:
+    nested = IgnoreRules.parse("pkg", "!*.pyc\n/local.txt\n")
+
+    assert is_ignored([_RULES, nested], "pkg/mod.pyc", is_dir=False) is False
+    assert is_ignored([_RULES, nested], "other/mod.pyc", is_dir=False) is True
+    assert is_ignored([_RULES, nested], "pkg/local.txt", is_dir=False) is True
+    assert is_ignored([_RULES, nested], "pkg/sub/local.txt", is_dir=False) is False
@@ -5,7 +5,7 @@ def test_registered_tools_contains_expected_surface() -> None:
     tools = registered_tools()
     names = {tool.name for tool in tools}
 
-    assert len(tools) == 30
+    assert len(tools) == 32
     assert "att.project.create" in names
     assert "att.code.search" in names
     assert "att.git.pr.create" in names
@@ -17,7 +17,7 @@ def test_registered_resources_contains_expected_uris() -> None:
     resources = registered_resources()
     uris = {resource.uri for resource in resources}
 
-    assert len(resources) == 6
+    assert len(resources) == 7
     assert "att://projects" in uris
     assert "att://project/{id}/files" in uris
     assert "att://project/{id}/ci" in uris
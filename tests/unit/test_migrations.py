@@ -0,0 +1,156 @@
+from datetime import UTC, datetime
+from pathlib import Path
+
+import aiosqlite
+import pytest
+
+from att.db.migrations import (
+    MIGRATIONS,
+    SCHEMA_VERSION,
+    Migration,
+    apply_migrations,
+    schema_version,
+)
+from att.db.store import SQLiteStore
+from att.db.timestamps import to_epoch_micros
+
+
+@pytest.mark.asyncio
+async def test_apply_migrations_creates_schema_on_fresh_database(tmp_path: Path) -> None:
+    async with aiosqlite.connect(tmp_path / "att.db") as conn:
+        assert await schema_version(conn) == 0
+
+        assert await apply_migrations(conn) == SCHEMA_VERSION
+
+        cursor = await conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name"
+        )
+        tables = {str(row[0]) for row in await cursor.fetchall()}
+        assert {"projects", "att_events", "schema_migrations"} <= tables
+
+
+@pytest.mark.asyncio
+async def test_apply_migrations_is_read_only_when_current(tmp_path: Path) -> None:
+    async with aiosqlite.connect(tmp_path / "att.db") as conn:
+        await apply_migrations(conn)
+        changes_before = conn.total_changes
+
+        assert await apply_migrations(conn) == SCHEMA_VERSION
+        assert conn.total_changes == changes_before
+        assert not conn.in_transaction
+
+
+@pytest.mark.asyncio
+async def test_apply_migrations_runs_only_pending_forward_steps(tmp_path: Path) -> None:
+    applied: list[int] = []
+    base = Migration(
+        version=1,
+        description="base",
+        statements=("CREATE TABLE widgets (id TEXT PRIMARY KEY)",),
+    )
+    forward = Migration(
+        version=2,
+        description="add widget name",
+        statements=("ALTER TABLE widgets ADD COLUMN name TEXT",),
+    )
+
+    async with aiosqlite.connect(tmp_path / "att.db") as conn:
+        applied.append(await apply_migrations(conn, (base,)))
+        applied.append(await apply_migrations(conn, (base, forward)))
+        applied.append(await apply_migrations(conn, (base, forward)))
+
+        cursor = await conn.execute("SELECT version FROM schema_migrations ORDER BY version")
+        versions = [int(row[0]) for row in await cursor.fetchall()]
+        cursor = await conn.execute("PRAGMA table_info(widgets)")
+        columns = [str(row[1]) for row in await cursor.fetchall()]
+
+    assert applied == [1, 2, 2]
+    assert versions == [1, 2]
+    assert columns == ["id", "name"]
+
+
+@pytest.mark.asyncio
+async def test_apply_migrations_rolls_back_failed_step(tmp_path: Path) -> None:
+    broken = Migration(
+        version=1,
+        description="broken",
+        statements=("CREATE TABLE widgets (id TEXT)", "NOT VALID SQL"),
+    )
+
+    async with aiosqlite.connect(tmp_path / "att.db") as conn:
+        with pytest.raises(aiosqlite.OperationalError):
+            await apply_migrations(conn, (broken,))
+
+        assert await schema_version(conn) == 0
+        cursor = await conn.execute("SELECT name FROM sqlite_master WHERE name = 'widgets'")
+        assert await cursor.fetchone() is None
+
+
+@pytest.mark.asyncio
+async def test_epoch_micros_migration_backfills_iso_timestamps(tmp_path: Path) -> None:
+    db_path = tmp_path / "att.db"
+    async with aiosqlite.connect(db_path) as conn:
+        await apply_migrations(conn, MIGRATIONS[:4])
+        await conn.execute(
+            "INSERT INTO projects VALUES ('p1', 'demo', '/tmp/demo', NULL, NULL, 'created', ?, ?)",
+            ("2026-01-01T00:00:00+00:00", "2026-01-02T03:04:05.123456+00:00"),
+        )
+        await conn.execute(
+            "INSERT INTO att_events VALUES ('e1', 'p1', 'test.run', '{}', ?)",
+            ("2026-01-03T01:00:00+01:00",),
+        )
+        await conn.execute(
+            "INSERT INTO att_event_daily_summaries "
+            "VALUES ('p1', 'test.run', '2025-12-31', 2, ?, ?)",
+            ("2025-12-31T08:00:00+00:00", "2025-12-31T09:00:00.5+00:00"),
+        )
+        await conn.commit()
+
+        assert await apply_migrations(conn) == SCHEMA_VERSION
+
+        cursor = await conn.execute("SELECT created_at, updated_at FROM projects")
+        assert tuple(await cursor.fetchone() or ()) == (
+            to_epoch_micros(datetime(2026, 1, 1, tzinfo=UTC)),
+            to_epoch_micros(datetime(2026, 1, 2, 3, 4, 5, 123456, tzinfo=UTC)),
+        )
+        cursor = await conn.execute("SELECT typeof(timestamp), timestamp FROM att_events")
+        assert tuple(await cursor.fetchone() or ()) == (
+            "integer",
+            to_epoch_micros(datetime(2026, 1, 3, tzinfo=UTC)),
+        )
+        cursor = await conn.execute(
+            "SELECT first_timestamp, last_timestamp FROM att_event_daily_summaries"
+        )
+        assert tuple(await cursor.fetchone() or ()) == (
+            to_epoch_micros(datetime(2025, 12, 31, 8, tzinfo=UTC)),
+            to_epoch_micros(datetime(2025, 12, 31, 9, 0, 0, 500000, tzinfo=UTC)),
+        )
+        cursor = await conn.execute(
+            "SELECT name FROM sqlite_master WHERE tbl_name = 'att_events' AND type = 'index'"
+        )
+        indexes = {str(row[0]) for row in await cursor.fetchall()}
+
+    assert {"idx_att_events_project_timestamp", "idx_att_events_project_type_timestamp"} <= indexes
+    store = SQLiteStore(db_path)
+    events = await store.list_events(since=datetime(2026, 1, 3, tzinfo=UTC))
+    assert [event.id for event in events] == ["e1"]
+    assert events[0].timestamp == datetime(2026, 1, 3, tzinfo=UTC)
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_payload_migration_reencodes_event_payloads(tmp_path: Path) -> None:
+    async with aiosqlite.connect(tmp_path / "att.db") as conn:
+        await apply_migrations(conn, MIGRATIONS[:8])
+        await conn.execute(
+            "INSERT INTO att_events VALUES ('e1', 'p1', 'test.run', ?, 0)",
+            ('{"name": "caf\\u00e9", "ratio": NaN, "items": [1, 2.5]}',),
+        )
+        await conn.commit()
+
+        assert await apply_migrations(conn) == SCHEMA_VERSION
+
+        cursor = await conn.execute("SELECT payload FROM att_events")
+        assert tuple(await cursor.fetchone() or ()) == (
+            '{"name":"café","ratio":null,"items":[1,2.5]}',
+        )
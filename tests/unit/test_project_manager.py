@@ -73,3 +73,31 @@ async def test_project_manager_download_archive(tmp_path: Path) -> None:
     assert archive.suffix == ".zip"
     with zipfile.ZipFile(archive, "r") as zip_file:
         assert "README.md" in zip_file.namelist()
+
+
+@pytest.mark.asyncio
+async def test_project_manager_caches_lookups_with_write_through(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    manager = ProjectManager(store)
+    created = await manager.create(CreateProjectInput(name="demo", path=tmp_path / "demo"))
+
+    first = await manager.get(created.id)
+    assert first == created
+    assert first is not None
+    first.name = "mutated by caller"
+    assert await manager.get("missing") is None
+    assert await manager.get("missing") is None
+
+    cached = await manager.get(created.id)
+    assert cached is not None
+    assert cached.name == "demo"
+    stats = manager.cache_stats
+    assert (stats.hits, stats.misses, stats.size) == (2, 2, 1)
+
+    await manager.delete(created.id)
+    assert await manager.get(created.id) is None
+    assert manager.cache_stats.size == 0
+
+    uncached = ProjectManager(store)
+    assert await uncached.get(created.id) is None
+    await store.close()
@@ -18,6 +18,10 @@ def test_parse_project_files_resource() -> None:
     assert ref.operation == "files"
     assert ref.project_id == "p1"
 
+    paged = parse_resource_ref("att://project/p1/files?cursor=100&limit=50")
+    assert paged is not None
+    assert (paged.cursor, paged.limit) == (100, 50)
+
 
 def test_parse_project_ci_resource() -> None:
     ref = parse_resource_ref("att://project/p1/ci")
@@ -42,3 +46,12 @@ def test_parse_project_logs_resource_with_query() -> None:
 def test_parse_project_logs_resource_rejects_invalid_query() -> None:
     with pytest.raises(ValueError, match="unsupported query parameters for logs resource"):
         parse_resource_ref("att://project/p1/logs?foo=bar")
+
+
+def test_parse_project_test_output_resource_with_query() -> None:
+    ref = parse_resource_ref("att://project/p1/tests/r1/output?cursor=5")
+    assert ref is not None
+    assert ref.operation == "test_output"
+    assert (ref.project_id, ref.run_id) == ("p1", "r1")
+    assert ref.cursor == 5
+    assert ref.limit is None
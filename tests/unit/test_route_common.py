@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from att.api.routes import common
+from att.api.routes.common import run_until_disconnect
+from att.models.test_run import TestRun
+
+
+class FakeRequest:
+    def __init__(self, disconnected: bool) -> None:
+        self.disconnected = disconnected
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected
+
+
+@pytest.mark.asyncio
+async def test_run_until_disconnect_returns_result() -> None:
+    async def run() -> TestRun:
+        return TestRun(project_id="p1", result={"output": "ok"})
+
+    result = await run_until_disconnect(FakeRequest(disconnected=False), run())
+
+    assert result.result == {"output": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_run_until_disconnect_cancels_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(common, "DISCONNECT_POLL_SECONDS", 0.01)
+    cancelled = asyncio.Event()
+
+    async def run() -> TestRun:
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return TestRun(project_id="p1")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await run_until_disconnect(FakeRequest(disconnected=True), run())
+
+    assert exc_info.value.status_code == 499
+    assert cancelled.is_set()
@@ -23,11 +23,13 @@ class FakeGitManager:
         self.branches: list[str] = []
         self.pushes: list[str] = []
 
-    def branch(self, project_path: Path, name: str, *, checkout: bool = True) -> GitResult:
+    async def branch(self, project_path: Path, name: str, *, checkout: bool = True) -> GitResult:
         self.branches.append(name)
         return GitResult(command="git checkout -b", output=name)
 
-    def push(self, project_path: Path, remote: str = "origin", branch: str = "HEAD") -> GitResult:
+    async def push(
+        self, project_path: Path, remote: str = "origin", branch: str = "HEAD"
+    ) -> GitResult:
         self.pushes.append(branch)
         return GitResult(command="git push", output=branch)
 
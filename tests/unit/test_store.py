@@ -1,8 +1,14 @@
+import asyncio
+import json
+from datetime import UTC, datetime
 from pathlib import Path
 
+import aiosqlite
 import pytest
 
-from att.db.store import SQLiteStore
+from att.api.schemas.events import EventResponse
+from att.db.store import EventBufferPolicy, SQLitePragmas, SQLiteStore
+from att.db.timestamps import to_epoch_micros
 from att.models.events import ATTEvent, EventType
 from att.models.project import Project
 
@@ -41,3 +47,381 @@ async def test_store_event_filters(tmp_path: Path) -> None:
     events = await store.list_events(project_id=project.id, event_type=EventType.TEST_RUN)
     assert len(events) == 1
     assert events[0].payload["suite"] == "unit"
+
+
+@pytest.mark.asyncio
+async def test_store_reuses_pooled_connections(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    connect_calls: list[Path] = []
+    real_connect = aiosqlite.connect
+
+    def counting_connect(database: Path) -> aiosqlite.Connection:
+        connect_calls.append(database)
+        return real_connect(database)
+
+    monkeypatch.setattr("att.db.store.aiosqlite.connect", counting_connect)
+    store = SQLiteStore(tmp_path / "att.db")
+    project = Project(name="demo", path=tmp_path / "demo")
+
+    for _ in range(5):
+        await store.upsert_project(project)
+        await store.append_event(ATTEvent(project_id=project.id, event_type=EventType.TEST_RUN))
+        assert await store.get_project(project.id) is not None
+        await store.list_events(project_id=project.id)
+
+    assert len(connect_calls) == 2  # one writer plus one reader
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_store_close_and_reopen(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "nested" / "att.db")
+    await store.open()
+    assert store.is_open
+    project = Project(name="demo", path=tmp_path / "demo")
+    await store.upsert_project(project)
+
+    await store.close()
+    assert not store.is_open
+
+    fetched = await store.get_project(project.id)
+    assert fetched is not None
+    assert store.is_open
+    await store.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("event_type", "expected_index"),
+    [
+        (None, "idx_att_events_project_timestamp"),
+        (EventType.TEST_FAILED, "idx_att_events_project_type_timestamp"),
+    ],
+)
+async def test_store_event_queries_use_indexes(
+    tmp_path: Path,
+    event_type: EventType | None,
+    expected_index: str,
+) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    query, params = store._events_query(
+        project_id="p1",
+        event_type=event_type,
+        since=datetime(2026, 1, 1, tzinfo=UTC),
+        until=datetime(2026, 2, 1, tzinfo=UTC),
+        after=(to_epoch_micros(datetime(2026, 1, 15, tzinfo=UTC)), "event-id"),
+        limit=100,
+    )
+
+    async with store.reader() as conn:
+        cursor = await conn.execute(f"EXPLAIN QUERY PLAN {query}", params)
+        plan = " | ".join(str(row["detail"]) for row in await cursor.fetchall())
+    await store.close()
+
+    assert f"USING INDEX {expected_index}" in plan
+    assert "SCAN att_events" not in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.asyncio
+async def test_store_event_since_epoch_is_a_lower_bound(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    epoch = datetime(1970, 1, 1, tzinfo=UTC)
+    before = ATTEvent(
+        project_id="p1",
+        event_type=EventType.CODE_CHANGED,
+        timestamp=datetime(1969, 12, 31, tzinfo=UTC),
+    )
+    at_epoch = ATTEvent(project_id="p1", event_type=EventType.CODE_CHANGED, timestamp=epoch)
+    await store.append_events([before, at_epoch])
+
+    events = await store.list_events(project_id="p1", since=epoch)
+    await store.close()
+
+    assert [event.id for event in events] == [at_epoch.id]
+
+
+@pytest.mark.asyncio
+async def test_event_record_json_matches_event_response_bytes(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    events = [
+        ATTEvent(
+            project_id="p1",
+            event_type=EventType.TEST_FAILED,
+            payload={"name": "café ✓", "ratio": 0.1, "big": 10**20, "ok": True, "none": None},
+            timestamp=datetime(2026, 1, 2, 3, 4, 5, 120000, tzinfo=UTC),
+        ),
+        ATTEvent(
+            project_id="p1",
+            event_type=EventType.TEST_RUN,
+            payload={"nan": float("nan"), "quote": 'say "hi"\n'},
+            timestamp=datetime(2026, 1, 2, 3, 4, 6, tzinfo=UTC),
+        ),
+    ]
+    await store.append_events(events)
+
+    records = [record async for record in store.iter_event_records(project_id="p1")]
+    await store.close()
+
+    assert [record.to_json() for record in records] == [
+        EventResponse(
+            id=event.id,
+            project_id=event.project_id,
+            event_type=event.event_type.value,
+            payload=event.payload,
+            timestamp=event.timestamp,
+        ).model_dump_json()
+        for event in events
+    ]
+
+
+@pytest.mark.asyncio
+async def test_store_event_keyset_pages(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    project = Project(name="demo", path=tmp_path / "demo")
+    await store.upsert_project(project)
+    same_instant = datetime(2026, 1, 1, tzinfo=UTC)
+    for index in range(5):
+        await store.append_event(
+            ATTEvent(
+                id=f"event-{index}",
+                project_id=project.id,
+                event_type=EventType.TEST_RUN,
+                timestamp=same_instant if index < 3 else datetime(2026, 1, 2, tzinfo=UTC),
+            )
+        )
+
+    seen: list[str] = []
+    cursor: str | None = None
+    while True:
+        page = await store.list_events_page(project_id=project.id, cursor=cursor, limit=2)
+        seen.extend(event.id for event in page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert seen == [f"event-{index}" for index in range(5)]
+    streamed = [event.id async for event in store.iter_events(batch_size=2)]
+    assert streamed == seen
+
+    with pytest.raises(ValueError, match="Invalid event cursor"):
+        await store.list_events_page(cursor="not-a-cursor")
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_store_applies_wal_and_tuned_pragmas(tmp_path: Path) -> None:
+    store = SQLiteStore(
+        tmp_path / "att.db",
+        pragmas=SQLitePragmas(cache_size_kib=4096, mmap_size_bytes=1024 * 1024),
+    )
+
+    async with store.reader() as conn:
+        values: dict[str, int | str] = {}
+        for pragma in ("journal_mode", "synchronous", "cache_size", "mmap_size"):
+            cursor = await conn.execute(f"PRAGMA {pragma}")
+            row = await cursor.fetchone()
+            assert row is not None
+            values[pragma] = row[0]
+    await store.close()
+
+    assert values == {
+        "journal_mode": "wal",
+        "synchronous": 1,  # NORMAL
+        "cache_size": -4096,
+        "mmap_size": 1024 * 1024,
+    }
+    with pytest.raises(ValueError, match="journal_mode"):
+        SQLitePragmas(journal_mode="wal; DROP TABLE projects")
+
+
+@pytest.mark.asyncio
+async def test_store_serializes_concurrent_writes_through_bounded_queue(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db", max_pending_writes=2)
+    await store.open()
+    project = Project(name="demo", path=tmp_path / "demo")
+    await store.upsert_project(project)
+
+    await asyncio.gather(
+        *(
+            store.append_event(
+                ATTEvent(project_id=project.id, event_type=EventType.TEST_RUN, payload={"n": n})
+            )
+            for n in range(50)
+        )
+    )
+
+    events = await store.list_events(project_id=project.id)
+    assert sorted(int(event.payload["n"] or 0) for event in events) == list(range(50))
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_store_without_open_writes_directly_and_leaves_no_tasks(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    tasks_before = asyncio.all_tasks()
+    project = Project(name="demo", path=tmp_path / "demo")
+
+    await asyncio.gather(
+        store.upsert_project(project),
+        *(
+            store.append_event(ATTEvent(project_id=project.id, event_type=EventType.TEST_RUN))
+            for _ in range(5)
+        ),
+    )
+
+    assert asyncio.all_tasks() == tasks_before
+    assert len(await store.list_events(project_id=project.id)) == 5
+    await store.open()
+    assert len(asyncio.all_tasks()) == len(tasks_before) + 1
+    await store.close()
+    assert asyncio.all_tasks() == tasks_before
+
+
+@pytest.mark.asyncio
+async def test_store_failed_write_rolls_back_without_stopping_writer(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    project = Project(name="demo", path=tmp_path / "demo")
+
+    async def half_applied(conn: aiosqlite.Connection) -> None:
+        await conn.execute("DELETE FROM projects")
+        await conn.execute("INSERT INTO missing_table VALUES (1)")
+
+    await store.upsert_project(project)
+    with pytest.raises(aiosqlite.OperationalError):
+        await store.write(half_applied)
+
+    assert await store.get_project(project.id) is not None
+    await store.delete_project(project.id)
+    assert await store.get_project(project.id) is None
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_store_append_events_is_one_atomic_batch(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    first = ATTEvent(project_id="p1", event_type=EventType.TEST_RUN)
+    second = ATTEvent(project_id="p1", event_type=EventType.TEST_PASSED)
+
+    await store.append_events([first, second])
+    assert [event.id for event in await store.list_events(project_id="p1")] == [
+        first.id,
+        second.id,
+    ]
+
+    duplicate = ATTEvent(project_id="p1", event_type=EventType.ERROR)
+    with pytest.raises(aiosqlite.IntegrityError):
+        await store.append_events([duplicate, first])
+    assert len(await store.list_events(project_id="p1")) == 2
+    await store.close()
+
+
+async def _raw_event_count(store: SQLiteStore) -> int:
+    async with store.reader() as conn:
+        cursor = await conn.execute("SELECT COUNT(*) FROM att_events")
+        row = await cursor.fetchone()
+    assert row is not None
+    return int(row[0])
+
+
+@pytest.mark.asyncio
+async def test_store_event_buffer_group_commits(tmp_path: Path) -> None:
+    store = SQLiteStore(
+        tmp_path / "att.db",
+        event_buffer=EventBufferPolicy(max_events=3, max_delay_ms=60_000),
+    )
+
+    for _ in range(2):
+        await store.append_event(ATTEvent(project_id="p1", event_type=EventType.TEST_RUN))
+    assert await _raw_event_count(store) == 0
+
+    await store.append_event(ATTEvent(project_id="p1", event_type=EventType.TEST_RUN))
+    assert await _raw_event_count(store) == 3
+
+    await store.append_event(ATTEvent(project_id="p1", event_type=EventType.TEST_RUN))
+    assert len(await store.list_events(project_id="p1")) == 4  # reads flush first
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_store_event_buffer_flushes_on_timer_and_close(tmp_path: Path) -> None:
+    db_path = tmp_path / "att.db"
+    timed = SQLiteStore(db_path, event_buffer=EventBufferPolicy(max_delay_ms=10))
+    await timed.append_event(ATTEvent(project_id="p1", event_type=EventType.TEST_RUN))
+    await asyncio.sleep(0.2)
+    assert await _raw_event_count(timed) == 1
+    await timed.close()
+
+    closing = SQLiteStore(db_path, event_buffer=EventBufferPolicy(max_delay_ms=60_000))
+    await closing.append_event(ATTEvent(project_id="p1", event_type=EventType.TEST_RUN))
+    await closing.close()
+
+    reopened = SQLiteStore(db_path)
+    assert len(await reopened.list_events(project_id="p1")) == 2
+    await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_store_aggregates_events_in_sql(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    day_one = datetime(2026, 3, 1, 9, tzinfo=UTC)
+    day_two = datetime(2026, 3, 2, 9, tzinfo=UTC)
+    await store.append_events(
+        [
+            ATTEvent(project_id="p1", event_type=EventType.TEST_PASSED, timestamp=day_one),
+            ATTEvent(project_id="p1", event_type=EventType.TEST_PASSED, timestamp=day_two),
+            ATTEvent(project_id="p1", event_type=EventType.TEST_FAILED, timestamp=day_two),
+            ATTEvent(project_id="p2", event_type=EventType.TEST_FAILED, timestamp=day_two),
+        ]
+    )
+    await store.compact_events(project_id="p1", event_type=EventType.TEST_PASSED, until=day_one)
+
+    by_type = await store.aggregate_events(project_id="p1")
+    assert [(item.event_type, item.count) for item in by_type] == [
+        (EventType.TEST_FAILED, 1),
+        (EventType.TEST_PASSED, 2),  # includes the compacted day
+    ]
+
+    per_day = await store.aggregate_events(group_by=("project", "bucket"), bucket="day")
+    assert [(item.project_id, item.bucket, item.count) for item in per_day] == [
+        ("p1", "2026-03-01", 1),
+        ("p1", "2026-03-02", 2),
+        ("p2", "2026-03-02", 1),
+    ]
+
+    hourly = await store.aggregate_events(group_by=("bucket",), bucket="hour")
+    assert [(item.bucket, item.count) for item in hourly] == [("2026-03-02T09", 3)]
+
+    total = await store.aggregate_events(group_by=())
+    assert [item.count for item in total] == [4]
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_store_decodes_rows_without_revalidation(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    project = Project(name="demo", path=tmp_path / "demo", git_remote="git@example:demo")
+    await store.upsert_project(project)
+    events = [
+        ATTEvent(
+            project_id=project.id,
+            event_type=EventType.TEST_RUN,
+            payload={"index": index, "suite": "unit", "ok": True, "note": None},
+            timestamp=datetime(2026, 1, 1, 0, 0, index, tzinfo=UTC),
+        )
+        for index in range(5)
+    ]
+    await store.append_events(events)
+
+    assert await store.get_project(project.id) == project
+    assert await store.list_events(project_id=project.id) == events
+
+    records = [
+        record async for record in store.iter_event_records(project_id=project.id, batch_size=2)
+    ]
+    assert [record.to_event() for record in records] == events
+    assert [json.loads(record.to_json()) for record in records] == [
+        json.loads(event.model_dump_json()) for event in events
+    ]
+    await store.close()
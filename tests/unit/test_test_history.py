@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from att.core.test_history import build_test_history_report, summarize_test_history
+from att.core.test_run_manager import TestRunManager
+from att.core.test_runner import TestRunner
+from att.db.store import SQLiteStore
+from att.models.test_run import TestCaseResult, TestOutcome, TestRun, TestRunStatus
+
+
+def _case(nodeid: str, outcome: TestOutcome, duration: float) -> TestCaseResult:
+    return TestCaseResult(nodeid=nodeid, outcome=outcome, duration_seconds=duration)
+
+
+def test_summarize_counts_flips_failures_and_duration_windows() -> None:
+    history = [
+        _case("t::flaky", "passed", 0.1),
+        _case("t::flaky", "failed", 0.1),
+        _case("t::flaky", "skipped", 0.0),
+        _case("t::flaky", "passed", 0.1),
+        _case("t::slow", "passed", 0.2),
+        _case("t::slow", "passed", 0.2),
+        _case("t::slow", "passed", 1.0),
+    ]
+
+    stats = {item.nodeid: item for item in summarize_test_history(history, recent_runs=1)}
+
+    flaky = stats["t::flaky"]
+    assert (flaky.runs, flaky.failures, flaky.flips) == (3, 1, 2)
+    assert flaky.flake_rate == 1.0
+    assert flaky.last_outcome == "passed"
+    slow = stats["t::slow"]
+    assert slow.recent_mean_duration_seconds == 1.0
+    assert slow.baseline_mean_duration_seconds == pytest.approx(0.2)
+    assert slow.max_duration_seconds == 1.0
+
+    report = build_test_history_report(list(stats.values()), runs=3, limit=5)
+    assert [item.nodeid for item in report.slowest] == ["t::slow", "t::flaky"]
+    assert [item.nodeid for item in report.flaky] == ["t::flaky"]
+    assert [item.nodeid for item in report.regressions] == ["t::slow"]
+
+
+@pytest.mark.asyncio
+async def test_history_covers_only_latest_finished_runs(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    manager = TestRunManager(store, TestRunner())
+    started = datetime(2026, 1, 1, tzinfo=UTC)
+    statuses = [
+        TestRunStatus.PASSED,
+        TestRunStatus.FAILED,
+        TestRunStatus.PASSED,
+        TestRunStatus.CANCELLED,
+    ]
+    for index, status in enumerate(statuses):
+        run = TestRun(
+            project_id="p1",
+            status=status,
+            created_at=started + timedelta(minutes=index),
+        )
+        await store.upsert_test_run(run)
+        outcome: TestOutcome = "failed" if status is TestRunStatus.FAILED else "passed"
+        await store.replace_test_case_results(
+            run.id,
+            "p1",
+            [_case("t::a", outcome, 0.5 + index), _case(f"t::only{index}", "passed", 0.1)],
+        )
+
+    report = await manager.history("p1", runs=2, limit=10)
+
+    assert report.runs == 2
+    assert [item.nodeid for item in report.slowest] == ["t::a", "t::only1", "t::only2"]
+    assert report.slowest[0].runs == 2
+    assert report.slowest[0].mean_duration_seconds == pytest.approx(2.0)
+    assert [item.nodeid for item in report.flaky] == ["t::a"]
+    await store.close()
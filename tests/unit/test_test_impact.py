@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from att.core.test_impact import TestImpactAnalyzer
+
+
+def _write(root: Path, rel_path: str, content: str) -> Path:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _make_project(root: Path) -> None:
+    _write(root, "src/pkg/__init__.py", "")
+    _write(root, "src/pkg/core.py", "VALUE = 1\n")
+    _write(root, "src/pkg/api.py", "from .core import VALUE\n")
+    _write(root, "src/pkg/other.py", "import json\n")
+    _write(root, "tests/unit/conftest.py", "")
+    _write(root, "tests/unit/test_api.py", "from pkg import api\n")
+    _write(root, "tests/unit/test_core.py", "import pkg.core\n")
+    _write(root, "tests/unit/test_other.py", "from pkg.other import json\n")
+    _write(root, "tests/integration/test_flow.py", "from pkg.api import VALUE\n")
+
+
+def test_affected_tests_follow_transitive_imports(tmp_path: Path) -> None:
+    _make_project(tmp_path)
+    analyzer = TestImpactAnalyzer()
+
+    assert analyzer.affected_tests(tmp_path, "src/pkg/core.py") == [
+        "tests/integration/test_flow.py",
+        "tests/unit/test_api.py",
+        "tests/unit/test_core.py",
+    ]
+    assert analyzer.affected_tests(tmp_path, "src/pkg/api.py", within="tests/unit") == [
+        "tests/unit/test_api.py",
+    ]
+    assert analyzer.affected_tests(tmp_path, "tests/unit/test_other.py") == [
+        "tests/unit/test_other.py",
+    ]
+
+
+def test_conftest_importers_select_every_test_below_them(tmp_path: Path) -> None:
+    _make_project(tmp_path)
+    _write(tmp_path, "src/pkg/fixtures.py", "")
+    _write(tmp_path, "tests/unit/conftest.py", "from pkg import fixtures\n")
+    analyzer = TestImpactAnalyzer()
+
+    assert analyzer.affected_tests(tmp_path, "src/pkg/fixtures.py") == [
+        "tests/unit/test_api.py",
+        "tests/unit/test_core.py",
+        "tests/unit/test_other.py",
+    ]
+
+    _write(tmp_path, "conftest.py", "import pkg.other\n")
+    assert analyzer.affected_tests(tmp_path, "src/pkg/other.py") == [
+        "tests/integration/test_flow.py",
+        "tests/unit/test_api.py",
+        "tests/unit/test_core.py",
+        "tests/unit/test_other.py",
+    ]
+
+
+def test_unmappable_changes_fall_back_to_full_suite(tmp_path: Path) -> None:
+    _make_project(tmp_path)
+    analyzer = TestImpactAnalyzer()
+
+    assert analyzer.affected_tests(tmp_path, "tests/unit/conftest.py") is None
+    assert analyzer.affected_tests(tmp_path, "README.md") is None
+    assert analyzer.affected_tests(tmp_path, "src/pkg/missing.py") is None
+
+
+def test_graph_refreshes_changed_files_incrementally(tmp_path: Path) -> None:
+    _make_project(tmp_path)
+    analyzer = TestImpactAnalyzer()
+    assert analyzer.affected_tests(tmp_path, "src/pkg/other.py") == ["tests/unit/test_other.py"]
+
+    test_core = _write(tmp_path, "tests/unit/test_core.py", "import pkg.core\nimport pkg.other\n")
+    stat = test_core.stat()
+    os.utime(test_core, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    (tmp_path / "tests/unit/test_other.py").unlink()
+
+    assert analyzer.affected_tests(tmp_path, "src/pkg/other.py") == ["tests/unit/test_core.py"]
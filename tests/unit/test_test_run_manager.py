@@ -0,0 +1,193 @@
+import asyncio
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+import pytest
+
+from att.core.test_run_manager import INTERRUPTED_RUN_ERROR, TestRunManager
+from att.core.test_runner import RunResult, TestOutputStream
+from att.db.store import SQLiteStore
+from att.models.events import EventType
+from att.models.project import Project
+from att.models.test_run import TestCaseResult, TestRun, TestRunStatus
+
+
+class BlockingTestRunner:
+    def __init__(self) -> None:
+        self.started: list[Path] = []
+        self.started_changed = asyncio.Event()
+        self.release = asyncio.Event()
+        self.sharding: list[tuple[int, dict[str, float]]] = []
+
+    async def run(
+        self,
+        project_path: Path,
+        suite: str = "unit",
+        *,
+        markers: str | None = None,
+        timeout_seconds: int | None = None,
+        output: TestOutputStream | None = None,
+        shards: int = 1,
+        durations: Mapping[str, float] | None = None,
+    ) -> RunResult:
+        del output, markers, timeout_seconds
+        self.sharding.append((shards, dict(durations or {})))
+        self.started.append(project_path)
+        self.started_changed.set()
+        await self.release.wait()
+        returncode = 1 if suite == "broken" else 0
+        return RunResult(
+            command=f"pytest {suite}",
+            returncode=returncode,
+            output="done",
+            tests=[
+                TestCaseResult(
+                    nodeid="tests/test_a.py::test_one",
+                    outcome="failed" if returncode else "passed",
+                    duration_seconds=0.25,
+                )
+            ],
+        )
+
+
+async def _wait_for_started(runner: BlockingTestRunner, count: int) -> None:
+    async with asyncio.timeout(5):
+        while len(runner.started) < count:
+            runner.started_changed.clear()
+            await runner.started_changed.wait()
+
+
+@pytest.mark.asyncio
+async def test_test_run_manager_limits_concurrency_per_host_and_project(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    runner = BlockingTestRunner()
+    manager = TestRunManager(store, runner, max_concurrency=2, max_concurrency_per_project=1)
+    alpha = Project(name="alpha", path=tmp_path / "alpha")
+    beta = Project(name="beta", path=tmp_path / "beta")
+
+    first = await manager.submit(alpha)
+    second = await manager.submit(alpha, suite="broken")
+    third = await manager.submit(beta)
+    await _wait_for_started(runner, 2)
+
+    assert first.status == TestRunStatus.QUEUED
+    assert runner.started == [alpha.path, beta.path]
+    assert (manager.running_count, manager.queued_count) == (2, 1)
+
+    runner.release.set()
+    finished = await manager.wait(second.id, timeout_seconds=5)
+
+    assert finished is not None
+    assert finished.status == TestRunStatus.FAILED
+    assert finished.result is not None
+    assert finished.result["returncode"] == 1
+    assert (await manager.wait(third.id, timeout_seconds=5)).status == TestRunStatus.PASSED
+    history = await manager.list(alpha.id)
+    assert [run.id for run in history] == [second.id, first.id]
+    assert [run.status for run in history] == [TestRunStatus.FAILED, TestRunStatus.PASSED]
+    cases = await manager.test_cases(second.id)
+    assert [(case.nodeid, case.outcome) for case in cases] == [
+        ("tests/test_a.py::test_one", "failed")
+    ]
+    latest = await manager.latest_finished(alpha.id)
+    assert latest is not None
+    assert latest.id == second.id
+
+    events = await store.list_events(project_id=beta.id)
+    assert [event.event_type for event in events] == [
+        EventType.TEST_RUN,
+        EventType.TEST_RUN,
+        EventType.TEST_PASSED,
+    ]
+    assert {event.payload["run_id"] for event in events} == {third.id}
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_test_run_manager_cancels_queued_and_running_runs(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    runner = BlockingTestRunner()
+    manager = TestRunManager(store, runner, max_concurrency=1)
+    project = Project(name="demo", path=tmp_path / "demo")
+
+    running = await manager.submit(project)
+    queued = await manager.submit(project)
+    await _wait_for_started(runner, 1)
+
+    cancelled_queued = await manager.cancel(queued.id)
+    cancelled_running = await manager.cancel(running.id)
+
+    assert cancelled_queued is not None
+    assert cancelled_queued.status == TestRunStatus.CANCELLED
+    assert cancelled_running is not None
+    assert cancelled_running.status == TestRunStatus.CANCELLED
+    assert cancelled_running.finished_at is not None
+    assert runner.started == [project.path]
+    assert (manager.running_count, manager.queued_count) == (0, 0)
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_test_run_manager_start_fails_interrupted_runs(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    stale = TestRun(project_id="p1", status=TestRunStatus.RUNNING)
+    done = TestRun(project_id="p1", status=TestRunStatus.PASSED, result={"returncode": 0})
+    await store.upsert_test_run(stale)
+    await store.upsert_test_run(done)
+
+    await TestRunManager(store, BlockingTestRunner()).start()
+
+    interrupted = await store.get_test_run(stale.id)
+    assert interrupted is not None
+    assert interrupted.status == TestRunStatus.ERROR
+    assert interrupted.error == INTERRUPTED_RUN_ERROR
+    assert await store.get_test_run(done.id) == done
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_test_run_manager_shards_with_recorded_durations(tmp_path: Path) -> None:
+    store = SQLiteStore(tmp_path / "att.db")
+    runner = BlockingTestRunner()
+    runner.release.set()
+    manager = TestRunManager(store, runner)
+    project = Project(name="alpha", path=tmp_path / "alpha")
+
+    await manager.run(project)
+    sharded = await manager.run(project, shards=3)
+
+    assert runner.sharding == [(1, {}), (3, {"tests/test_a.py::test_one": 0.25})]
+    assert sharded.shards == 3
+    stored = await manager.get(sharded.id)
+    assert stored is not None
+    assert stored.shards == 3
+    with pytest.raises(ValueError, match="shards"):
+        await manager.submit(project, shards=0)
+
+
+class FailingResultsStore(SQLiteStore):
+    async def replace_test_case_results(
+        self, run_id: str, project_id: str, results: Sequence[TestCaseResult]
+    ) -> None:
+        del run_id, project_id, results
+        msg = "disk full"
+        raise OSError(msg)
+
+
+@pytest.mark.asyncio
+async def test_test_run_manager_finishes_when_result_persistence_fails(tmp_path: Path) -> None:
+    store = FailingResultsStore(tmp_path / "att.db")
+    runner = BlockingTestRunner()
+    runner.release.set()
+    manager = TestRunManager(store, runner)
+    project = Project(name="alpha", path=tmp_path / "alpha")
+
+    submitted = await manager.submit(project)
+    finished = await manager.wait(submitted.id, timeout_seconds=5)
+
+    assert finished is not None
+    assert finished.status == TestRunStatus.ERROR
+    assert finished.error == "disk full"
+    assert finished.finished_at is not None
+    assert (manager.running_count, manager.queued_count) == (0, 0)
+    await store.close()
@@ -1,52 +1,81 @@
 from __future__ import annotations
 
-import subprocess
+import asyncio
+import json
+import os
+import sys
+import time
 from pathlib import Path
 
+import pytest
+
 from att.core.test_runner import (
+    TestOutputStream,
     TestRunner,
+    parse_pytest_collection,
     parse_pytest_json_report,
     parse_pytest_junit_xml,
     parse_pytest_output_summary,
+    parse_pytest_version,
+    prioritize_test_ids,
+    shard_test_ids,
 )
 
 
-def test_run_unit_tests_returns_results(monkeypatch, tmp_path: Path) -> None:
-    captured: dict[str, object] = {}
-
-    def fake_run(
-        command: list[str],
-        *,
-        cwd: Path,
-        check: bool,
-        capture_output: bool,
-        text: bool,
-        timeout: int | None,
-    ) -> subprocess.CompletedProcess[str]:
-        captured["command"] = command
-        captured["cwd"] = cwd
-        captured["check"] = check
-        captured["capture_output"] = capture_output
-        captured["text"] = text
-        captured["timeout"] = timeout
-        return subprocess.CompletedProcess(
-            args=command,
-            returncode=0,
-            stdout="================ 2 passed, 1 skipped in 0.54s ================\n",
-            stderr="",
-        )
-
-    monkeypatch.setattr("att.core.test_runner.subprocess.run", fake_run)
-
-    runner = TestRunner()
-    result = runner.run(tmp_path, suite="unit")
-
-    assert captured["command"] == ["pytest", "tests/unit"]
-    assert captured["cwd"] == tmp_path
-    assert captured["check"] is False
-    assert captured["capture_output"] is True
-    assert captured["text"] is True
-    assert captured["timeout"] is None
+def _fake_pytest(tmp_path: Path, body: str) -> TestRunner:
+    script = tmp_path / "fake_pytest.py"
+    script.write_text(
+        "import json, os, sys, time\n"
+        "print(json.dumps({'argv': sys.argv[1:], 'cwd': os.getcwd()}), flush=True)\n" + body,
+        encoding="utf-8",
+    )
+    return TestRunner(pytest_command=(sys.executable, str(script)))
+
+
+def _collecting_pytest(
+    tmp_path: Path, nodeids: list[str], body: str, *, version: str = "8.3.5"
+) -> TestRunner:
+    """Fake pytest that lists `nodeids` on collection and runs `body` with `ids` otherwise.
+
+    Before 8.2 `ids` are the positional node IDs, as pytest has no argument files.
+    """
+    script = tmp_path / "collecting_pytest.py"
+    script.write_text(
+        "import json, sys, time\n"
+        "args = sys.argv[1:]\n"
+        "if args == ['--version']:\n"
+        f"    print('pytest {version}')\n"
+        "    sys.exit(0)\n"
+        "if '--collect-only' in args:\n"
+        f"    print('\\n'.join({nodeids!r}))\n"
+        f"    print('\\n{len(nodeids)} tests collected in 0.01s')\n"
+        "    sys.exit(0)\n"
+        "argfile = next((arg[1:] for arg in args if arg.startswith('@')), None)\n"
+        "ids = (\n"
+        "    open(argfile, encoding='utf-8').read().splitlines() if argfile\n"
+        "    else [arg for arg in args if '::' in arg]\n"
+        ")\n"
+        "print(json.dumps({'argv': args, 'ids': ids}), flush=True)\n" + body,
+        encoding="utf-8",
+    )
+    return TestRunner(pytest_command=(sys.executable, str(script)))
+
+
+@pytest.mark.asyncio
+async def test_run_unit_tests_returns_results(tmp_path: Path) -> None:
+    runner = _fake_pytest(
+        tmp_path,
+        "print('================ 2 passed, 1 skipped in 0.54s ================')\n",
+    )
+
+    result = await runner.run(tmp_path, suite="unit")
+
+    invocation = json.loads(result.output.splitlines()[0])
+    assert invocation["argv"][0] == "tests/unit"
+    assert invocation["argv"][1].startswith("--junitxml=")
+    assert invocation["argv"][2:] == ["-o", "junit_family=xunit1"]
+    assert invocation["cwd"] == str(tmp_path)
+    assert result.command.endswith("fake_pytest.py tests/unit")
     assert result.returncode == 0
     assert result.passed == 2
     assert result.skipped == 1
@@ -55,81 +84,458 @@ def test_run_unit_tests_returns_results(monkeypatch, tmp_path: Path) -> None:
     assert result.timed_out is False
 
 
-def test_run_supports_specific_target_markers_and_timeout(monkeypatch, tmp_path: Path) -> None:
-    captured: dict[str, object] = {}
+@pytest.mark.asyncio
+async def test_run_supports_specific_target_markers_and_timeout(tmp_path: Path) -> None:
+    runner = _fake_pytest(tmp_path, "sys.exit(1)\n")
 
-    def fake_run(
-        command: list[str],
-        *,
-        cwd: Path,
-        check: bool,
-        capture_output: bool,
-        text: bool,
-        timeout: int | None,
-    ) -> subprocess.CompletedProcess[str]:
-        captured["command"] = command
-        captured["timeout"] = timeout
-        del cwd, check, capture_output, text
-        return subprocess.CompletedProcess(args=command, returncode=0, stdout="", stderr="")
-
-    monkeypatch.setattr("att.core.test_runner.subprocess.run", fake_run)
-
-    runner = TestRunner()
-    _ = runner.run(
+    result = await runner.run(
         tmp_path,
         suite="tests/unit/test_sample.py::test_happy_path",
         markers="slow and gpu",
         timeout_seconds=45,
     )
 
-    assert captured["command"] == [
-        "pytest",
+    invocation = json.loads(result.output.splitlines()[0])
+    assert invocation["argv"][:3] == [
         "tests/unit/test_sample.py::test_happy_path",
         "-m",
         "slow and gpu",
     ]
-    assert captured["timeout"] == 45
-
-
-def test_run_timeout_returns_timed_out_result(monkeypatch, tmp_path: Path) -> None:
-    def fake_run(
-        command: list[str],
-        *,
-        cwd: Path,
-        check: bool,
-        capture_output: bool,
-        text: bool,
-        timeout: int | None,
-    ) -> subprocess.CompletedProcess[str]:
-        del cwd, check, capture_output, text, timeout
-        raise subprocess.TimeoutExpired(
-            cmd=command,
-            timeout=5,
-            output="partial output\n",
-            stderr="timeout stderr\n",
-        )
-
-    monkeypatch.setattr("att.core.test_runner.subprocess.run", fake_run)
-
-    runner = TestRunner()
-    result = runner.run(tmp_path, suite="integration", timeout_seconds=5)
+    assert result.returncode == 1
+    assert result.timed_out is False
+
 
+@pytest.mark.asyncio
+async def test_run_timeout_returns_timed_out_result(tmp_path: Path) -> None:
+    runner = _fake_pytest(
+        tmp_path,
+        "print('partial output', flush=True)\n"
+        "print('timeout stderr', file=sys.stderr, flush=True)\n"
+        "time.sleep(30)\n",
+    )
+
+    started = time.perf_counter()
+    result = await runner.run(tmp_path, suite="integration", timeout_seconds=1)
+
+    assert time.perf_counter() - started < 10
     assert result.returncode == 124
     assert result.timed_out is True
     assert "partial output" in result.output
     assert "timeout stderr" in result.output
 
 
+@pytest.mark.asyncio
+async def test_run_cancellation_kills_process_group(tmp_path: Path) -> None:
+    pid_file = tmp_path / "child.pid"
+    runner = _fake_pytest(
+        tmp_path,
+        "import subprocess\n"
+        "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+        f"open({str(pid_file)!r}, 'w').write(str(child.pid))\n"
+        "time.sleep(30)\n",
+    )
+
+    task = asyncio.create_task(runner.run(tmp_path))
+    for _ in range(100):
+        if pid_file.exists() and pid_file.read_text():
+            break
+        await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    child_pid = int(pid_file.read_text())
+    for _ in range(100):
+        try:
+            os.kill(child_pid, 0)
+        except ProcessLookupError:
+            break
+        await asyncio.sleep(0.05)
+    else:
+        pytest.fail("grandchild process survived cancellation")
+
+
+@pytest.mark.asyncio
+async def test_run_streams_output_and_live_counts(tmp_path: Path) -> None:
+    gate = tmp_path / "gate"
+    runner = _fake_pytest(
+        tmp_path,
+        "print('tests/unit/test_a.py ..F  [ 60%]', flush=True)\n"
+        f"while not os.path.exists({str(gate)!r}):\n"
+        "    time.sleep(0.01)\n"
+        "print('tests/unit/test_b.py s.  [100%]')\n"
+        "print('===== 1 failed, 3 passed, 1 skipped in 0.20s =====')\n"
+        "sys.exit(1)\n",
+    )
+    output = TestOutputStream()
+
+    task = asyncio.create_task(runner.run(tmp_path, output=output))
+    await asyncio.wait_for(output.wait(1), timeout=10)
+
+    live = output.read(cursor=1)
+    assert live.logs == ["tests/unit/test_a.py ..F  [ 60%]"]
+    assert live.finished is False
+    assert (live.summary["passed"], live.summary["failed"]) == (2, 1)
+
+    gate.touch()
+    result = await task
+
+    final = output.read(cursor=live.cursor)
+    assert final.finished is True
+    assert final.logs[-1] == "===== 1 failed, 3 passed, 1 skipped in 0.20s ====="
+    assert final.summary["duration_seconds"] == 0.2
+    assert (final.summary["passed"], final.summary["skipped"]) == (3, 1)
+    assert result.output.splitlines() == output.read(cursor=0).logs
+
+
+@pytest.mark.asyncio
+async def test_run_reads_per_test_results_from_junit_report(tmp_path: Path) -> None:
+    tests_dir = tmp_path / "tests" / "unit"
+    tests_dir.mkdir(parents=True)
+    (tests_dir / "test_sample.py").write_text(
+        "import pytest\n"
+        "def test_ok():\n"
+        "    print('noise ' * 50)\n"
+        "def test_bad():\n"
+        "    assert 1 == 2\n"
+        "@pytest.mark.skip(reason='later')\n"
+        "def test_skipped():\n"
+        "    pass\n"
+        "class TestGroup:\n"
+        "    @pytest.mark.xfail(reason='known')\n"
+        "    def test_known(self):\n"
+        "        assert False\n"
+        "    @pytest.mark.xfail(reason='flaky')\n"
+        "    def test_lucky(self):\n"
+        "        pass\n",
+        encoding="utf-8",
+    )
+    runner = TestRunner(
+        pytest_command=(sys.executable, "-m", "pytest", "-p", "no:cacheprovider"),
+        output_tail_lines=5,
+    )
+
+    result = await runner.run(tmp_path)
+
+    assert result.returncode == 1
+    assert (result.passed, result.failed, result.skipped) == (1, 1, 1)
+    assert (result.xfailed, result.xpassed) == (1, 1)
+    assert result.duration_seconds is not None
+    outcomes = {case.nodeid: case.outcome for case in result.tests}
+    assert outcomes == {
+        "tests/unit/test_sample.py::test_ok": "passed",
+        "tests/unit/test_sample.py::test_bad": "failed",
+        "tests/unit/test_sample.py::test_skipped": "skipped",
+        "tests/unit/test_sample.py::TestGroup::test_known": "xfailed",
+        # xunit1 cannot mark an XPASS; only the counts above are corrected.
+        "tests/unit/test_sample.py::TestGroup::test_lucky": "passed",
+    }
+    assert len(result.output.splitlines()) == 5
+    assert result.output_start_cursor > 0
+    assert "1 failed" in result.output.splitlines()[-1]
+
+
+@pytest.mark.asyncio
+async def test_run_takes_xfail_counts_from_console_without_junit_report(tmp_path: Path) -> None:
+    runner = _fake_pytest(
+        tmp_path,
+        "print('======= 2 passed, 1 xfailed, 1 xpassed in 0.20s =======')\n",
+    )
+
+    result = await runner.run(tmp_path)
+
+    assert (result.passed, result.xfailed, result.xpassed) == (2, 1, 1)
+    assert result.tests == []
+
+
+@pytest.mark.asyncio
+async def test_run_keeps_full_output_by_default(tmp_path: Path) -> None:
+    runner = _fake_pytest(tmp_path, "print('\\n'.join(f'line {n}' for n in range(3000)))\n")
+
+    result = await runner.run(tmp_path)
+
+    lines = result.output.splitlines()
+    assert len(lines) == 3001
+    assert (lines[1], lines[-1]) == ("line 0", "line 2999")
+    assert result.output_start_cursor == 0
+
+
+@pytest.mark.asyncio
+async def test_run_shards_collected_tests_and_merges_reports(tmp_path: Path) -> None:
+    tests_dir = tmp_path / "tests" / "unit"
+    tests_dir.mkdir(parents=True)
+    (tests_dir / "test_one.py").write_text(
+        "import os\n"
+        "def test_a():\n"
+        "    print('pid', os.getpid())\n"
+        "def test_b():\n"
+        "    assert 1 == 2\n",
+        encoding="utf-8",
+    )
+    (tests_dir / "test_two.py").write_text(
+        "import pytest\n"
+        "def test_c():\n"
+        "    pass\n"
+        "@pytest.mark.skip(reason='later')\n"
+        "def test_d():\n"
+        "    pass\n"
+        "@pytest.mark.xfail(reason='flaky')\n"
+        "def test_e():\n"
+        "    pass\n",
+        encoding="utf-8",
+    )
+    runner = TestRunner(
+        pytest_command=(sys.executable, "-m", "pytest", "-p", "no:cacheprovider"),
+    )
+    output = TestOutputStream()
+
+    result = await runner.run(tmp_path, shards=2, output=output, durations={})
+
+    assert result.command.endswith("(2 shards)")
+    assert result.returncode == 1
+    assert (result.passed, result.failed, result.skipped, result.xpassed) == (2, 1, 1, 1)
+    assert sorted(case.nodeid for case in result.tests) == [
+        "tests/unit/test_one.py::test_a",
+        "tests/unit/test_one.py::test_b",
+        "tests/unit/test_two.py::test_c",
+        "tests/unit/test_two.py::test_d",
+        "tests/unit/test_two.py::test_e",
+    ]
+    assert sum("passed" in line or "failed" in line for line in output.read().logs) >= 2
+
+
+@pytest.mark.asyncio
+async def test_run_fail_fast_runs_priority_tests_first_and_stops(tmp_path: Path) -> None:
+    tests_dir = tmp_path / "tests" / "unit"
+    tests_dir.mkdir(parents=True)
+    (tests_dir / "test_sample.py").write_text(
+        "def test_a():\n    pass\ndef test_b():\n    assert False\ndef test_c():\n    pass\n",
+        encoding="utf-8",
+    )
+    runner = TestRunner(
+        pytest_command=(sys.executable, "-m", "pytest", "-p", "no:cacheprovider"),
+    )
+
+    result = await runner.run(
+        tmp_path,
+        fail_fast=True,
+        first=["tests/unit/test_sample.py::test_b"],
+    )
+
+    assert result.returncode == 1
+    assert result.stopped_early is True
+    assert [case.nodeid for case in result.tests] == ["tests/unit/test_sample.py::test_b"]
+    assert (result.passed, result.failed) == (0, 1)
+    assert result.command.endswith("tests/unit -x")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("failing", "stopped_early"), [("test_a", True), ("test_c", False)], ids=["first", "last"]
+)
+async def test_run_fail_fast_reports_stopped_early_only_when_tests_were_skipped(
+    tmp_path: Path, failing: str, stopped_early: bool
+) -> None:
+    tests_dir = tmp_path / "tests" / "unit"
+    tests_dir.mkdir(parents=True)
+    (tests_dir / "test_sample.py").write_text(
+        "".join(
+            f"def {name}():\n    assert {name != failing}\n"
+            for name in ("test_a", "test_b", "test_c")
+        ),
+        encoding="utf-8",
+    )
+    runner = TestRunner(
+        pytest_command=(sys.executable, "-m", "pytest", "-p", "no:cacheprovider"),
+    )
+
+    result = await runner.run(tmp_path, fail_fast=True)
+
+    assert (result.returncode, result.failed) == (1, 1)
+    assert result.stopped_early is stopped_early
+
+
+@pytest.mark.asyncio
+async def test_run_fail_fast_without_a_collected_count_is_not_stopped_early(
+    tmp_path: Path,
+) -> None:
+    runner = _fake_pytest(tmp_path, "print('=== 1 failed, 1 passed in 0.10s ===')\nsys.exit(1)\n")
+
+    result = await runner.run(tmp_path, fail_fast=True)
+
+    assert result.failed == 1
+    assert result.stopped_early is False
+
+
+@pytest.mark.asyncio
+async def test_run_shards_pass_node_ids_through_argfiles(tmp_path: Path) -> None:
+    nodeids = [f"tests/unit/test_many.py::test_case[{index} x]" for index in range(6)]
+    runner = _collecting_pytest(tmp_path, nodeids, "")
+
+    result = await runner.run(tmp_path, shards=2, durations={})
+
+    invocations = [json.loads(line) for line in result.output.splitlines()]
+    assert sorted(nodeid for call in invocations for nodeid in call["ids"]) == sorted(nodeids)
+    assert all(not any("::" in arg for arg in call["argv"]) for call in invocations)
+    assert result.command.endswith("(2 shards)")
+
+
+@pytest.mark.asyncio
+async def test_run_shards_pass_node_ids_positionally_before_pytest_8_2(tmp_path: Path) -> None:
+    nodeids = [f"tests/unit/test_many.py::test_case[{index}]" for index in range(4)]
+    runner = _collecting_pytest(tmp_path, nodeids, "", version="8.1.1")
+
+    result = await runner.run(tmp_path, shards=2, durations={})
+
+    invocations = [json.loads(line) for line in result.output.splitlines()]
+    assert len(invocations) == 2
+    assert all(not any(arg.startswith("@") for arg in call["argv"]) for call in invocations)
+    assert sorted(nodeid for call in invocations for nodeid in call["ids"]) == nodeids
+    assert result.command.endswith("(2 shards)")
+
+
+@pytest.mark.asyncio
+async def test_run_without_argfiles_runs_unsharded_when_node_ids_do_not_fit(
+    tmp_path: Path,
+) -> None:
+    nodeids = [f"tests/unit/test_many.py::test_case[{'x' * 100}-{index}]" for index in range(400)]
+    runner = _collecting_pytest(tmp_path, nodeids, "", version="7.4.4")
+
+    result = await runner.run(tmp_path, shards=2, durations={})
+
+    invocations = [json.loads(line) for line in result.output.splitlines()]
+    assert [call["ids"] for call in invocations] == [[]]
+    assert invocations[0]["argv"][0] == "tests/unit"
+    assert not result.command.endswith("shards)")
+
+
+@pytest.mark.asyncio
+async def test_run_collects_node_ids_despite_quiet_addopts(tmp_path: Path) -> None:
+    tests_dir = tmp_path / "tests" / "unit"
+    tests_dir.mkdir(parents=True)
+    (tests_dir / "test_one.py").write_text(
+        "def test_a():\n    pass\ndef test_b():\n    pass\n", encoding="utf-8"
+    )
+    (tmp_path / "pytest.ini").write_text("[pytest]\naddopts = -q\n", encoding="utf-8")
+    runner = TestRunner(
+        pytest_command=(sys.executable, "-m", "pytest", "-p", "no:cacheprovider"),
+    )
+
+    result = await runner.run(tmp_path, shards=2, durations={})
+
+    assert result.command.endswith("(2 shards)")
+    assert (result.returncode, result.passed) == (0, 2)
+
+
+@pytest.mark.asyncio
+async def test_run_fail_fast_stops_sibling_shards(tmp_path: Path) -> None:
+    runner = _collecting_pytest(
+        tmp_path,
+        ["tests/unit/test_a.py::test_broken", "tests/unit/test_b.py::test_slow"],
+        "if 'tests/unit/test_a.py::test_broken' in ids:\n    sys.exit(1)\ntime.sleep(30)\n",
+    )
+
+    started = time.monotonic()
+    result = await runner.run(tmp_path, shards=2, durations={}, fail_fast=True)
+
+    assert time.monotonic() - started < 15
+    assert result.returncode == 1
+    assert result.timed_out is False
+
+
+@pytest.mark.asyncio
+async def test_run_passes_prioritized_node_ids_through_an_argfile(tmp_path: Path) -> None:
+    nodeids = ["tests/unit/test_a.py::test_one", "tests/unit/test_b.py::test_two"]
+    runner = _collecting_pytest(tmp_path, nodeids, "")
+
+    result = await runner.run(tmp_path, first=["tests/unit/test_b.py"])
+
+    invocation = json.loads(result.output.splitlines()[0])
+    assert invocation["ids"] == [nodeids[1], nodeids[0]]
+    assert not any("::" in arg for arg in invocation["argv"])
+
+
+def test_parse_pytest_version_reads_old_and_new_formats() -> None:
+    assert parse_pytest_version("pytest 8.3.5\n") == (8, 3)
+    assert parse_pytest_version("This is pytest version 6.2.5, imported from x\n") == (6, 2)
+    assert parse_pytest_version("error: unrecognized arguments") is None
+
+
+def test_parse_pytest_collection_requires_the_reported_count() -> None:
+    listing = "a.py::t1\na.py::t2[x y]\n\n2/3 tests collected (1 deselected) in 0.01s\n"
+
+    assert parse_pytest_collection(listing) == ["a.py::t1", "a.py::t2[x y]"]
+    assert parse_pytest_collection("a.py::t1\n\n2 tests collected in 0.01s\n") == []
+    assert parse_pytest_collection("a.py: 2\n\n2 tests collected in 0.01s\n") == []
+    assert parse_pytest_collection("a.py::t1\n") == []
+
+
+def test_prioritize_test_ids_accepts_node_ids_and_files() -> None:
+    nodeids = ["a.py::t1", "a.py::t2", "b.py::t3", "c.py::t4"]
+
+    assert prioritize_test_ids(nodeids, ["c.py", "a.py::t2", "c.py::t4"]) == [
+        "c.py::t4",
+        "a.py::t2",
+        "a.py::t1",
+        "b.py::t3",
+    ]
+
+
+def test_shard_test_ids_balances_by_duration_and_keeps_order() -> None:
+    nodeids = ["t::a", "t::b", "t::c", "t::d", "t::e"]
+    durations = {"t::a": 1.0, "t::b": 8.0, "t::c": 3.0, "t::d": 4.0}
+
+    shards = shard_test_ids(nodeids, 2, durations)
+
+    # e has no history and counts as the 4.0s mean.
+    assert shards == [["t::b", "t::c"], ["t::a", "t::d", "t::e"]]
+    assert shard_test_ids(nodeids[:1], 4, {}) == [["t::a"]]
+
+
+def test_output_stream_reads_by_cursor_and_counts_progress_styles() -> None:
+    output = TestOutputStream(max_lines=3)
+    for line in (
+        "..sx [ 40%]",
+        "tests/test_a.py::test_one PASSED                [ 60%]",
+        "tests/test_a.py::test_two[a b] ERROR            [ 80%]",
+        "FAILED tests/test_a.py::test_two - boom",
+    ):
+        output.append(line)
+
+    summary = output.summary()
+    assert (summary["passed"], summary["skipped"], summary["xfailed"]) == (3, 1, 1)
+    assert summary["errors"] == 1
+    assert summary["failed"] == 0
+
+    tail = output.read(limit=2)
+    assert (tail.start_cursor, tail.cursor, tail.end_cursor) == (2, 4, 4)
+    resumed = output.read(cursor=0, limit=1)
+    assert resumed.truncated is True
+    assert resumed.start_cursor == 1
+    assert resumed.has_more is True
+    assert TestOutputStream.from_output("a\nb\n").read(cursor=1).logs == ["b"]
+
+
+def test_output_stream_reads_the_selected_count_from_the_header() -> None:
+    assert TestOutputStream.from_output("collected 3 items\n").collected == 3
+    deselected = TestOutputStream.from_output("collected 5 items / 2 deselected / 3 selected\n")
+    assert deselected.collected == 3
+    assert TestOutputStream.from_output("collecting ... collected 1 item\n").collected == 1
+    assert TestOutputStream.from_output("... [100%]\n").collected is None
+
+
 def test_parse_pytest_output_summary() -> None:
     summary = parse_pytest_output_summary(
         """
 ==================== short test summary info ====================
 FAILED tests/test_a.py::test_nope - assert 1 == 2
-================ 1 failed, 3 passed, 2 skipped, 1 error in 2.15s ================
+================ 1 failed, 3 passed, 2 skipped, 1 error, 1 xfailed, 2 xpassed in 2.15s =====
         """.strip()
     )
     assert summary["failed"] == 1
     assert summary["passed"] == 3
+    assert summary["xfailed"] == 1
+    assert summary["xpassed"] == 2
     assert summary["skipped"] == 2
     assert summary["errors"] == 1
     assert summary["duration_seconds"] == 2.15
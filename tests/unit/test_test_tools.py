@@ -43,3 +43,13 @@ def test_parse_test_run_with_markers_and_timeout() -> None:
 def test_parse_test_timeout_must_be_positive_int() -> None:
     with pytest.raises(ValueError, match="timeout_seconds must be a positive integer"):
         parse_test_tool_call("att.test.run", {"project_id": "p1", "timeout_seconds": 0})
+
+
+def test_parse_test_status_requires_run_id() -> None:
+    call = parse_test_tool_call("att.test.status", {"project_id": "p1", "run_id": "r1"})
+    assert call is not None
+    assert call.operation == "status"
+    assert call.run_id == "r1"
+
+    with pytest.raises(ValueError, match="run_id is required"):
+        parse_test_tool_call("att.test.status", {"project_id": "p1"})
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Sequence
 from pathlib import Path
 
 import pytest
@@ -10,32 +12,62 @@ from att.core.test_runner import RunResult
 from att.core.tool_orchestrator import ToolOrchestrator
 from att.db.store import SQLiteStore
 from att.models.events import EventType
+from att.models.test_run import TestCaseResult, TestRun, TestRunStatus
 
 
 class FakeGitManager:
     def __init__(self) -> None:
         self.commit_messages: list[str] = []
 
-    def commit(self, project_path: Path, message: str) -> GitResult:
+    async def commit(self, project_path: Path, message: str) -> GitResult:
         self.commit_messages.append(message)
         return GitResult(command="git commit", output=f"committed:{message}")
 
-    def status(self, project_path: Path) -> GitResult:
+    async def status(self, project_path: Path) -> GitResult:
         return GitResult(command="git status --short", output="M file")
 
 
 class FakeTestRunner:
     def __init__(self, returncode: int) -> None:
         self.returncode = returncode
-
-    def run(self, project_path: Path, suite: str = "unit") -> RunResult:
+        self.paths: list[str] | None = None
+        self.first: list[str] = []
+        self.tests: list[TestCaseResult] = []
+
+    async def run(
+        self,
+        project_path: Path,
+        suite: str = "unit",
+        paths: list[str] | None = None,
+        fail_fast: bool = False,
+        first: Sequence[str] = (),
+    ) -> RunResult:
+        self.paths = paths
+        self.first = list(first)
         return RunResult(
             command=f"pytest tests/{suite}",
             returncode=self.returncode,
             output=f"suite={suite}",
+            failed=sum(case.outcome == "failed" for case in self.tests),
+            stopped_early=fail_fast and self.returncode != 0,
+            tests=self.tests,
         )
 
 
+class ThreadRecordingCodeManager(CodeManager):
+    def __init__(self) -> None:
+        super().__init__()
+        self.write_threads: list[int] = []
+
+    def write_file(self, project_path: Path, rel_path: str, content: str) -> None:
+        self.write_threads.append(threading.get_ident())
+        super().write_file(project_path, rel_path, content)
+
+
+def _failed_case(nodeid: str) -> TestCaseResult:
+    return TestCaseResult(nodeid=nodeid, outcome="failed", duration_seconds=1.0)
+
+
 @pytest.mark.asyncio
 async def test_workflow_records_pass_events_and_optional_commit(tmp_path: Path) -> None:
     project_path = tmp_path / "project"
@@ -102,3 +134,121 @@ async def test_workflow_skips_commit_when_tests_fail(tmp_path: Path) -> None:
         EventType.TEST_RUN,
         EventType.TEST_FAILED,
     ]
+
+
+@pytest.mark.asyncio
+async def test_workflow_affected_selection_runs_importing_tests(tmp_path: Path) -> None:
+    project_path = tmp_path / "project"
+    (project_path / "tests" / "unit").mkdir(parents=True)
+    (project_path / "app.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (project_path / "util.py").write_text("", encoding="utf-8")
+    (project_path / "tests/unit/test_app.py").write_text("import app\n", encoding="utf-8")
+    (project_path / "tests/unit/test_util.py").write_text("import util\n", encoding="utf-8")
+
+    tests = FakeTestRunner(returncode=0)
+    orchestrator = ToolOrchestrator(CodeManager(), FakeGitManager(), tests)
+
+    result = await orchestrator.run_change_workflow(
+        project_id="p1",
+        project_path=project_path,
+        rel_path="app.py",
+        new_content="VALUE = 2\n",
+        test_selection="affected",
+    )
+    assert result.selected_tests == ["tests/unit/test_app.py"]
+    assert tests.paths == ["tests/unit/test_app.py"]
+    assert result.events[1].payload == {
+        "suite": "unit",
+        "selection": "affected",
+        "selected_tests": 1,
+        "fail_fast": False,
+    }
+
+    (project_path / "orphan.py").write_text("", encoding="utf-8")
+    fallback = await orchestrator.run_change_workflow(
+        project_id="p1",
+        project_path=project_path,
+        rel_path="orphan.py",
+        new_content="VALUE = 3\n",
+        test_selection="affected",
+    )
+    assert fallback.selected_tests == []
+    assert tests.paths is None
+    assert fallback.events[1].payload["selection"] == "suite"
+
+
+@pytest.mark.asyncio
+async def test_workflow_fail_fast_runs_failing_and_affected_tests_first(tmp_path: Path) -> None:
+    project_path = tmp_path / "project"
+    (project_path / "tests" / "unit").mkdir(parents=True)
+    (project_path / "app.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (project_path / "tests/unit/test_app.py").write_text("import app\n", encoding="utf-8")
+
+    store = SQLiteStore(tmp_path / "att.db")
+    queued = TestRun(project_id="p1", status=TestRunStatus.FAILED)
+    await store.upsert_test_run(queued)
+    await store.replace_test_case_results(
+        queued.id,
+        "p1",
+        [_failed_case("tests/unit/test_db.py::test_x")],
+    )
+    tests = FakeTestRunner(returncode=1)
+    tests.tests = [_failed_case("tests/unit/test_app.py::test_y")]
+    orchestrator = ToolOrchestrator(CodeManager(), FakeGitManager(), tests, store)
+
+    result = await orchestrator.run_change_workflow(
+        project_id="p1",
+        project_path=project_path,
+        rel_path="app.py",
+        new_content="VALUE = 2\n",
+        commit_message="feat: no",
+        fail_fast=True,
+    )
+
+    assert tests.first == ["tests/unit/test_db.py::test_x", "tests/unit/test_app.py"]
+    assert tests.paths is None
+    assert result.committed is False
+    assert result.test_result.stopped_early is True
+    assert result.events[-1].event_type == EventType.TEST_FAILED
+    assert result.events[-1].payload["stopped_early"] is True
+    assert result.events[-1].payload["failed"] == 1
+
+    runs = await store.list_test_runs("p1")
+    workflow_run = next(run for run in runs if run.id != queued.id)
+    assert workflow_run.status is TestRunStatus.FAILED
+    assert workflow_run.result is not None
+    assert workflow_run.result["stopped_early"] is True
+    assert await store.list_test_case_results(workflow_run.id) == tests.tests
+
+    # The failures come from the store, so a fresh orchestrator sees them too.
+    restarted = ToolOrchestrator(CodeManager(), FakeGitManager(), tests, store)
+    await restarted.run_change_workflow(
+        project_id="p1",
+        project_path=project_path,
+        rel_path="app.py",
+        new_content="VALUE = 3\n",
+        fail_fast=True,
+    )
+    assert tests.first[0] == "tests/unit/test_app.py::test_y"
+    assert len(await store.list_test_runs("p1")) == 3
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_workflow_writes_the_file_off_the_event_loop(tmp_path: Path) -> None:
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    (project_path / "app.py").write_text("VALUE = 1\n", encoding="utf-8")
+    code = ThreadRecordingCodeManager()
+    orchestrator = ToolOrchestrator(code, FakeGitManager(), FakeTestRunner(returncode=0))
+
+    await orchestrator.run_change_workflow(
+        project_id="p1",
+        project_path=project_path,
+        rel_path="app.py",
+        new_content="VALUE = 2\n",
+    )
+
+    assert (project_path / "app.py").read_text(encoding="utf-8") == "VALUE = 2\n"
+    assert code.write_threads
+    assert threading.get_ident() not in code.write_threads